@@ -0,0 +1,78 @@
+"""
+Serial vs process-pool throughput for run_batch (the /validate-batch engine).
+
+Usage: python benchmarks/bench_batch.py [--sizes 1000,10000,100000]
+                                        [--workers 4] [--chunk-size 500]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+
+
+def build_numbers(size: int, seed: int = 7):
+    """Distinct synthetic numbers: mostly Indian mobiles, some US and UK, some junk"""
+    rng = random.Random(seed)
+    numbers = set()
+    while len(numbers) < size:
+        kind = rng.random()
+        if kind < 0.6:
+            numbers.add(f"+91{rng.choice('6789')}{rng.randrange(10 ** 9):09d}")
+        elif kind < 0.75:
+            numbers.add(f"{rng.choice('6789')}{rng.randrange(10 ** 9):09d}")
+        elif kind < 0.85:
+            numbers.add(f"+1 415 {rng.randrange(200, 999)} {rng.randrange(10 ** 4):04d}")
+        elif kind < 0.95:
+            numbers.add(f"+44 20 {rng.randrange(10 ** 4):04d} {rng.randrange(10 ** 4):04d}")
+        else:
+            numbers.add(f"{rng.randrange(10 ** 6)}x")
+    return list(numbers)
+
+
+def timed(func):
+    start = time.perf_counter()
+    results = func()
+    return time.perf_counter() - start, results
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--chunk-size", type=int, default=main.BATCH_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    # Measure raw validation work, not cache hits
+    main.validation_cache.max_size = 0
+
+    executor = ProcessPoolExecutor(
+        max_workers=args.workers,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+    # Pay worker start-up before timing
+    list(executor.map(main.validate_chunk, [["+919876543210"]] * args.workers,
+                      ["IN"] * args.workers, ["IN"] * args.workers))
+
+    print(f"workers={args.workers} chunk_size={args.chunk_size}")
+    for size in [int(s) for s in args.sizes.split(",")]:
+        numbers = build_numbers(size)
+        serial_time, serial_results = timed(lambda: main.run_batch(numbers, "IN", "IN"))
+        pooled_time, pooled_results = timed(lambda: main.run_batch(
+            numbers, "IN", "IN", executor=executor, chunk_size=args.chunk_size))
+        assert main.summarize_batch(serial_results) == main.summarize_batch(pooled_results)
+        print(f"{size:>7} numbers: serial {size / serial_time:8.0f}/s ({serial_time:.2f}s), "
+              f"pooled {size / pooled_time:8.0f}/s ({pooled_time:.2f}s), "
+              f"speedup {serial_time / pooled_time:.1f}x")
+
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    main_cli()
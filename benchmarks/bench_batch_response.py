@@ -0,0 +1,104 @@
+"""
+Time and allocations to build a /validate-batch response for a 10k-number
+batch: run_batch alone (objects held per result) and the whole request
+through to the rendered body (time and peak traced memory), with the
+validation cache cold and warm. Body digests make it easy to check that a
+change to result handling leaves the response bytes unchanged.
+
+Usage: python benchmarks/bench_batch_response.py [--size 10000] [--repeat 3]
+"""
+import argparse
+import gc
+import hashlib
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.responses import JSONResponse
+
+import main
+from bench_batch import build_numbers
+
+AT = datetime(2024, 6, 5, 9, 30)
+
+
+def traced(func):
+    """(value, live blocks, live bytes, peak bytes) allocated while running func"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    value = func()
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    diff = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in diff)
+    size = sum(stat.size_diff for stat in diff)
+    return value, blocks, size, peak
+
+
+def best_of(func, repeat: int, reset=None):
+    best = float("inf")
+    for _ in range(repeat):
+        if reset:
+            reset()
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # Sorted so runs hash the same body; some spellings repeat so the
+    # duplicate fan-out path is exercised too
+    numbers = sorted(build_numbers(args.size))
+    numbers = numbers[:args.size * 9 // 10] + [number.replace(" ", "-") for number in numbers[:args.size // 10]]
+    main.validation_cache = main.ValidationCache(max(main.VALIDATION_CACHE_MAX_SIZE, 2 * args.size),
+                                                 main.VALIDATION_CACHE_TTL)
+    requests = {
+        "full": main.BatchPhoneRequest(numbers=numbers, at=AT),
+        "fields": main.BatchPhoneRequest(numbers=numbers, at=AT,
+                                         fields=["input", "formatted_e164", "valid", "type", "is_business_hours"]),
+        "dictionary": main.BatchPhoneRequest(numbers=numbers, at=AT, dictionary=True),
+    }
+
+    def render(name, response_class=main.FastJSONResponse):
+        data = requests[name]
+        return main.validate_batch_request(data, main.requested_stages(data.fields), response_class).body
+
+    main.run_batch(numbers[:100], "IN", "IN")  # load metadata before timing
+    print(f"{len(numbers)} numbers ({len(set(numbers))} distinct spellings)")
+    for cache in ("cold", "warm"):
+        reset = main.validation_cache.clear if cache == "cold" else None
+        if cache == "warm":
+            render("full")
+
+        if reset:
+            reset()
+        _, blocks, size, _ = traced(lambda: main.run_batch(numbers, "IN", "IN", at=AT))
+        seconds = best_of(lambda: main.run_batch(numbers, "IN", "IN", at=AT), args.repeat, reset)
+        print(f"  {cache} run_batch          {seconds * 1000:7.1f} ms  "
+              f"{blocks:8d} blocks {size / 1024 ** 2:6.1f} MB held by results")
+
+        if reset:
+            reset()
+        _, _, _, peak = traced(lambda: render("full"))
+        seconds = best_of(lambda: render("full"), args.repeat, reset)
+        print(f"  {cache} /validate-batch    {seconds * 1000:7.1f} ms  peak {peak / 1024 ** 2:6.1f} MB")
+
+    for name in requests:
+        print(f"  body sha256 [{name}]: {hashlib.sha256(render(name)).hexdigest()[:16]}")
+    print(f"  body sha256 [stdlib json]: {hashlib.sha256(render('full', JSONResponse)).hexdigest()[:16]}")
+
+
+if __name__ == "__main__":
+    main_cli()
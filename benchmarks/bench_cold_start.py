@@ -0,0 +1,56 @@
+"""
+Cold-start cost of the lazy and eager warm-up modes.
+
+Each mode runs in a fresh interpreter and reports import time of main, the
+warm-up time (eager only) and the latency of the first validation of numbers
+from several regions, i.e. what the first requests after a dyno boot pay.
+
+Usage: python benchmarks/bench_cold_start.py
+"""
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r"""
+import json, os, sys, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter() - started
+warmup = None
+if main.WARMUP_MODE == "eager":
+    main.warm_up(main.WARMUP_REGIONS)
+    warmup = main.warmup_state["seconds"]
+main.validation_cache.max_size = 0
+first = {}
+for number in ["+919876543210", "9876543210", "+14155552671", "+442071838750",
+               "+8613800138000", "+5511987654321", "+971501234567", "+61293744000"]:
+    t = time.perf_counter()
+    main.validate_number(number)
+    first[number] = round((time.perf_counter() - t) * 1000, 2)
+print(json.dumps({"import_s": round(imported, 3), "warmup_s": warmup, "first_request_ms": first}))
+"""
+
+
+def run(mode: str):
+    env = dict(os.environ, WARMUP_MODE=mode, METRICS_ENABLED="0")
+    output = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    for mode in ("lazy", "eager"):
+        result = run(mode)
+        first = result["first_request_ms"]
+        warmup = "n/a" if result["warmup_s"] is None else f"{result['warmup_s']:.3f}s"
+        print(f"{mode:>5}: import {result['import_s']:.3f}s, warm-up {warmup}, "
+              f"first requests total {sum(first.values()):.1f} ms, max {max(first.values()):.1f} ms")
+        for number, ms in first.items():
+            print(f"         {number:<16} {ms:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Throughput (MB/s) of phone number extraction on multi-megabyte synthetic
+text: extract_numbers (pre-scan + matcher + full validation), the scan alone
+(NumberExtractor), and phonenumbers.PhoneNumberMatcher over the whole text.
+Also checks the scan finds exactly what the whole-text matcher finds.
+
+Corpora: "transcript" has a phone number every ~40 words plus order numbers,
+dates and amounts; "email" is mostly prose with a number every ~400 words.
+
+Usage: python benchmarks/bench_extract.py [--megabytes 4] [--chunk-kb 64]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import phonenumbers
+
+import main
+
+WORDS = ("the customer said please call back on about order invoice ticket number was "
+         "agent transferred to billing department reference amount due total of "
+         "ok thanks bye regards sent from my phone meeting tomorrow attached").split()
+
+
+def build_text(size_bytes: int, phone_rate: float, numeric_rate: float, seed: int = 5):
+    rng = random.Random(seed)
+    parts = []
+    size = 0
+    while size < size_bytes:
+        kind = rng.random()
+        if kind < phone_rate:
+            token = rng.choice([
+                f"+91 {rng.choice('6789')}{rng.randrange(10 ** 4):04d} {rng.randrange(10 ** 5):05d}",
+                f"0{rng.choice('6789')}{rng.randrange(10 ** 9):09d}",
+                f"+1 ({rng.randrange(201, 999)}) {rng.randrange(200, 999)}-{rng.randrange(10 ** 4):04d}",
+                f"+44 20 {rng.randrange(10 ** 4):04d} {rng.randrange(10 ** 4):04d}",
+            ])
+        elif kind < phone_rate + numeric_rate:
+            token = rng.choice([f"#{rng.randrange(10 ** 6)}", f"{rng.randrange(1, 28)}/{rng.randrange(1, 12)}/2024",
+                                f"Rs.{rng.randrange(10 ** 5)}.00", f"{rng.randrange(10 ** 3)}", "2024"])
+        else:
+            token = rng.choice(WORDS)
+        token += "\n" if rng.random() < 0.05 else " "
+        parts.append(token)
+        size += len(token)
+    return "".join(parts)
+
+
+CORPORA = {"transcript": (0.025, 0.035), "email": (0.0025, 0.01)}
+
+
+def chunked(text: str, chunk_chars: int):
+    for start in range(0, len(text), chunk_chars):
+        yield text[start:start + chunk_chars]
+
+
+def timed(func):
+    started = time.perf_counter()
+    value = func()
+    return time.perf_counter() - started, value
+
+
+def scan_only(text: str, chunk_chars: int):
+    extractor = main.NumberExtractor("IN")
+    found = []
+    for chunk in chunked(text, chunk_chars):
+        found.extend(extractor.feed(chunk))
+    found.extend(extractor.finish())
+    return found
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--megabytes", type=float, default=4)
+    parser.add_argument("--chunk-kb", type=int, default=64)
+    args = parser.parse_args()
+    chunk_chars = args.chunk_kb * 1024
+    list(main.extract_numbers(["+919876543210"]))  # load metadata before timing
+
+    for name, (phone_rate, numeric_rate) in CORPORA.items():
+        text = build_text(int(args.megabytes * 1024 ** 2), phone_rate, numeric_rate)
+        megabytes = len(text.encode("utf-8")) / 1024 ** 2
+        main.validation_cache.clear()
+
+        extract_time, results = timed(lambda: list(main.extract_numbers(chunked(text, chunk_chars))))
+        scan_time, found = timed(lambda: scan_only(text, chunk_chars))
+        matcher_time, matched = timed(lambda: [
+            (match.start, match.raw_string)
+            for match in phonenumbers.PhoneNumberMatcher(text, "IN", leniency=phonenumbers.Leniency.VALID)
+        ])
+        assert found == matched, f"{name}: pre-scan and whole-text matcher disagree"
+
+        print(f"{name}: {megabytes:.1f} MB, {len(results)} numbers")
+        print(f"  extract_numbers (validated)   {megabytes / extract_time:6.2f} MB/s")
+        print(f"  pre-scan + matcher            {megabytes / scan_time:6.2f} MB/s")
+        print(f"  matcher on whole text         {megabytes / matcher_time:6.2f} MB/s  (same matches)")
+
+
+if __name__ == "__main__":
+    main_cli()
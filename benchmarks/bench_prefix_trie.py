@@ -0,0 +1,117 @@
+"""
+Memory footprint and per-lookup latency of the compiled prefix tries
+(prefix_trie.py) versus phonenumbers' geocoder and carrier modules.
+
+Each engine is measured in a fresh process: RSS before and after its first
+lookup, then the mean time of description_for_number / name_for_number over
+valid numbers drawn from the geocoding data.
+
+Usage: python benchmarks/bench_prefix_trie.py [--dir /tmp/prefix_tries] [--numbers 5000]
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import phonenumbers
+
+
+def rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def build_numbers(count: int, seed: int = 3):
+    """Valid numbers spread over the calling codes the geocoder knows about"""
+    rng = random.Random(seed)
+    regions = sorted(phonenumbers.SUPPORTED_REGIONS)
+    numbers = []
+    while len(numbers) < count:
+        region = rng.choice(regions)
+        example = phonenumbers.example_number_for_type(
+            region, rng.choice([phonenumbers.PhoneNumberType.MOBILE, phonenumbers.PhoneNumberType.FIXED_LINE]))
+        if example is None:
+            continue
+        nsn = phonenumbers.national_significant_number(example)
+        keep = max(len(nsn) - 3, 1)
+        candidate = phonenumbers.parse(f"+{example.country_code}{nsn[:keep]}{rng.randrange(10 ** (len(nsn) - keep)):0{len(nsn) - keep}d}")
+        if phonenumbers.is_valid_number(candidate):
+            numbers.append(candidate)
+    return numbers
+
+
+def measure(engine: str, directory: str, count: int):
+    numbers = build_numbers(count)
+    types = [phonenumbers.number_type(number) for number in numbers]
+    before = rss_mb()
+    started = time.perf_counter()
+    if engine == "stock":
+        from phonenumbers import carrier, geocoder
+        describe = lambda number, _: geocoder.description_for_number(number, "en")
+        name = lambda number, _: carrier.name_for_number(number, "en")
+    else:
+        import prefix_trie
+        lookups = prefix_trie.CompiledLookups(directory, "en")
+        describe, name = lookups.description_for_number, lookups.name_for_number
+    describe(numbers[0], types[0])
+    name(numbers[0], types[0])
+    load_seconds = time.perf_counter() - started
+    after = rss_mb()
+
+    timings = {}
+    for label, func, with_type in (("geocode", describe, False), ("carrier", name, False),
+                                   ("geocode_typed", describe, True), ("carrier_typed", name, True)):
+        if engine == "stock" and with_type:
+            continue
+        started = time.perf_counter()
+        for number, num_type in zip(numbers, types):
+            func(number, num_type if with_type else None)
+        timings[label] = (time.perf_counter() - started) / len(numbers) * 1e6
+    output = [(describe(number, None), name(number, None)) for number in numbers]
+    return {"load_seconds": load_seconds, "rss_before_mb": before, "rss_after_mb": after,
+            "us_per_lookup": timings, "output": output}
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dir", default="/tmp/prefix_tries")
+    parser.add_argument("--numbers", type=int, default=5000)
+    parser.add_argument("--engine", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.engine:
+        json.dump(measure(args.engine, args.dir, args.numbers), sys.stdout)
+        return
+
+    import prefix_trie
+    if not prefix_trie.is_current(args.dir, "en"):
+        prefix_trie.build_all(args.dir, ["en"])
+    sizes = {dataset: os.path.getsize(prefix_trie.trie_path(args.dir, dataset, "en")) / 1024 ** 2
+             for dataset in prefix_trie.DATASETS}
+    print(f"trie files: geocode {sizes['geocode']:.1f} MB, carrier {sizes['carrier']:.1f} MB")
+
+    reports = {}
+    for engine in ("stock", "compiled"):
+        completed = subprocess.run(
+            [sys.executable, __file__, "--engine", engine, "--dir", args.dir, "--numbers", str(args.numbers)],
+            check=True, capture_output=True, text=True
+        )
+        reports[engine] = report = json.loads(completed.stdout)
+        timings = ", ".join(f"{label} {us:.1f}us" for label, us in report["us_per_lookup"].items())
+        print(f"{engine:>8}: load {report['load_seconds']:.2f}s, "
+              f"RSS +{report['rss_after_mb'] - report['rss_before_mb']:.1f} MB; {timings}")
+    assert reports["stock"]["output"] == reports["compiled"]["output"], "compiled lookups differ from stock"
+    print(f"identical results for {args.numbers} numbers")
+
+
+if __name__ == "__main__":
+    main_cli()
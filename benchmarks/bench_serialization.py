@@ -0,0 +1,61 @@
+"""
+Serialization time and payload size of a /validate-batch response in each
+supported format: stdlib JSON (Starlette's JSONResponse), orjson and
+MessagePack, each plain and dictionary-encoded. Formats whose optional
+package is missing are skipped.
+
+Usage: python benchmarks/bench_serialization.py [--size 10000] [--repeat 5]
+"""
+import argparse
+import gzip
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.responses import JSONResponse
+
+import main
+from bench_batch import build_numbers
+
+
+def best_of(func, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = func()
+        best = min(best, time.perf_counter() - start)
+    return best, body
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    numbers = build_numbers(args.size)
+    records = main.run_batch(numbers, "IN", "IN")
+    results = [record.to_dict() for record in records]
+    plain = {**main.summarize_batch(records), "results": results}
+    encode_time, (tables, encoded) = best_of(lambda: main.dictionary_encode(results), args.repeat)
+    dictionary = {**main.summarize_batch(records), "dictionary": tables, "results": encoded}
+    print(f"{args.size} results; dictionary encoding itself takes {encode_time * 1000:.1f} ms")
+
+    formats = [("json (stdlib)", lambda content: JSONResponse(content).body)]
+    if main.orjson is not None:
+        formats.append(("json (orjson)", lambda content: main.FastJSONResponse(content).body))
+    if main.msgpack is not None:
+        formats.append(("msgpack", lambda content: main.MsgPackResponse(content).body))
+
+    print(f"  {'format':<28} {'time':>9} {'size':>10} {'gzipped':>10}")
+    for name, render in formats:
+        for variant, content in (("", plain), (" + dictionary", dictionary)):
+            seconds, body = best_of(lambda: render(content), args.repeat)
+            print(f"  {name + variant:<28} {seconds * 1000:7.1f}ms {len(body) / 1024:8.0f}KB "
+                  f"{len(gzip.compress(body, 6)) / 1024:8.0f}KB")
+
+
+if __name__ == "__main__":
+    main_cli()
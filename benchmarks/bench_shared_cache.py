@@ -0,0 +1,82 @@
+"""
+validate_number throughput with no cache, the in-process LRU cache, the shared
+SQLite cache, and both, over a workload where numbers repeat.
+
+"shared (cold worker)" is what a freshly started worker sees: an empty
+in-process cache in front of a shared cache that other workers have filled.
+
+Usage: python benchmarks/bench_shared_cache.py [--distinct 5000] [--requests 50000]
+                                               [--path /tmp/bench_shared_cache.db]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+from bench_batch import build_numbers
+
+
+def workload(distinct: int, requests: int, seed: int = 11):
+    """Requests drawn from a pool of distinct numbers, skewed towards a hot set"""
+    rng = random.Random(seed)
+    pool = build_numbers(distinct)
+    return [pool[min(int(rng.expovariate(5 / distinct)), distinct - 1)] for _ in range(requests)]
+
+
+def run(numbers):
+    start = time.perf_counter()
+    for number in numbers:
+        main.validate_number(number, "IN", "IN")
+    return time.perf_counter() - start
+
+
+def remove_db(path: str):
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def configure(in_process: bool, shared):
+    main.validation_cache = main.ValidationCache(main.VALIDATION_CACHE_MAX_SIZE if in_process else 0, 0)
+    main._shared_cache = shared
+    main.SHARED_CACHE_PATH = shared.path if shared else ""
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--distinct", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=50000)
+    parser.add_argument("--path", default="/tmp/bench_shared_cache.db")
+    args = parser.parse_args()
+
+    numbers = workload(args.distinct, args.requests)
+    print(f"{args.requests} requests over {len(set(numbers))} distinct numbers")
+    main.validate_number("+919876543210")  # load metadata before timing
+
+    def report(label, seconds):
+        print(f"  {label:<28} {args.requests / seconds:9.0f}/s  {seconds / args.requests * 1e6:7.1f} us/op")
+
+    configure(False, None)
+    report("no cache", run(numbers))
+
+    configure(True, None)
+    report("in-process", run(numbers))
+
+    remove_db(args.path)
+    shared = main.SharedValidationCache(args.path, main.SHARED_CACHE_MAX_ENTRIES, 0)
+    configure(False, shared)
+    report("shared (empty file)", run(numbers))
+    report("shared (cold worker)", run(numbers))
+
+    configure(True, shared)
+    report("shared + in-process", run(numbers))
+    print(f"  shared cache: {shared.stats()}")
+    remove_db(args.path)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,162 @@
+"""
+Regression corpus and micro-benchmark for smart_parse_number.
+
+Compares the pruned resolver in main.py against the original exhaustive
+strategy search on a fixed corpus, checking that both pick the same
+strategy/region, then times both on worst-case ambiguous inputs.
+
+Usage: python benchmarks/bench_smart_parse.py [--size N] [--seed S]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import phonenumbers
+
+from main import COMMON_COUNTRIES, smart_parse_number
+
+
+def reference_smart_parse_number(raw_number: str, default_region: str):
+    """The original exhaustive strategy search, kept verbatim as the oracle"""
+    strategies = []
+    strategies.append(("as_is", raw_number, None))
+    if not raw_number.startswith('+'):
+        strategies.append(("with_region", raw_number, default_region))
+    if not raw_number.startswith('+'):
+        strategies.append(("with_plus", f"+{raw_number}", None))
+    if len(raw_number) >= 10 and not raw_number.startswith('+'):
+        for country in COMMON_COUNTRIES:
+            if country != default_region:
+                strategies.append((f"auto_{country}", raw_number, country))
+
+    results = []
+    for strategy_name, number, region in strategies:
+        try:
+            parsed = phonenumbers.parse(number, region)
+            is_valid = phonenumbers.is_valid_number(parsed)
+            is_possible = phonenumbers.is_possible_number(parsed)
+            detected_region = phonenumbers.region_code_for_number(parsed)
+            results.append({
+                "strategy": strategy_name,
+                "parsed": parsed,
+                "valid": is_valid,
+                "possible": is_possible,
+                "region": detected_region
+            })
+            if is_valid and strategy_name in ["as_is", "with_plus"]:
+                return results[-1]
+        except:
+            continue
+
+    valid_results = [r for r in results if r["valid"]]
+    if valid_results:
+        for strategy in ["with_region", "as_is", "with_plus"]:
+            match = next((r for r in valid_results if r["strategy"] == strategy), None)
+            if match:
+                return match
+        return valid_results[0]
+
+    possible_results = [r for r in results if r["possible"]]
+    if possible_results:
+        return possible_results[0]
+    if results:
+        return results[0]
+    return None
+
+
+def build_corpus(size: int, seed: int):
+    """Fixed synthetic corpus biased towards ambiguous 10+ digit inputs"""
+    rng = random.Random(seed)
+    regions = COMMON_COUNTRIES + ['IN', 'NG', 'EG', 'KE', 'NZ']
+    corpus = [
+        "", "+", "abc", "foo@bar.com", "1234", "0000000000", "1" * 40,
+        "+919876543210", "919876543210", "09876543210", "9876543210",
+        "14155552671", "4155552671", "442071838750", "00442071838750",
+        "0114420718387", "5511987654321", "541123456789", "5491123456789",
+        "81312345678", "8613800138000", "13800138000", "1-800-FLOWERS",
+    ]
+    while len(corpus) < size:
+        kind = rng.randrange(6)
+        digits = "".join(rng.choice("0123456789") for _ in range(rng.randint(9, 14)))
+        if kind == 0:
+            # Real-looking example numbers with their country code but no +
+            region = rng.choice(regions)
+            example = phonenumbers.example_number(region)
+            if example is not None:
+                digits = f"{example.country_code}{phonenumbers.national_significant_number(example)}"
+                digits = digits[:-3] + "".join(rng.choice("0123456789") for _ in range(3))
+        elif kind == 1:
+            digits = "00" + digits
+        elif kind == 2:
+            digits = "0" + digits
+        elif kind == 3:
+            digits = rng.choice(["1", "7", "44", "91", "55", "86"]) + digits
+        corpus.append(digits)
+    return corpus
+
+
+def signature(result):
+    if result is None:
+        return None
+    return (result["strategy"], result["region"], result["valid"], result["possible"],
+            result["parsed"].country_code, result["parsed"].national_number)
+
+
+def check_regression(corpus, default_regions):
+    mismatches = []
+    for default_region in default_regions:
+        for raw in corpus:
+            expected = signature(reference_smart_parse_number(raw, default_region))
+            actual = signature(smart_parse_number(raw, default_region))
+            if expected != actual:
+                mismatches.append((raw, default_region, expected, actual))
+    return mismatches
+
+
+def time_per_call(func, inputs, default_region, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for raw in inputs:
+            func(raw, default_region)
+        elapsed = (time.perf_counter() - start) / len(inputs)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=20240601)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.size, args.seed)
+    mismatches = check_regression(corpus, ["IN", "US", "GB", "BR"])
+    print(f"regression: {len(corpus) * 4} cases, {len(mismatches)} mismatches")
+    for raw, default_region, expected, actual in mismatches[:10]:
+        print(f"  {raw!r} ({default_region}): expected {expected}, got {actual}")
+
+    # Worst case: long digit strings without + that fall through to auto-detection
+    ambiguous = []
+    for raw in corpus:
+        if len(raw) < 10 or not raw.isdigit():
+            continue
+        expected = reference_smart_parse_number(raw, "IN")
+        if expected is None or not expected["valid"] or expected["strategy"].startswith("auto_"):
+            ambiguous.append(raw)
+
+    for label, inputs in [("ambiguous 10+ digits", ambiguous), ("full corpus", corpus)]:
+        before = time_per_call(reference_smart_parse_number, inputs, "IN")
+        after = time_per_call(smart_parse_number, inputs, "IN")
+        print(f"{label} ({len(inputs)} inputs): reference {before * 1e6:.1f} us/call, "
+              f"pruned {after * 1e6:.1f} us/call, speedup {before / after:.1f}x")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
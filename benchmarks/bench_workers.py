@@ -0,0 +1,124 @@
+"""
+/validate throughput and memory of serve.py at 1, 2, 4 and 8 workers.
+
+For each worker count a server is started, driven by closed-loop clients
+(each sends its next request when the last one returns) for --duration
+seconds, and then each process's RSS, PSS and USS are read. With
+--compare-no-preload every count also runs with --no-preload, where each
+worker loads its own copy of the metadata. The client runs in this process,
+so on a machine with fewer cores than workers + 1 it competes with them.
+
+Usage: python benchmarks/bench_workers.py [--workers 1,2,4,8] [--duration 10]
+                                          [--concurrency 32] [--compare-no-preload]
+"""
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import time
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import serve
+from load_test import random_number
+from load_validate_latency import percentile
+
+
+def child_pids(pid: int):
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            return [int(child) for child in f.read().split()]
+    except OSError:
+        return []
+
+
+def start_server(workers: int, port: int, preload: bool):
+    command = [sys.executable, "serve.py", "--host", "127.0.0.1", "--port", str(port),
+               "--workers", str(workers), "--log-level", "warning", "--no-access-log"]
+    if not preload:
+        command.append("--no-preload")
+    server = subprocess.Popen(command, cwd=ROOT)
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 120
+    while time.monotonic() < deadline:
+        # Every worker warms up before accepting, so all of them being forked is enough
+        if len(child_pids(server.pid)) == workers:
+            try:
+                if httpx.get(base_url + "/").status_code == 200:
+                    return server, base_url
+            except httpx.TransportError:
+                pass
+        time.sleep(0.2)
+    server.terminate()
+    raise SystemExit("server did not come up")
+
+
+async def drive(base_url: str, duration: float, concurrency: int, seed: int):
+    rng = random.Random(seed)
+    latencies = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60, limits=limits) as client:
+        async def client_loop(deadline):
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = await client.post("/validate", json={"number": random_number(rng)})
+                    if response.status_code != 200:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+
+        # Short warm-up so every worker has served traffic before measuring
+        await asyncio.gather(*(client_loop(time.perf_counter() + 1) for _ in range(concurrency)))
+        latencies.clear()
+        errors = 0
+        started = time.perf_counter()
+        await asyncio.gather(*(client_loop(started + duration) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return len(latencies) / elapsed, [value * 1000 for value in latencies], errors
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", default="1,2,4,8")
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--port", type=int, default=8793)
+    parser.add_argument("--compare-no-preload", action="store_true")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    modes = [True, False] if args.compare_no_preload else [True]
+    print(f"{len(os.sched_getaffinity(0))} CPUs available; {args.concurrency} clients, {args.duration}s per run")
+    print(f"{'workers':>7} {'mode':<10} {'req/s':>8} {'p50 ms':>7} {'p99 ms':>7} {'errors':>6} "
+          f"{'master RSS':>10} {'worker RSS':>10} {'worker USS':>10} {'total PSS':>10}")
+    for workers in [int(n) for n in args.workers.split(",")]:
+        for preload in modes:
+            server, base_url = start_server(workers, args.port, preload)
+            try:
+                rps, latencies, errors = asyncio.run(drive(base_url, args.duration, args.concurrency, args.seed))
+                report = serve.memory_report(server.pid, child_pids(server.pid))
+            finally:
+                server.terminate()
+                server.wait()
+            worker_rows = [row for row in report if row["role"] == "worker"]
+            mb = 1024 ** 2
+            print(f"{workers:>7} {'preload' if preload else 'no-preload':<10} {rps:8.0f} "
+                  f"{percentile(latencies, 50):7.1f} {percentile(latencies, 99):7.1f} {errors:>6} "
+                  f"{report[0]['rss'] / mb:8.0f}MB "
+                  f"{sum(row['rss'] for row in worker_rows) / len(worker_rows) / mb:8.0f}MB "
+                  f"{sum(row['uss'] for row in worker_rows) / len(worker_rows) / mb:8.0f}MB "
+                  f"{sum(row['pss'] for row in report) / mb:8.0f}MB")
+
+
+if __name__ == "__main__":
+    main_cli()
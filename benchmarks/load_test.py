@@ -0,0 +1,294 @@
+"""
+Open-loop load generator for main:app with a per-endpoint latency SLO report.
+
+Sends a weighted mix of requests (single /validate, small and large
+/validate-batch, /business-config lookups) at a target rate, or replays a
+recorded JSON-lines request log, and reports throughput, error rate and
+p50/p95/p99 latency per endpoint. Arrivals are scheduled independently of
+responses, so a slow server shows up as latency instead of a lower rate.
+
+Targets: the app in-process over ASGI (default), a local uvicorn started
+here (--uvicorn), or a running server (--url). Needs httpx.
+
+Replay logs have one JSON object per line, e.g.
+    {"method": "POST", "path": "/validate", "json": {"number": "+919876543210"}}
+"method" defaults to POST when there is a body and GET otherwise; "body" is
+accepted for "json", "headers" is optional and "name" overrides the endpoint
+label. Lines without a "path" are skipped and counted.
+
+Usage: python benchmarks/load_test.py [--rps 50] [--duration 10]
+                                      [--mix validate=70,batch_small=15,batch_large=2,business_config=13]
+                                      [--replay requests.jsonl] [--uvicorn | --url http://host:port]
+                                      [--max-in-flight 200] [--slo-p99-ms 250] [--output report.json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import time
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from load_validate_latency import percentile
+
+DEFAULT_MIX = "validate=70,batch_small=15,batch_large=2,business_config=13"
+SMALL_BATCH = 50
+LARGE_BATCH = 2000
+BUSINESS_CONFIG_COUNTRIES = ["IN", "US", "GB", "AE", "SA", "DE", "JP", "BR", "XX"]
+
+
+def random_number(rng):
+    """Numbers in the spellings production sends: E164, national, formatted, junk"""
+    kind = rng.random()
+    if kind < 0.5:
+        return f"+91{rng.choice('6789')}{rng.randrange(10 ** 9):09d}"
+    if kind < 0.7:
+        return f"0{rng.choice('6789')}{rng.randrange(10 ** 9):09d}"
+    if kind < 0.85:
+        return f"+1 ({rng.randrange(200, 999)}) {rng.randrange(200, 999)}-{rng.randrange(10 ** 4):04d}"
+    if kind < 0.95:
+        return f"+44 20 {rng.randrange(10 ** 4):04d} {rng.randrange(10 ** 4):04d}"
+    return rng.choice(["", "n/a", "12345", "foo@example.com"])
+
+
+SCENARIOS = {
+    "validate": lambda rng: ("POST", "/validate", {"number": random_number(rng)}),
+    "batch_small": lambda rng: ("POST", "/validate-batch",
+                                {"numbers": [random_number(rng) for _ in range(SMALL_BATCH)]}),
+    "batch_large": lambda rng: ("POST", "/validate-batch",
+                                {"numbers": [random_number(rng) for _ in range(LARGE_BATCH)]}),
+    "business_config": lambda rng: ("GET", f"/business-config/{rng.choice(BUSINESS_CONFIG_COUNTRIES)}", None),
+}
+
+
+def parse_mix(text: str):
+    weights = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        if name not in SCENARIOS:
+            raise SystemExit(f"Unknown scenario {name!r}; choose from {', '.join(SCENARIOS)}")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+def endpoint_label(path: str) -> str:
+    """Group path parameters so /business-config/IN and /business-config/US report together"""
+    path = path.split("?", 1)[0]
+    path = re.sub(r"^/business-config/[^/]+$", "/business-config/{country_code}", path)
+    return re.sub(r"^/jobs/[^/]+", "/jobs/{job_id}", path)
+
+
+def load_replay(path: str):
+    """(label, method, path, body, headers) per usable line of a JSON-lines log, plus a skip count"""
+    requests, skipped = [], 0
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                skipped += 1
+                continue
+            if not isinstance(entry, dict) or not isinstance(entry.get("path"), str):
+                skipped += 1
+                continue
+            body = entry.get("json", entry.get("body"))
+            method = entry.get("method", "POST" if body is not None else "GET").upper()
+            label = entry.get("name") or f"{method} {endpoint_label(entry['path'])}"
+            requests.append((label, method, entry["path"], body, entry.get("headers") or {}))
+    return requests, skipped
+
+
+def request_source(args, rng):
+    """Endless iterator of (label, method, path, body, headers)"""
+    if args.replay:
+        requests, skipped = load_replay(args.replay)
+        print(f"replaying {len(requests)} requests from {args.replay} ({skipped} lines skipped)")
+        if not requests:
+            raise SystemExit("Nothing to replay")
+        while True:
+            yield from requests
+
+    weights = parse_mix(args.mix)
+    names = list(weights)
+    while True:
+        name = rng.choices(names, weights=[weights[n] for n in names])[0]
+        method, path, body = SCENARIOS[name](rng)
+        yield name, method, path, body, {}
+
+
+class EndpointStats:
+    def __init__(self):
+        self.latencies = []
+        self.statuses = {}
+        self.errors = 0
+
+    def record(self, seconds: float, status):
+        self.latencies.append(seconds)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if not isinstance(status, int) or status >= 400:
+            self.errors += 1
+
+    def summary(self, elapsed: float, slo_p99_ms):
+        ms = [value * 1000 for value in self.latencies]
+        count = len(ms)
+        result = {
+            "requests": count,
+            "throughput_rps": round(count / elapsed, 2) if elapsed else None,
+            "error_rate": round(self.errors / count, 4) if count else None,
+            "statuses": {str(status): n for status, n in sorted(self.statuses.items(), key=str)},
+            "p50_ms": percentile(ms, 50),
+            "p95_ms": percentile(ms, 95),
+            "p99_ms": percentile(ms, 99),
+            "max_ms": max(ms) if ms else None,
+        }
+        if slo_p99_ms is not None:
+            result["slo_met"] = bool(ms) and result["p99_ms"] <= slo_p99_ms
+        return result
+
+
+async def run_load(client, source, rps: float, duration: float, max_in_flight: int):
+    stats = {}
+    in_flight = set()
+    dropped = 0
+    interval = 1 / rps
+    started = time.perf_counter()
+    next_send = started
+
+    async def send(label, method, path, body, headers):
+        request_started = time.perf_counter()
+        try:
+            response = await client.request(method, path, json=body, headers=headers)
+            status = response.status_code
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+        stats.setdefault(label, EndpointStats()).record(time.perf_counter() - request_started, status)
+
+    while next_send < started + duration:
+        request = next(source)
+        if len(in_flight) >= max_in_flight:
+            # Past the cap the client, not the server, would be the bottleneck
+            dropped += 1
+        else:
+            task = asyncio.create_task(send(*request))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        next_send += interval
+        delay = next_send - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    sent_for = time.perf_counter() - started
+    await asyncio.gather(*in_flight)
+    return stats, sent_for, dropped
+
+
+def print_report(report):
+    print(f"\ntarget {report['target_rps']} rps for {report['duration_s']}s -> "
+          f"sent {report['sent']} ({report['dropped']} dropped at the in-flight cap)")
+    header = f"{'endpoint':<36} {'reqs':>6} {'rps':>7} {'err%':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}"
+    print(header)
+    for label, row in report["endpoints"].items():
+        slo = "" if "slo_met" not in row else ("  ok" if row["slo_met"] else "  SLO MISSED")
+        print(f"{label:<36} {row['requests']:>6} {row['throughput_rps']:>7} {row['error_rate'] * 100:>5.1f}% "
+              f"{row['p50_ms']:>6.1f}ms {row['p95_ms']:>6.1f}ms {row['p99_ms']:>6.1f}ms {row['max_ms']:>6.1f}ms{slo}")
+
+
+def start_uvicorn(port: int):
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    # Wait until warm-up has finished and / reports ok
+    for _ in range(600):
+        try:
+            if httpx.get(base_url + "/").status_code == 200:
+                return server, base_url
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    server.terminate()
+    raise SystemExit("uvicorn did not come up")
+
+
+async def main_async(args, base_url):
+    rng = random.Random(args.seed)
+    source = request_source(args, rng)
+    if base_url is None:
+        import main
+        # ASGITransport doesn't run the lifespan, so warm up as startup would
+        if main.WARMUP_MODE == "eager":
+            main.warm_up(main.WARMUP_REGIONS)
+        transport = httpx.ASGITransport(app=main.app)
+        base_url = "http://in-process"
+    else:
+        transport = None
+    limits = httpx.Limits(max_connections=args.max_in_flight)
+    async with httpx.AsyncClient(base_url=base_url, transport=transport, timeout=120, limits=limits) as client:
+        stats, sent_for, dropped = await run_load(client, source, args.rps, args.duration, args.max_in_flight)
+
+    endpoints = {label: stats[label].summary(sent_for, args.slo_p99_ms) for label in sorted(stats)}
+    everything = EndpointStats()
+    for endpoint_stats in stats.values():
+        everything.latencies.extend(endpoint_stats.latencies)
+        everything.errors += endpoint_stats.errors
+        for status, n in endpoint_stats.statuses.items():
+            everything.statuses[status] = everything.statuses.get(status, 0) + n
+    endpoints["all"] = everything.summary(sent_for, args.slo_p99_ms)
+    return {
+        "target": base_url,
+        "target_rps": args.rps,
+        "duration_s": args.duration,
+        "sent": sum(len(s.latencies) for s in stats.values()),
+        "dropped": dropped,
+        "slo_p99_ms": args.slo_p99_ms,
+        "endpoints": endpoints,
+    }
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rps", type=float, default=50)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="scenario=weight,... (ignored with --replay)")
+    parser.add_argument("--replay", help="JSON-lines request log to replay in order, cycling")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--uvicorn", action="store_true", help="start a local uvicorn server")
+    target.add_argument("--url", help="base URL of a running server")
+    parser.add_argument("--port", type=int, default=8792)
+    parser.add_argument("--max-in-flight", type=int, default=200)
+    parser.add_argument("--slo-p99-ms", type=float, help="fail (exit 1) when any endpoint's p99 exceeds this")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write the report as JSON")
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.url
+    if args.uvicorn:
+        server, base_url = start_uvicorn(args.port)
+    try:
+        report = asyncio.run(main_async(args, base_url))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.slo_p99_ms is not None and not all(row["slo_met"] for row in report["endpoints"].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,116 @@
+"""
+/validate latency while large /validate-batch requests run concurrently.
+
+Starts the app under uvicorn on a local port, measures /validate latency on
+its own, then again while --batch-clients clients post --batch-size number
+batches back to back. Needs httpx (pip install httpx).
+
+Usage: python benchmarks/load_validate_latency.py [--duration 10] [--rps 50]
+                                                  [--batch-clients 4] [--batch-size 2000]
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def random_number(rng):
+    return f"+91{rng.choice('6789')}{rng.randrange(10 ** 9):09d}"
+
+
+async def single_client(client, duration, rps, latencies, statuses):
+    rng = random.Random(1)
+    interval = 1 / rps
+    deadline = time.perf_counter() + duration
+    in_flight = set()
+
+    async def one():
+        start = time.perf_counter()
+        response = await client.post("/validate", json={"number": random_number(rng)})
+        latencies.append(time.perf_counter() - start)
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    while time.perf_counter() < deadline:
+        task = asyncio.create_task(one())
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+        await asyncio.sleep(interval)
+    await asyncio.gather(*in_flight)
+
+
+async def batch_client(client, stop, batch_size, seed, counts):
+    rng = random.Random(seed)
+    while not stop.is_set():
+        numbers = [random_number(rng) for _ in range(batch_size)]
+        response = await client.post("/validate-batch", json={"numbers": numbers})
+        counts[response.status_code] = counts.get(response.status_code, 0) + 1
+
+
+async def run_phase(base_url, duration, rps, batch_clients, batch_size):
+    latencies, statuses, batch_counts = [], {}, {}
+    stop = asyncio.Event()
+    async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+        batches = [
+            asyncio.create_task(batch_client(client, stop, batch_size, seed, batch_counts))
+            for seed in range(batch_clients)
+        ]
+        await single_client(client, duration, rps, latencies, statuses)
+        stop.set()
+        await asyncio.gather(*batches)
+    return latencies, statuses, batch_counts
+
+
+def report(label, latencies, statuses, batch_counts):
+    ms = [value * 1000 for value in latencies]
+    print(f"{label}: {len(ms)} /validate calls, statuses {statuses}, batches {batch_counts}")
+    print(f"  p50 {percentile(ms, 50):.1f} ms  p99 {percentile(ms, 99):.1f} ms  "
+          f"mean {statistics.mean(ms):.1f} ms  max {max(ms):.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--rps", type=float, default=50)
+    parser.add_argument("--batch-clients", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=2000)
+    parser.add_argument("--port", type=int, default=8791)
+    args = parser.parse_args()
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(args.port), "--log-level", "warning"],
+        cwd=ROOT
+    )
+    base_url = f"http://127.0.0.1:{args.port}"
+    try:
+        for _ in range(100):
+            try:
+                httpx.get(base_url + "/")
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+
+        report("idle", *asyncio.run(run_phase(base_url, args.duration, args.rps, 0, args.batch_size)))
+        report(f"with {args.batch_clients} concurrent batch clients x {args.batch_size} numbers",
+               *asyncio.run(run_phase(base_url, args.duration, args.rps, args.batch_clients, args.batch_size)))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
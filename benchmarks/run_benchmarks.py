@@ -0,0 +1,185 @@
+"""
+Benchmark suite for the hot paths in main.py.
+
+Runs clean_phone_number, smart_parse_number, get_time_info, /validate and
+/validate-batch (through the ASGI test client) over fixed synthetic corpora
+and writes machine-readable JSON. With --compare, fails (exit 1) when any
+benchmark's median per-op time regressed by more than --threshold.
+The test client needs httpx (pip install httpx).
+
+Usage: python benchmarks/run_benchmarks.py [--output bench.json]
+                                           [--compare baseline.json] [--threshold 0.15]
+                                           [--repeat 5] [--size 200]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import phonenumbers
+from fastapi.testclient import TestClient
+
+import main
+
+SEED = 20240601
+
+
+def build_corpora(size: int):
+    """Fixed synthetic inputs, identical across runs for a given size"""
+    rng = random.Random(SEED)
+    regions = ["US", "GB", "DE", "FR", "BR", "AU", "JP", "CN", "AE", "ZA", "MX", "IN"]
+    e164 = []
+    while len(e164) < size:
+        example = phonenumbers.example_number_for_type(rng.choice(regions), phonenumbers.PhoneNumberType.MOBILE)
+        nsn = phonenumbers.national_significant_number(example)
+        e164.append(f"+{example.country_code}{nsn[:-4]}{rng.randrange(10 ** 4):04d}")
+    domestic_in = [
+        rng.choice(["", "0", "+91 ", "91-"]) + f"{rng.choice('6789')}{rng.randrange(10 ** 9):09d}"
+        for _ in range(size)
+    ]
+    ambiguous = [
+        f"{rng.choice('123456789')}{rng.randrange(10 ** 11):011d}"[:rng.randint(10, 12)]
+        for _ in range(size)
+    ]
+    garbage = [
+        rng.choice([
+            "", "   ", "n/a", "call me", "foo@example.com", "1" * 40, "12",
+            "".join(rng.choice("abcdef0123-()") for _ in range(rng.randint(3, 20)))
+        ])
+        for _ in range(size)
+    ]
+    return {"e164": e164, "domestic_in": domestic_in, "ambiguous": ambiguous, "garbage": garbage}
+
+
+def measure(func, items, repeat: int):
+    """Per-op seconds for each repeat of func over all items"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        samples.append((time.perf_counter() - start) / len(items))
+    return samples
+
+
+def run_suite(size: int, repeat: int):
+    corpora = build_corpora(size)
+    # Measure the uncached work; the cached path is reported separately
+    main.validation_cache.max_size = 0
+    client = TestClient(main.app)
+
+    parsed = [(p, phonenumbers.region_code_for_number(p)) for p in
+              (phonenumbers.parse(number) for number in corpora["e164"])]
+    snapshot = main.TimeSnapshot()
+
+    benchmarks = {}
+
+    def record(name, func, items, ops_per_item=1):
+        samples = measure(func, items, repeat)
+        per_op = [sample / ops_per_item for sample in samples]
+        benchmarks[name] = {
+            "ops": len(items) * ops_per_item,
+            "median_us": round(statistics.median(per_op) * 1e6, 3),
+            "min_us": round(min(per_op) * 1e6, 3),
+            "ops_per_second": round(1 / statistics.median(per_op), 1)
+        }
+        print(f"{name:<40} {benchmarks[name]['median_us']:>10.1f} us/op", file=sys.stderr)
+
+    for corpus_name, numbers in corpora.items():
+        cleaned = [main.clean_phone_number(number) for number in numbers]
+        record(f"clean_phone_number[{corpus_name}]", main.clean_phone_number, numbers)
+        record(f"smart_parse_number[{corpus_name}]", lambda raw: main.smart_parse_number(raw, "IN"), cleaned)
+        record(f"validate_phone[{corpus_name}]",
+               lambda number: client.post("/validate", json={"number": number}), numbers)
+
+    minimal = main.stages_for_fields(["valid", "formatted_e164"])
+    record("validate_number[e164,full]", main.validate_number, corpora["e164"])
+    record("validate_number[e164,minimal]",
+           lambda number: main.validate_number(number, stages=minimal), corpora["e164"])
+    record("validate_phone[e164,minimal]",
+           lambda number: client.post("/validate", json={"number": number, "fields": ["valid", "formatted_e164"]}),
+           corpora["e164"])
+
+    record("get_time_info[e164]", lambda item: main.get_time_info(item[0], item[1]), parsed)
+    record("get_time_info[e164,shared_snapshot]",
+           lambda item: main.get_time_info(item[0], item[1], snapshot), parsed)
+
+    mixed = [number for numbers in corpora.values() for number in numbers]
+    record("validate_batch[mixed]",
+           lambda chunk: client.post("/validate-batch", json={"numbers": chunk}),
+           [mixed], ops_per_item=len(mixed))
+
+    record("validate_batch_compact[mixed]",
+           lambda chunk: client.post("/validate-batch/compact", json={"numbers": chunk}),
+           [mixed], ops_per_item=len(mixed))
+
+    main.validation_cache.max_size = main.VALIDATION_CACHE_MAX_SIZE
+    main.validation_cache.clear()
+    for number in corpora["e164"]:
+        client.post("/validate", json={"number": number})
+    record("validate_phone[e164,cached]",
+           lambda number: client.post("/validate", json={"number": number}), corpora["e164"])
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "phonenumbers": phonenumbers.__version__,
+            "platform": platform.platform(),
+            "size": size,
+            "repeat": repeat,
+            "seed": SEED
+        },
+        "benchmarks": benchmarks
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float):
+    """Return (name, baseline_us, current_us, ratio) for each regression"""
+    regressions = []
+    for name, result in current["benchmarks"].items():
+        previous = baseline["benchmarks"].get(name)
+        if previous is None:
+            continue
+        ratio = result["median_us"] / previous["median_us"]
+        if ratio > 1 + threshold:
+            regressions.append((name, previous["median_us"], result["median_us"], ratio))
+    return regressions
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", help="write results JSON here (default: stdout)")
+    parser.add_argument("--compare", help="baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="allowed slowdown as a fraction of the baseline median")
+    parser.add_argument("--size", type=int, default=200, help="inputs per corpus")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run_suite(args.size, args.repeat)
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for name, before, after, ratio in regressions:
+            print(f"REGRESSION {name}: {before:.1f} -> {after:.1f} us/op ({ratio:.2f}x)", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
@@ -1,14 +1,59 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
 import phonenumbers
-from phonenumbers import geocoder, carrier, number_type, PhoneNumberType
+from phonenumbers import number_type, PhoneNumberType
 from phonenumbers import timezone as pn_timezone
+from phonenumbers import PhoneMetadata
+import asyncio
+import bisect
+import calendar
+import codecs
+import csv
+import functools
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import queue
+import sqlite3
 import re
-from datetime import datetime
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import NamedTuple, Optional
 import pytz
 
-app = FastAPI()
+import prefix_trie
+
+# Optional encoders for /validate and /validate-batch responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    start_warm_up()
+    start_job_workers()
+    yield
+    stop_job_workers()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -19,253 +64,395 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Comprehensive country-specific business hours configuration for 195+ countries
-COUNTRY_BUSINESS_CONFIG = {
-    # Asia
-    "IN": {"weekdays": [0, 1, 2, 3, 4, 5], "business_hours_start": 10, "business_hours_end": 18, "weekend_days": [6]},  # India - Mon-Sat
-    "PK": {"weekdays": [0, 1, 2, 3, 4, 5], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [6]},  # Pakistan - Mon-Sat
-    "BD": {"weekdays": [0, 1, 2, 3, 4, 6], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5]},  # Bangladesh - Sun-Thu + Sat
-    "LK": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Sri Lanka
-    "NP": {"weekdays": [6, 0, 1, 2, 3, 4], "business_hours_start": 10, "business_hours_end": 17, "weekend_days": [5]},  # Nepal - Sun-Fri
-    "CN": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # China
-    "JP": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Japan
-    "KR": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # South Korea
-    "KP": {"weekdays": [0, 1, 2, 3, 4, 5], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [6]},  # North Korea
-    "TH": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Thailand
-    "VN": {"weekdays": [0, 1, 2, 3, 4, 5], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [6]},  # Vietnam - Mon-Sat
-    "MY": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Malaysia
-    "SG": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Singapore
-    "ID": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Indonesia
-    "PH": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Philippines
-    "MM": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Myanmar
-    "KH": {"weekdays": [0, 1, 2, 3, 4, 5], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [6]},  # Cambodia
-    "LA": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Laos
-    "BN": {"weekdays": [0, 1, 2, 3, 6], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [4, 5]},  # Brunei - Sun-Thu
-    "TL": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Timor-Leste
-    "MN": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Mongolia
-    "TW": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Taiwan
-    "HK": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Hong Kong
-    "MO": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Macau
-    
-    # Middle East (Most have Friday-Saturday weekends or Friday only)
-    "AE": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # UAE - Sat-Sun now
-    "SA": {"weekdays": [6, 0, 1, 2, 3], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [4, 5]},  # Saudi Arabia - Sun-Thu
-    "QA": {"weekdays": [6, 0, 1, 2, 3], "business_hours_start": 7, "business_hours_end": 15, "weekend_days": [4, 5]},  # Qatar - Sun-Thu
-    "KW": {"weekdays": [6, 0, 1, 2, 3], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [4, 5]},  # Kuwait - Sun-Thu
-    "BH": {"weekdays": [6, 0, 1, 2, 3], "business_hours_start": 8, "business_hours_end": 15, "weekend_days": [4, 5]},  # Bahrain - Sun-Thu
-    "OM": {"weekdays": [6, 0, 1, 2, 3], "business_hours_start": 8, "business_hours_end": 15, "weekend_days": [4, 5]},  # Oman - Sun-Thu
-    "YE": {"weekdays": [5, 6, 0, 1, 2], "business_hours_start": 8, "business_hours_end": 14, "weekend_days": [3, 4]},  # Yemen - Sat-Wed
-    "IQ": {"weekdays": [6, 0, 1, 2, 3], "business_hours_start": 8, "business_hours_end": 15, "weekend_days": [4, 5]},  # Iraq - Sun-Thu
-    "SY": {"weekdays": [6, 0, 1, 2, 3], "business_hours_start": 8, "business_hours_end": 14, "weekend_days": [4, 5]},  # Syria - Sun-Thu
-    "JO": {"weekdays": [6, 0, 1, 2, 3], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [4, 5]},  # Jordan - Sun-Thu
-    "LB": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Lebanon - Mon-Fri
-    "IL": {"weekdays": [6, 0, 1, 2, 3], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [4, 5]},  # Israel - Sun-Thu
-    "PS": {"weekdays": [6, 0, 1, 2, 3], "business_hours_start": 8, "business_hours_end": 15, "weekend_days": [4, 5]},  # Palestine - Sun-Thu
-    "TR": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Turkey - Mon-Fri
-    "IR": {"weekdays": [5, 6, 0, 1, 2], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [3, 4]},  # Iran - Sat-Wed
-    "AF": {"weekdays": [5, 6, 0, 1, 2], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [3, 4]},  # Afghanistan - Sat-Wed
-    "AM": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Armenia
-    "AZ": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Azerbaijan
-    "GE": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Georgia
-    "CY": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Cyprus
-    
-    # Central Asia
-    "KZ": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Kazakhstan
-    "UZ": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Uzbekistan
-    "TM": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Turkmenistan
-    "KG": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Kyrgyzstan
-    "TJ": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Tajikistan
-    
-    # Europe - Western
-    "GB": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # United Kingdom
-    "IE": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Ireland
-    "FR": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # France
-    "DE": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Germany
-    "NL": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Netherlands
-    "BE": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Belgium
-    "LU": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Luxembourg
-    "CH": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Switzerland
-    "AT": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Austria
-    "LI": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Liechtenstein
-    
-    # Europe - Northern
-    "NO": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [5, 6]},  # Norway
-    "SE": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Sweden
-    "FI": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [5, 6]},  # Finland
-    "DK": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [5, 6]},  # Denmark
-    "IS": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Iceland
-    
-    # Europe - Southern
-    "ES": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Spain
-    "PT": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Portugal
-    "IT": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Italy
-    "GR": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Greece
-    "MT": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Malta
-    "SM": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # San Marino
-    "VA": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Vatican City
-    "AD": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Andorra
-    "MC": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Monaco
-    
-    # Europe - Eastern
-    "PL": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Poland
-    "CZ": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Czech Republic
-    "SK": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Slovakia
-    "HU": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [5, 6]},  # Hungary
-    "RO": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Romania
-    "BG": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Bulgaria
-    "MD": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Moldova
-    "UA": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Ukraine
-    "BY": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Belarus
-    "RU": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Russia
-    
-    # Europe - Baltic
-    "EE": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Estonia
-    "LV": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Latvia
-    "LT": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Lithuania
-    
-    # Europe - Balkans
-    "SI": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [5, 6]},  # Slovenia
-    "HR": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [5, 6]},  # Croatia
-    "BA": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [5, 6]},  # Bosnia
-    "RS": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [5, 6]},  # Serbia
-    "ME": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [5, 6]},  # Montenegro
-    "XK": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [5, 6]},  # Kosovo
-    "MK": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [5, 6]},  # North Macedonia
-    "AL": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [5, 6]},  # Albania
-    
-    # North America
-    "US": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # USA
-    "CA": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Canada
-    "MX": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Mexico
-    
-    # Central America
-    "GT": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Guatemala
-    "BZ": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Belize
-    "SV": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # El Salvador
-    "HN": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Honduras
-    "NI": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Nicaragua
-    "CR": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Costa Rica
-    "PA": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Panama
-    
-    # Caribbean
-    "CU": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Cuba
-    "JM": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Jamaica
-    "HT": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Haiti
-    "DO": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Dominican Republic
-    "PR": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Puerto Rico
-    "TT": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [5, 6]},  # Trinidad & Tobago
-    "BB": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [5, 6]},  # Barbados
-    "BS": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Bahamas
-    
-    # South America
-    "BR": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Brazil
-    "AR": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Argentina
-    "CL": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Chile
-    "CO": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Colombia
-    "PE": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Peru
-    "VE": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Venezuela
-    "EC": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Ecuador
-    "BO": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Bolivia
-    "PY": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Paraguay
-    "UY": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 18, "weekend_days": [5, 6]},  # Uruguay
-    "GY": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [5, 6]},  # Guyana
-    "SR": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 7, "business_hours_end": 15, "weekend_days": [5, 6]},  # Suriname
-    
-    # Africa - North
-    "EG": {"weekdays": [6, 0, 1, 2, 3], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [4, 5]},  # Egypt - Sun-Thu
-    "LY": {"weekdays": [6, 0, 1, 2, 3], "business_hours_start": 8, "business_hours_end": 15, "weekend_days": [4, 5]},  # Libya - Sun-Thu
-    "TN": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Tunisia
-    "DZ": {"weekdays": [5, 6, 0, 1, 2], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [3, 4]},  # Algeria - Sat-Wed
-    "MA": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Morocco
-    "SD": {"weekdays": [5, 6, 0, 1, 2], "business_hours_start": 8, "business_hours_end": 14, "weekend_days": [3, 4]},  # Sudan - Sat-Wed
-    
-    # Africa - West
-    "NG": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Nigeria
-    "GH": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Ghana
-    "SN": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Senegal
-    "CI": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Ivory Coast
-    "BF": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Burkina Faso
-    "ML": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Mali
-    "NE": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Niger
-    "TG": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Togo
-    "BJ": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Benin
-    "LR": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Liberia
-    "SL": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Sierra Leone
-    "GN": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Guinea
-    "GM": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [5, 6]},  # Gambia
-    
-    # Africa - East
-    "KE": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Kenya
-    "TZ": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Tanzania
-    "UG": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Uganda
-    "RW": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Rwanda
-    "BI": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Burundi
-    "ET": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Ethiopia
-    "SO": {"weekdays": [5, 6, 0, 1, 2], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [3, 4]},  # Somalia - Sat-Wed
-    "DJ": {"weekdays": [5, 6, 0, 1, 2], "business_hours_start": 7, "business_hours_end": 14, "weekend_days": [3, 4]},  # Djibouti - Sat-Wed
-    "ER": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Eritrea
-    
-    # Africa - Central
-    "CD": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # DR Congo
-    "CG": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Congo
-    "CM": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Cameroon
-    "CF": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 7, "business_hours_end": 15, "weekend_days": [5, 6]},  # Central African Rep
-    "TD": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 7, "business_hours_end": 15, "weekend_days": [5, 6]},  # Chad
-    "GA": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Gabon
-    "GQ": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Equatorial Guinea
-    
-    # Africa - Southern
-    "ZA": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # South Africa
-    "ZW": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Zimbabwe
-    "ZM": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Zambia
-    "MW": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 7, "business_hours_end": 17, "weekend_days": [5, 6]},  # Malawi
-    "MZ": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Mozambique
-    "BW": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Botswana
-    "NA": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Namibia
-    "AO": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Angola
-    "LS": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Lesotho
-    "SZ": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Eswatini
-    
-    # Oceania
-    "AU": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # Australia
-    "NZ": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 9, "business_hours_end": 17, "weekend_days": [5, 6]},  # New Zealand
-    "PG": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [5, 6]},  # Papua New Guinea
-    "FJ": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Fiji
-    "SB": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 16, "weekend_days": [5, 6]},  # Solomon Islands
-    "VU": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Vanuatu
-    "NC": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 7, "business_hours_end": 15, "weekend_days": [5, 6]},  # New Caledonia
-    "WS": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Samoa
-    "TO": {"weekdays": [0, 1, 2, 3, 4], "business_hours_start": 8, "business_hours_end": 17, "weekend_days": [5, 6]},  # Tonga
-}
-
-# Default configuration for countries not listed
-DEFAULT_BUSINESS_CONFIG = {
-    "weekdays": [0, 1, 2, 3, 4],  # Monday-Friday
-    "business_hours_start": 9,
-    "business_hours_end": 17,
-    "weekend_days": [5, 6]  # Saturday, Sunday
-}
+# Business hours and public holidays per country, read from a JSON file and
+# reloaded when it changes. See business_config.json: {"version": ..., "default":
+# {...}, "countries": {"IN": {"weekdays": [0-6, Monday=0], "weekend_days": [...],
+# "business_hours_start": 10, "business_hours_end": 18, "holidays": [...]}}},
+# where holidays are "YYYY-MM-DD" dates or "MM-DD" ones repeating every year.
+# Without a "version", /business-config reports a hash of the file instead.
+BUSINESS_CONFIG_PATH = os.environ.get(
+    "BUSINESS_CONFIG_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "business_config.json")
+)
+# Seconds between checks of the file for changes; 0 loads it once at startup
+BUSINESS_CONFIG_RELOAD_INTERVAL = float(os.environ.get("BUSINESS_CONFIG_RELOAD_INTERVAL", "5"))
 
 
 class PhoneRequest(BaseModel):
     number: str
     default_region: str = "IN"
     home_country: str = "IN"
+    # Reference instant for the time fields (default: now)
+    at: Optional[datetime] = None
+    # Result keys to return (default: all); unrequested lookups are skipped
+    fields: Optional[list[str]] = None
+
+
+# Deletes whitespace and - ( ) . in one str.translate pass; every character
+# matched by the regex class \s is at or below U+3000
+_CLEAN_TABLE = {c: None for c in range(0x3001) if chr(c).isspace() or chr(c) in "-()."}
 
 
 def clean_phone_number(number: str) -> str:
     """Remove formatting but keep + prefix"""
-    cleaned = re.sub(r'[\s\-\(\)\.]', '', number)
-    return cleaned
+    return number.translate(_CLEAN_TABLE)
+
+
+# Bounds for the pre-parse filter. No region has a valid national number shorter
+# than 4 digits, and the longest dialable form (7 digit IDD + 3 digit calling
+# code + national prefix + 17 digit national number) stays well under 32.
+PREFILTER_MIN_DIGITS = 4
+PREFILTER_MAX_DIGITS = 32
+# phonenumbers accepts a few all-same-digit numbers (e.g. 9999999999 in IN).
+# They are nearly always placeholders, but rejecting them changes the verdict,
+# so it is opt-in: set PREFILTER_REJECT_REPEATED=1
+PREFILTER_REJECT_REPEATED = os.environ.get("PREFILTER_REJECT_REPEATED", "0") == "1"
+
+PREFILTER_REASONS = {
+    "empty": "Rejected: empty input",
+    "non_digit": "Rejected: input has no phone number digits",
+    "too_short": "Rejected: too short for any region",
+    "too_long": "Rejected: too long for any region",
+    "repeated_digits": "Rejected: all digits are the same",
+}
+
+
+def prefilter_number(raw: str) -> Optional[str]:
+    """
+    Classify a cleaned number that cannot be a valid phone number without
+    parsing it. Returns a PREFILTER_REASONS code, or None to go on to parsing.
+    """
+    if not raw:
+        return "empty"
+    digits = raw[1:] if raw[0] == "+" else raw
+    if not (digits.isascii() and digits.isdigit()):
+        # Letters (vanity numbers, extensions) and other scripts' digits are
+        # left to phonenumbers, which needs at least two digits to start with
+        if sum(c.isdecimal() for c in raw) < 2:
+            return "non_digit"
+        return None
+    if len(digits) < PREFILTER_MIN_DIGITS:
+        return "too_short"
+    if len(digits) > PREFILTER_MAX_DIGITS:
+        return "too_long"
+    if PREFILTER_REJECT_REPEATED and digits.count(digits[0]) == len(digits):
+        return "repeated_digits"
+    return None
+
+
+DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+class CompiledBusinessConfig(NamedTuple):
+    """Immutable, precomputed form of one business config entry"""
+    weekday_mask: int  # bit i set when weekday i (Monday=0) is a working day
+    weekend_mask: int
+    start_hour: int
+    end_hour: int
+    business_hours_start: str  # "09:00"
+    business_hours_end: str
+    weekdays_config: str  # "Monday, Tuesday, ..."
+    weekday_names: tuple
+    weekend_names: tuple
+    # Holidays as day-of-year bitmaps (bit 0 = January 1st): one per year from
+    # holiday_first_year for dated entries, and (common year, leap year) ones
+    # for entries repeating every year
+    holiday_first_year: int
+    holiday_years: tuple
+    annual_holidays: tuple
+    holidays: tuple  # the configured entries, "YYYY-MM-DD" or "MM-DD"
+
+    def is_holiday(self, year: int, day_of_year: int) -> bool:
+        bit = 1 << (day_of_year - 1)
+        if self.annual_holidays[calendar.isleap(year)] & bit:
+            return True
+        index = year - self.holiday_first_year
+        return 0 <= index < len(self.holiday_years) and bool(self.holiday_years[index] & bit)
+
+
+def parse_holiday(entry: str):
+    """(year, month, day) of a "YYYY-MM-DD" holiday, with year None for an annual "MM-DD" one"""
+    parts = entry.split("-") if isinstance(entry, str) else []
+    if len(parts) not in (2, 3) or not all(part.isdigit() for part in parts):
+        raise ValueError(f"Holiday {entry!r} is not YYYY-MM-DD or MM-DD")
+    year = int(parts[0]) if len(parts) == 3 else None
+    month, day = int(parts[-2]), int(parts[-1])
+    # 2000 is a leap year, so annual February 29th is accepted
+    datetime(year or 2000, month, day)
+    return year, month, day
+
+
+def compile_holidays(entries):
+    """(first year, per-year bitmaps, (common, leap) annual bitmaps) for holiday entries"""
+    dated = {}
+    annual = [0, 0]
+    for entry in entries:
+        year, month, day = parse_holiday(entry)
+        if year is None:
+            for leap, sample_year in ((0, 2001), (1, 2000)):
+                if month == 2 and day == 29 and not leap:
+                    continue
+                annual[leap] |= 1 << (datetime(sample_year, month, day).timetuple().tm_yday - 1)
+        else:
+            dated[year] = dated.get(year, 0) | 1 << (datetime(year, month, day).timetuple().tm_yday - 1)
+    if not dated:
+        return 0, (), tuple(annual)
+    first_year = min(dated)
+    return first_year, tuple(dated.get(year, 0) for year in range(first_year, max(dated) + 1)), tuple(annual)
+
+
+def compile_business_config(config: dict) -> CompiledBusinessConfig:
+    """Precompute one config entry; raises ValueError when it is malformed"""
+    for key in ("weekdays", "weekend_days"):
+        days = config.get(key)
+        if not isinstance(days, list) or not all(isinstance(day, int) and 0 <= day <= 6 for day in days):
+            raise ValueError(f"{key} must be a list of weekday numbers 0-6 (Monday=0)")
+    for key in ("business_hours_start", "business_hours_end"):
+        hour = config.get(key)
+        if not isinstance(hour, int) or not 0 <= hour <= 24:
+            raise ValueError(f"{key} must be an hour 0-24")
+    holidays = config.get("holidays", [])
+    if not isinstance(holidays, list):
+        raise ValueError("holidays must be a list")
+    holiday_first_year, holiday_years, annual_holidays = compile_holidays(holidays)
+
+    weekday_names = tuple(DAY_NAMES[i] for i in sorted(config['weekdays']))
+    return CompiledBusinessConfig(
+        weekday_mask=sum(1 << i for i in set(config['weekdays'])),
+        weekend_mask=sum(1 << i for i in set(config['weekend_days'])),
+        start_hour=config['business_hours_start'],
+        end_hour=config['business_hours_end'],
+        business_hours_start=f"{config['business_hours_start']:02d}:00",
+        business_hours_end=f"{config['business_hours_end']:02d}:00",
+        weekdays_config=", ".join(weekday_names),
+        weekday_names=weekday_names,
+        weekend_names=tuple(DAY_NAMES[i] for i in sorted(config['weekend_days'])),
+        holiday_first_year=holiday_first_year,
+        holiday_years=holiday_years,
+        annual_holidays=annual_holidays,
+        holidays=tuple(holidays)
+    )
+
+
+def business_config_response(country_code: str, compiled: CompiledBusinessConfig, is_configured: bool,
+                             version: str):
+    """Response body for /business-config/{country_code}"""
+    return {
+        "country_code": country_code,
+        "weekdays": list(compiled.weekday_names),
+        "weekend_days": list(compiled.weekend_names),
+        "business_hours": f"{compiled.business_hours_start} - {compiled.business_hours_end}",
+        "business_hours_start": compiled.start_hour,
+        "business_hours_end": compiled.end_hour,
+        "is_configured": is_configured,
+        "holidays": list(compiled.holidays),
+        "config_version": version
+    }
+
+
+class BusinessConfigSet:
+    """
+    One loaded version of the business config file, compiled, with the
+    /business-config and /supported-countries bodies precomputed. Never
+    modified: a reload builds a new set and swaps it in.
+    """
+
+    def __init__(self, document: dict, version: str):
+        if not isinstance(document, dict) or not isinstance(document.get("countries"), dict):
+            raise ValueError('Business config needs a "countries" object')
+        self.version = version
+        self.countries = {}
+        for country_code, config in document["countries"].items():
+            try:
+                self.countries[country_code] = compile_business_config(config)
+            except (ValueError, TypeError) as e:
+                raise ValueError(f"{country_code}: {e}") from None
+        try:
+            self.default = compile_business_config(document.get("default", {}))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"default: {e}") from None
+
+        self.responses = {
+            country_code: business_config_response(country_code, compiled, True, version)
+            for country_code, compiled in self.countries.items()
+        }
+        self.supported_countries = {
+            "total_countries": len(self.countries),
+            "countries": [
+                {
+                    "country_code": country_code,
+                    "weekdays": compiled.weekdays_config,
+                    "business_hours": f"{compiled.business_hours_start}-{compiled.business_hours_end}"
+                }
+                for country_code, compiled in sorted(self.countries.items())
+            ],
+            "config_version": version
+        }
+
+    def get(self, country_code: str) -> CompiledBusinessConfig:
+        return self.countries.get(country_code, self.default)
+
+
+def file_signature(path: str):
+    """Cheap change check for a file: (inode, size, mtime)"""
+    stat = os.stat(path)
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
 
 
-def get_business_config(country_code: str):
-    """Get business hours configuration for a country"""
-    return COUNTRY_BUSINESS_CONFIG.get(country_code, DEFAULT_BUSINESS_CONFIG)
+def load_business_configs(path: str) -> BusinessConfigSet:
+    """Read and compile the business config file; raises OSError or ValueError"""
+    with open(path, "rb") as f:
+        content = f.read()
+    document = json.loads(content)
+    version = document.get("version") if isinstance(document, dict) else None
+    # Without a declared version, the content identifies it
+    if not isinstance(version, str) or not version:
+        version = "sha256:" + hashlib.sha256(content).hexdigest()[:12]
+    return BusinessConfigSet(document, version)
 
 
-def get_time_info(parsed_number, region_code: str):
-    """Get timezone and current time information for a phone number"""
+_business_configs = load_business_configs(BUSINESS_CONFIG_PATH)
+_business_config_signature = file_signature(BUSINESS_CONFIG_PATH)
+_business_config_next_check = time.monotonic() + BUSINESS_CONFIG_RELOAD_INTERVAL
+_business_config_reload_lock = threading.Lock()
+
+business_config_state = {
+    "path": BUSINESS_CONFIG_PATH,
+    "version": _business_configs.version,
+    "loaded_at": time.time(),
+    "reloads": 0,
+    "last_error": None
+}
+
+
+def reload_business_configs():
+    """
+    Load the config file again if it changed since the last load. A file that
+    fails to load leaves the current config active until it is fixed.
+    """
+    global _business_configs, _business_config_signature
+    try:
+        signature = file_signature(BUSINESS_CONFIG_PATH)
+        if signature == _business_config_signature:
+            return
+        configs = load_business_configs(BUSINESS_CONFIG_PATH)
+    except (OSError, ValueError) as e:
+        if business_config_state["last_error"] != str(e):
+            print(f"Business config reload failed, keeping {_business_configs.version}: {e}", flush=True)
+        business_config_state["last_error"] = str(e)
+        return
+    # One assignment: requests that already hold the old set finish with it
+    _business_configs = configs
+    _business_config_signature = signature
+    business_config_state.update(version=configs.version, loaded_at=time.time(), last_error=None)
+    business_config_state["reloads"] += 1
+    print(f"Business config reloaded: version {configs.version}", flush=True)
+
+
+def get_business_configs() -> BusinessConfigSet:
+    """
+    The active business config. Every BUSINESS_CONFIG_RELOAD_INTERVAL seconds
+    one caller checks the file for changes; the others never wait on it. Each
+    process (server and batch workers) checks for itself.
+    """
+    global _business_config_next_check
+    if BUSINESS_CONFIG_RELOAD_INTERVAL > 0 and time.monotonic() >= _business_config_next_check:
+        if _business_config_reload_lock.acquire(blocking=False):
+            try:
+                _business_config_next_check = time.monotonic() + BUSINESS_CONFIG_RELOAD_INTERVAL
+                reload_business_configs()
+            finally:
+                _business_config_reload_lock.release()
+    return _business_configs
+
+
+def get_compiled_business_config(country_code: str) -> CompiledBusinessConfig:
+    """Get the precomputed business hours configuration for a country"""
+    return get_business_configs().get(country_code)
+
+
+# pytz zone objects by name; only successful lookups are cached
+_TIMEZONE_CACHE = {}
+
+
+def get_timezone(name: str):
+    tz = _TIMEZONE_CACHE.get(name)
+    if tz is None:
+        tz = pytz.timezone(name)
+        _TIMEZONE_CACHE[name] = tz
+    return tz
+
+
+class LocalTime(NamedTuple):
+    """Local time fields for one timezone at a snapshot's reference instant"""
+    local_time: str
+    local_time_12h: str
+    local_date: str
+    day_of_week: str
+    utc_offset: str
+    weekday: int  # Monday=0, Sunday=6
+    hour: int
+    year: int
+    day_of_year: int  # January 1st=1
+
+
+def reference_instant(at: datetime = None) -> datetime:
+    """Aware UTC datetime for at (naive values are taken as UTC), or now"""
+    if at is None:
+        return datetime.now(pytz.utc)
+    if at.tzinfo is None:
+        return pytz.utc.localize(at)
+    return at.astimezone(pytz.utc)
+
+
+class TimeSnapshot:
+    """
+    Local time fields for a single reference instant, computed once per
+    timezone and shared by every number validated against the snapshot. The
+    business config is pinned too, so a reload never splits one request.
+    """
+
+    def __init__(self, at: datetime = None):
+        self.at = reference_instant(at)
+        self.business_configs = get_business_configs()
+        self._local_times = {}
+        self._time_fields = {}
+
+    def local_time(self, timezone_name: str) -> LocalTime:
+        local = self._local_times.get(timezone_name)
+        if local is None:
+            current_time = self.at.astimezone(get_timezone(timezone_name))
+            utc_offset = current_time.strftime("%z")
+            local = LocalTime(
+                local_time=current_time.strftime("%Y-%m-%d %H:%M:%S"),
+                local_time_12h=current_time.strftime("%I:%M %p"),
+                local_date=current_time.strftime("%Y-%m-%d"),
+                day_of_week=current_time.strftime("%A"),
+                utc_offset=f"{utc_offset[:3]}:{utc_offset[3:]}",
+                weekday=current_time.weekday(),
+                hour=current_time.hour,
+                year=current_time.year,
+                day_of_year=current_time.timetuple().tm_yday
+            )
+            self._local_times[timezone_name] = local
+        return local
+
+    def time_fields(self, timezones: tuple, region_code: str) -> dict:
+        """
+        Time result fields for numbers in timezones with region_code's business
+        config. Built once per distinct pair and shared: do not modify.
+        """
+        key = (timezones, region_code)
+        fields = self._time_fields.get(key)
+        if fields is None:
+            fields = self._time_fields[key] = time_fields_for(timezones, region_code, self)
+        return fields
+
+
+def time_fields_for(timezones: tuple, region_code: str, snapshot: TimeSnapshot) -> dict:
+    """
+    Time result fields for a number in timezones (the first is its primary
+    one) under region_code's business config, at the snapshot's instant
+    """
     time_info = {
         "timezone": None,
         "all_timezones": [],
@@ -276,6 +463,7 @@ def get_time_info(parsed_number, region_code: str):
         "is_business_hours": None,
         "is_weekend": None,
         "is_weekday": None,
+        "is_holiday": None,
         "utc_offset": None,
         "business_hours_start": None,
         "business_hours_end": None,
@@ -283,52 +471,42 @@ def get_time_info(parsed_number, region_code: str):
     }
     
     try:
-        # Get all possible timezones for this number
-        timezones = pn_timezone.time_zones_for_number(parsed_number)
-        
         if timezones:
             time_info["all_timezones"] = list(timezones)
             
             # Use the first timezone (primary timezone for the region)
-            tz = pytz.timezone(timezones[0])
-            current_time = datetime.now(tz)
+            current_time = snapshot.local_time(timezones[0])
             
             time_info["timezone"] = timezones[0]
-            time_info["local_time"] = current_time.strftime("%Y-%m-%d %H:%M:%S")
-            time_info["local_time_12h"] = current_time.strftime("%I:%M %p")
-            time_info["local_date"] = current_time.strftime("%Y-%m-%d")
-            time_info["day_of_week"] = current_time.strftime("%A")
+            time_info["local_time"] = current_time.local_time
+            time_info["local_time_12h"] = current_time.local_time_12h
+            time_info["local_date"] = current_time.local_date
+            time_info["day_of_week"] = current_time.day_of_week
+            time_info["utc_offset"] = current_time.utc_offset
             
-            # UTC offset
-            utc_offset = current_time.strftime("%z")
-            time_info["utc_offset"] = f"{utc_offset[:3]}:{utc_offset[3:]}"
-            
-            # Get business configuration for the country
-            business_config = get_business_config(region_code)
+            # Get precomputed business configuration for the country
+            business_config = snapshot.business_configs.get(region_code)
             
-            # Store business hours info
-            time_info["business_hours_start"] = f"{business_config['business_hours_start']:02d}:00"
-            time_info["business_hours_end"] = f"{business_config['business_hours_end']:02d}:00"
-            
-            # Create readable weekdays string
-            day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-            weekday_names = [day_names[i] for i in sorted(business_config['weekdays'])]
-            time_info["weekdays_config"] = ", ".join(weekday_names)
+            time_info["business_hours_start"] = business_config.business_hours_start
+            time_info["business_hours_end"] = business_config.business_hours_end
+            time_info["weekdays_config"] = business_config.weekdays_config
             
             # Check if current day is a weekend
-            current_weekday = current_time.weekday()  # Monday=0, Sunday=6
-            is_weekend = current_weekday in business_config['weekend_days']
-            is_weekday = current_weekday in business_config['weekdays']
+            weekday_bit = 1 << current_time.weekday
+            is_weekday = bool(business_config.weekday_mask & weekday_bit)
             
-            time_info["is_weekend"] = is_weekend
+            time_info["is_weekend"] = bool(business_config.weekend_mask & weekday_bit)
             time_info["is_weekday"] = is_weekday
             
+            # Public holidays are closed all day; one bitmap lookup
+            is_holiday = business_config.is_holiday(current_time.year, current_time.day_of_year)
+            time_info["is_holiday"] = is_holiday
+            
             # Business hours check
-            is_business_hours = (
-                is_weekday and 
-                business_config['business_hours_start'] <= current_time.hour < business_config['business_hours_end']
+            time_info["is_business_hours"] = (
+                is_weekday and not is_holiday and
+                business_config.start_hour <= current_time.hour < business_config.end_hour
             )
-            time_info["is_business_hours"] = is_business_hours
             
     except Exception as e:
         # If timezone lookup fails, return None values
@@ -337,70 +515,281 @@ def get_time_info(parsed_number, region_code: str):
     return time_info
 
 
-def smart_parse_number(raw_number: str, default_region: str):
+def get_time_info(parsed_number, region_code: str, snapshot: TimeSnapshot = None):
+    """
+    Get timezone and current time information for a phone number. Pass a
+    shared snapshot to pin the reference instant and reuse per-zone work.
+    """
+    try:
+        # Get all possible timezones for this number
+        timezones = tuple(pn_timezone.time_zones_for_number(parsed_number))
+    except Exception:
+        timezones = ()
+    if snapshot is None:
+        snapshot = TimeSnapshot()
+    return dict(snapshot.time_fields(timezones, region_code))
+
+
+# Business-hours windows are precomputed for the reference instant's UTC week
+# plus the days either side that any zone's local week can reach, so the next
+# window after any instant in that week is known unless a number has no window
+# for more than a week
+SCHEDULE_DAYS_BEFORE = 2
+SCHEDULE_DAYS_AFTER = 16
+
+
+def schedule_week_start(at: datetime) -> datetime:
+    """Monday 00:00 UTC of the week containing an aware UTC instant"""
+    day = datetime(at.year, at.month, at.day, tzinfo=pytz.utc)
+    return day - timedelta(days=day.weekday())
+
+
+def local_clock_reaches(tz, wall_time: datetime) -> float:
+    """
+    UTC epoch seconds of the first instant a zone's clock reads wall_time or
+    later: the earlier of a repeated hour, the end of a skipped one
+    """
+    candidates = (tz.normalize(tz.localize(wall_time, is_dst=is_dst)) for is_dst in (True, False))
+    return min(c.timestamp() for c in candidates if c.replace(tzinfo=None) >= wall_time)
+
+
+@functools.lru_cache(maxsize=4096)
+def weekly_schedule(timezone_name: str, config: CompiledBusinessConfig, week_start: datetime):
+    """
+    Business-hours windows of one timezone and config around a UTC week, as
+    (starts, ends) tuples of UTC epoch seconds in ascending order. Local hours
+    are converted per day, so DST changes inside the range are respected,
+    and the config's holidays have no window.
+    """
+    tz = get_timezone(timezone_name)
+    starts, ends = [], []
+    first_day = week_start.date() - timedelta(days=SCHEDULE_DAYS_BEFORE)
+    for offset in range(SCHEDULE_DAYS_BEFORE + SCHEDULE_DAYS_AFTER):
+        day = first_day + timedelta(days=offset)
+        if not config.weekday_mask & (1 << day.weekday()) or config.start_hour >= config.end_hour:
+            continue
+        if config.is_holiday(day.year, day.timetuple().tm_yday):
+            continue
+        midnight = datetime(day.year, day.month, day.day)
+        starts.append(local_clock_reaches(tz, midnight + timedelta(hours=config.start_hour)))
+        ends.append(local_clock_reaches(tz, midnight + timedelta(hours=config.end_hour)))
+    return tuple(starts), tuple(ends)
+
+
+@functools.lru_cache(maxsize=4096)
+def call_schedule(timezone_names: tuple, config: CompiledBusinessConfig, week_start: datetime):
+    """
+    Windows when it is business hours in every one of a number's timezones
+    (the intersection of their weekly schedules), as (starts, ends) tuples.
+    Unknown zone names are ignored; returns None if no known zone remains.
+    """
+    schedules = []
+    for name in timezone_names:
+        try:
+            schedules.append(weekly_schedule(name, config, week_start))
+        except pytz.UnknownTimeZoneError:
+            continue
+    if not schedules:
+        return None
+
+    starts, ends = schedules[0]
+    for other_starts, other_ends in schedules[1:]:
+        merged_starts, merged_ends = [], []
+        i = j = 0
+        while i < len(starts) and j < len(other_starts):
+            start = max(starts[i], other_starts[j])
+            end = min(ends[i], other_ends[j])
+            if start < end:
+                merged_starts.append(start)
+                merged_ends.append(end)
+            if ends[i] < other_ends[j]:
+                i += 1
+            else:
+                j += 1
+        starts, ends = tuple(merged_starts), tuple(merged_ends)
+    return starts, ends
+
+
+def next_call_window(schedule, timestamp: float):
+    """(start, end) of the window in progress at timestamp or the next one, or None"""
+    starts, ends = schedule
+    index = bisect.bisect_right(ends, timestamp)
+    if index == len(ends):
+        return None
+    return starts[index], ends[index]
+
+
+# Regions tried for long numbers without a + prefix, in preference order
+COMMON_COUNTRIES = [
+    'US', 'GB', 'MX', 'BR', 'AU', 'CA', 'DE', 'FR', 'IT', 'ES',
+    'AR', 'CO', 'PE', 'CL', 'CN', 'JP', 'KR', 'ID', 'TH', 'PH',
+    'MY', 'SG', 'VN', 'PK', 'BD', 'RU', 'TR', 'SA', 'AE', 'ZA'
+]
+
+# Per-region index of what a valid national number can look like, built lazily
+_REGION_PARSE_INDEX = {}
+
+
+def get_region_parse_index(region: str):
+    """
+    Precompute (idd_pattern, has_transform_rule, rules) for a region, where
+    rules maps each valid national number length across the region's calling
+    code to the general-description patterns allowing that length.
+    Returns None when phonenumbers has no metadata for the region.
+    """
+    if region in _REGION_PARSE_INDEX:
+        return _REGION_PARSE_INDEX[region]
+
+    metadata = PhoneMetadata.metadata_for_region(region)
+    index = None
+    if metadata is not None:
+        rules = {}
+        for sibling in phonenumbers.region_codes_for_country_code(metadata.country_code):
+            sibling_metadata = PhoneMetadata.metadata_for_region(sibling)
+            if sibling_metadata is None or not sibling_metadata.general_desc.national_number_pattern:
+                continue
+            general_desc = sibling_metadata.general_desc
+            pattern = re.compile(general_desc.national_number_pattern)
+            lengths = general_desc.possible_length or range(2, 18)
+            for length in lengths:
+                rules.setdefault(length, []).append(pattern)
+
+        idd_pattern = re.compile(metadata.international_prefix) if metadata.international_prefix else None
+        index = (
+            idd_pattern,
+            metadata.national_prefix_transform_rule is not None,
+            tuple((length, tuple(patterns)) for length, patterns in sorted(rules.items()))
+        )
+
+    _REGION_PARSE_INDEX[region] = index
+    return index
+
+
+def may_be_valid_for_region(digits: str, region: str) -> bool:
     """
-    Intelligent parsing with multiple strategies including auto-country detection
+    Cheap necessary condition for phonenumbers.parse(digits, region) to give a
+    valid number. Without an IDD prefix or a prefix transform rule, the parsed
+    national number is always a suffix of the input, so some suffix must match
+    a general description of the region's calling code.
     """
-    strategies = []
+    if not digits.isdigit() or not digits.isascii():
+        return True
+    
+    index = get_region_parse_index(region)
+    if index is None:
+        return True
+    
+    idd_pattern, has_transform_rule, rules = index
+    if has_transform_rule or (idd_pattern is not None and idd_pattern.match(digits)):
+        return True
+    
+    total = len(digits)
+    for length, patterns in rules:
+        if length > total:
+            break
+        suffix = digits[total - length:]
+        for pattern in patterns:
+            if pattern.fullmatch(suffix):
+                return True
+    return False
+
+
+def run_parse_strategy(strategy_name: str, number: str, region, known_invalid: bool = False,
+                       attempts: list = None):
+    """
+    Parse a number with one strategy, returning None if phonenumbers rejects it.
+    The strategy name is appended to attempts when a list is given.
+    """
+    if attempts is not None:
+        attempts.append(strategy_name)
+    try:
+        parsed = phonenumbers.parse(number, region)
+        return {
+            "strategy": strategy_name,
+            "parsed": parsed,
+            "valid": not known_invalid and phonenumbers.is_valid_number(parsed),
+            "possible": phonenumbers.is_possible_number(parsed),
+            "region": phonenumbers.region_code_for_number(parsed)
+        }
+    except:
+        return None
+
+
+def smart_parse_number(raw_number: str, default_region: str, attempts: list = None):
+    """
+    Intelligent parsing with multiple strategies including auto-country detection.
+
+    Preference order: a valid as_is/with_plus parse, then a valid with_region
+    parse, then the first valid auto_<country> parse in COMMON_COUNTRIES order,
+    then the first possible parse, then the first parse that succeeded at all.
+    Auto-detection regions that cannot produce a valid number are pruned with
+    may_be_valid_for_region and only parsed if the fallbacks need them.
+    Strategies actually parsed are appended to attempts when a list is given.
+    """
+    has_plus = raw_number.startswith('+')
     
     # Strategy 1: Parse as-is (if has + or clear format)
-    strategies.append(("as_is", raw_number, None))
+    strategies = [("as_is", raw_number, None)]
     
-    # Strategy 2: With default region (domestic)
-    if not raw_number.startswith('+'):
+    if not has_plus:
+        # Strategy 2: With default region (domestic)
         strategies.append(("with_region", raw_number, default_region))
-    
-    # Strategy 3: Add + prefix
-    if not raw_number.startswith('+'):
+        # Strategy 3: Add + prefix
         strategies.append(("with_plus", f"+{raw_number}", None))
     
-    # Strategy 4: Try common countries for long numbers (10+ digits without +)
-    if len(raw_number) >= 10 and not raw_number.startswith('+'):
-        common_countries = [
-            'US', 'GB', 'MX', 'BR', 'AU', 'CA', 'DE', 'FR', 'IT', 'ES',
-            'AR', 'CO', 'PE', 'CL', 'CN', 'JP', 'KR', 'ID', 'TH', 'PH',
-            'MY', 'SG', 'VN', 'PK', 'BD', 'RU', 'TR', 'SA', 'AE', 'ZA'
-        ]
-        
-        for country in common_countries:
-            if country != default_region:  # Skip if already tried
-                strategies.append((f"auto_{country}", raw_number, country))
-    
     results = []
+    with_region_result = None
     
     for strategy_name, number, region in strategies:
-        try:
-            parsed = phonenumbers.parse(number, region)
-            is_valid = phonenumbers.is_valid_number(parsed)
-            is_possible = phonenumbers.is_possible_number(parsed)
-            detected_region = phonenumbers.region_code_for_number(parsed)
-            
-            results.append({
-                "strategy": strategy_name,
-                "parsed": parsed,
-                "valid": is_valid,
-                "possible": is_possible,
-                "region": detected_region
-            })
-            
-            # If found valid result with priority strategies, return immediately
-            if is_valid and strategy_name in ["as_is", "with_plus"]:
-                return results[-1]
-                
-        except:
+        result = run_parse_strategy(strategy_name, number, region, attempts=attempts)
+        if result is None:
             continue
+        results.append(result)
+        
+        # If found valid result with priority strategies, return immediately
+        if result["valid"]:
+            if strategy_name in ["as_is", "with_plus"]:
+                return result
+            with_region_result = result
     
-    # Return best result: valid > possible > any
-    valid_results = [r for r in results if r["valid"]]
-    if valid_results:
-        # Prefer exact matches first
-        for strategy in ["with_region", "as_is", "with_plus"]:
-            match = next((r for r in valid_results if r["strategy"] == strategy), None)
-            if match:
-                return match
-        # Return first valid from auto-detection
-        return valid_results[0]
+    # No later strategy can outrank a valid domestic parse
+    if with_region_result is not None:
+        return with_region_result
     
+    # Strategy 4: Try common countries for long numbers (10+ digits without +)
+    if len(raw_number) >= 10 and not has_plus:
+        # Results in strategy order; None marks a pruned region parsed on demand
+        auto_results = []
+        
+        for country in COMMON_COUNTRIES:
+            if country == default_region:  # Skip if already tried
+                continue
+            
+            strategy_name = f"auto_{country}"
+            if not may_be_valid_for_region(raw_number, country):
+                auto_results.append((strategy_name, country, None))
+                continue
+            
+            result = run_parse_strategy(strategy_name, raw_number, country, attempts=attempts)
+            # Return first valid from auto-detection
+            if result is not None and result["valid"]:
+                return result
+            auto_results.append((strategy_name, country, result))
+        
+        # Nothing valid anywhere, so only a possible parse can change the answer
+        if not any(r["possible"] for r in results):
+            for strategy_name, country, result in auto_results:
+                if result is None:
+                    result = run_parse_strategy(
+                        strategy_name, raw_number, country, known_invalid=True, attempts=attempts
+                    )
+                if result is None:
+                    continue
+                if result["possible"]:
+                    return result
+                results.append(result)
+    
+    # Return best result: possible > any
     possible_results = [r for r in results if r["possible"]]
     if possible_results:
         return possible_results[0]
@@ -411,193 +800,2191 @@ def smart_parse_number(raw_number: str, default_region: str):
     return None
 
 
-@app.post("/validate")
-def validate_phone(data: PhoneRequest):
-    raw = clean_phone_number(data.number)
-    region_hint = data.default_region
-    home_country = data.home_country
+class ValidationCache:
+    """Thread-safe, size-bounded LRU cache with optional TTL"""
 
-    result = {
-        "input": data.number,
-        "cleaned_input": raw,
-        "valid": False,
-        "is_possible": False,
-        "is_domestic": False,
-        "is_international": False,
-        "is_toll_free": False,
-        "is_mobile": False,
-        "formatted_e164": None,
-        "formatted_international": None,
-        "formatted_national": None,
-        "country_code": None,
-        "region": None,
-        "location": None,
-        "carrier": None,
-        "type": None,
-        "reason": None,
-        "parse_strategy": None,
-        # Time-related fields
-        "timezone": None,
-        "all_timezones": [],
-        "local_time": None,
-        "local_time_12h": None,
-        "local_date": None,
-        "day_of_week": None,
-        "is_business_hours": None,
-        "is_weekend": None,
-        "is_weekday": None,
-        "utc_offset": None,
-        "business_hours_start": None,
-        "business_hours_end": None,
-        "weekdays_config": None
-    }
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
 
-    parse_result = smart_parse_number(raw, region_hint)
-    
-    if not parse_result:
-        result["reason"] = "Could not parse number with any strategy"
-        return result
-    
-    parsed = parse_result["parsed"]
-    result["parse_strategy"] = parse_result["strategy"]
-    result["is_possible"] = parse_result["possible"]
-    result["valid"] = parse_result["valid"]
-    
-    if not result["valid"]:
-        result["reason"] = f"Invalid number (tried: {parse_result['strategy']})"
-        return result
+    def get(self, key, count_miss: bool = True):
+        """The cached value or None; probes followed by another lookup pass count_miss=False"""
+        if self.max_size <= 0:
+            return None
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                if count_miss:
+                    self.misses += 1
+                return None
+            value, stored_at = entry
+            if self.ttl > 0 and time.monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                self.expirations += 1
+                if count_miss:
+                    self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
 
-    result["formatted_e164"] = phonenumbers.format_number(
-        parsed, phonenumbers.PhoneNumberFormat.E164
-    )
-    result["formatted_international"] = phonenumbers.format_number(
-        parsed, phonenumbers.PhoneNumberFormat.INTERNATIONAL
-    )
-    result["formatted_national"] = phonenumbers.format_number(
-        parsed, phonenumbers.PhoneNumberFormat.NATIONAL
-    )
+    def put(self, key, value):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._data[key] = (value, time.monotonic())
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
 
-    result["country_code"] = f"+{parsed.country_code}"
-    result["region"] = phonenumbers.region_code_for_number(parsed)
-    result["location"] = geocoder.description_for_number(parsed, "en")
+    def clear(self):
+        with self._lock:
+            self._data.clear()
 
-    result["is_domestic"] = result["region"] == home_country
-    result["is_international"] = result["region"] != home_country
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.max_size > 0,
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
 
-    num_type = number_type(parsed)
-    
-    type_map = {
-        PhoneNumberType.MOBILE: "mobile",
-        PhoneNumberType.FIXED_LINE: "fixed_line",
-        PhoneNumberType.FIXED_LINE_OR_MOBILE: "fixed_or_mobile",
-        PhoneNumberType.TOLL_FREE: "toll_free",
-        PhoneNumberType.PREMIUM_RATE: "premium_rate",
-        PhoneNumberType.SHARED_COST: "shared_cost",
-        PhoneNumberType.VOIP: "voip",
-        PhoneNumberType.PERSONAL_NUMBER: "personal_number",
-        PhoneNumberType.PAGER: "pager",
-        PhoneNumberType.UAN: "uan",
-        PhoneNumberType.VOICEMAIL: "voicemail",
-        PhoneNumberType.UNKNOWN: "unknown"
-    }
-    
-    result["type"] = type_map.get(num_type, "unknown")
-    result["is_toll_free"] = num_type == PhoneNumberType.TOLL_FREE
-    result["is_mobile"] = num_type in [
-        PhoneNumberType.MOBILE, 
-        PhoneNumberType.FIXED_LINE_OR_MOBILE
-    ]
 
-    try:
-        carrier_name = carrier.name_for_number(parsed, "en")
-        result["carrier"] = carrier_name if carrier_name else None
-    except:
-        result["carrier"] = None
+# Cache of the clock-independent part of validation results, keyed by
+# (cleaned number, default_region, home_country). Set max size to 0 to disable.
+VALIDATION_CACHE_MAX_SIZE = int(os.environ.get("VALIDATION_CACHE_MAX_SIZE", "10000"))
+VALIDATION_CACHE_TTL = float(os.environ.get("VALIDATION_CACHE_TTL", "3600"))
 
-    # Get time information with country-specific business hours
-    time_info = get_time_info(parsed, result["region"])
-    result.update(time_info)
+validation_cache = ValidationCache(VALIDATION_CACHE_MAX_SIZE, VALIDATION_CACHE_TTL)
 
-    if result["is_domestic"]:
-        result["reason"] = "Valid domestic number"
-    else:
-        result["reason"] = f"Valid international number ({result['region']})"
 
-    return result
+class SharedValidationCache:
+    """
+    SQLite (WAL) cache of static validation outcomes shared by every worker
+    process on the host and kept across restarts. Lookups never block on
+    writers; a write that can't get the lock in time is skipped. Entries past
+    max_entries are evicted oldest-first every trim_interval writes.
+    """
 
+    def __init__(self, path: str, max_entries: int, ttl: float):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.trim_interval = max(64, max_entries // 100)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes_since_trim = 0
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.errors = 0
+        self._error_logged = False
 
-class BatchPhoneRequest(BaseModel):
-    numbers: list[str]
-    default_region: str = "IN"
-    home_country: str = "IN"
+        # Raises sqlite3.Error when the file can't be opened or set up
+        conn = self._connection()
+        # Workers starting together queue for the schema and fingerprint writes
+        # instead of failing on the lookups' short busy timeout
+        conn.execute(f"PRAGMA busy_timeout={SHARED_CACHE_SETUP_TIMEOUT_MS}")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                result TEXT NOT NULL,
+                parsed TEXT,
+                stored_at REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS results_stored_at ON results (stored_at)")
+        # Results from another phonenumbers release, result layout or prefilter
+        # setting are stale
+        fingerprint = ":".join([
+            str(SHARED_CACHE_FORMAT), phonenumbers.__version__,
+            str(PREFILTER_REJECT_REPEATED), ",".join(RESULT_FIELD_STAGES)
+        ])
+        row = conn.execute("SELECT value FROM meta WHERE name = 'fingerprint'").fetchone()
+        if row is None or row[0] != fingerprint:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Another worker may have reset it while this one waited
+                row = conn.execute("SELECT value FROM meta WHERE name = 'fingerprint'").fetchone()
+                if row is None or row[0] != fingerprint:
+                    conn.execute("DELETE FROM results")
+                    conn.execute("INSERT OR REPLACE INTO meta VALUES ('fingerprint', ?)", (fingerprint,))
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+        conn.execute("PRAGMA busy_timeout=50")
 
+    def _record_error(self, error: sqlite3.Error):
+        with self._lock:
+            self.errors += 1
+            first = not self._error_logged
+            self._error_logged = True
+        if first:
+            # Once per process; later failures only count in stats()["errors"]
+            print(f"Shared validation cache error, continuing without it: {error}", flush=True)
 
-@app.post("/validate-batch")
-def validate_batch(data: BatchPhoneRequest):
-    results = []
-    for num in data.numbers:
-        req = PhoneRequest(
-            number=num,
-            default_region=data.default_region,
-            home_country=data.home_country
-        )
-        results.append(validate_phone(req))
-    
-    valid_results = [r for r in results if r["valid"]]
-    
-    return {
-        "total": len(results),
-        "valid_count": len(valid_results),
-        "invalid_count": len(results) - len(valid_results),
-        "domestic_count": sum(1 for r in valid_results if r["is_domestic"]),
-        "international_count": sum(1 for r in valid_results if r["is_international"]),
-        "toll_free_count": sum(1 for r in valid_results if r["is_toll_free"]),
-        "mobile_count": sum(1 for r in valid_results if r["is_mobile"]),
-        "results": results
-    }
+    def _connection(self):
+        # One connection per thread, reopened after a fork
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=0.05, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _stages_key(stages: frozenset) -> str:
+        return ",".join(sorted(stages))
 
-@app.get("/")
-def health_check():
-    return {"status": "ok", "service": "Phone Validator API"}
+    def _key(self, key) -> str:
+        # Cleaned numbers never contain \x1f: it is whitespace and gets stripped
+        raw, region, home_country, stages = key
+        return f"{raw}\x1f{region}\x1f{home_country}\x1f{self._stages_key(stages)}"
 
+    def get(self, key):
+        """(static result, parsed) stored under a ValidationCache key, or None"""
+        try:
+            row = self._connection().execute(
+                "SELECT result, parsed, stored_at FROM results WHERE key = ?", (self._key(key),)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._record_error(e)
+            return None
+        if row is None or (self.ttl > 0 and time.time() - row[2] > self.ttl):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        parsed = None
+        if row[1] is not None:
+            country_code, national_number, italian_leading_zero, leading_zeros = json.loads(row[1])
+            parsed = phonenumbers.PhoneNumber(
+                country_code=country_code,
+                national_number=national_number,
+                italian_leading_zero=italian_leading_zero,
+                number_of_leading_zeros=leading_zeros
+            )
+        return json.loads(row[0]), parsed
 
-@app.get("/business-config/{country_code}")
-def get_country_business_config(country_code: str):
-    """Get business hours configuration for a specific country"""
-    config = get_business_config(country_code.upper())
+    def put(self, key, value):
+        result, parsed = value
+        if parsed is not None:
+            parsed = json.dumps([parsed.country_code, parsed.national_number,
+                                 parsed.italian_leading_zero, parsed.number_of_leading_zeros])
+        try:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (self._key(key), json.dumps(result, ensure_ascii=False), parsed, time.time())
+            )
+        except sqlite3.Error as e:
+            self._record_error(e)
+            return
+        with self._lock:
+            self.writes += 1
+            self._writes_since_trim += 1
+            trim = self._writes_since_trim >= self.trim_interval
+            if trim:
+                self._writes_since_trim = 0
+        if trim:
+            self.trim()
+
+    def trim(self):
+        """Drop expired entries, then the oldest ones beyond max_entries"""
+        try:
+            conn = self._connection()
+            evicted = 0
+            if self.ttl > 0:
+                evicted += conn.execute("DELETE FROM results WHERE stored_at < ?",
+                                        (time.time() - self.ttl,)).rowcount
+            excess = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] - self.max_entries
+            if excess > 0:
+                evicted += conn.execute(
+                    "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY stored_at LIMIT ?)",
+                    (excess,)
+                ).rowcount
+        except sqlite3.Error as e:
+            self._record_error(e)
+            return
+        with self._lock:
+            self.evictions += evicted
+
+    def stats(self):
+        try:
+            size = self._connection().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        except sqlite3.Error:
+            size = None
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": True,
+                "path": self.path,
+                "size": size,
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "errors": self.errors,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+# Optional second cache level shared by all workers: a SQLite file checked on
+# in-process cache misses. Empty SHARED_CACHE_PATH disables it; counters in
+# stats() are per process.
+SHARED_CACHE_PATH = os.environ.get("SHARED_CACHE_PATH", "")
+SHARED_CACHE_MAX_ENTRIES = int(os.environ.get("SHARED_CACHE_MAX_ENTRIES", "1000000"))
+SHARED_CACHE_TTL = float(os.environ.get("SHARED_CACHE_TTL", "86400"))
+# Bump when validate_static's output changes for the same input
+SHARED_CACHE_FORMAT = 2
+SHARED_CACHE_SETUP_TIMEOUT_MS = 5000
+
+_shared_cache = None
+_shared_cache_error = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_cache():
+    """
+    Lazily open the shared result cache, or return None if disabled or it
+    could not be opened (validation carries on with the in-process cache)
+    """
+    global _shared_cache, _shared_cache_error
+    if not SHARED_CACHE_PATH or _shared_cache_error is not None:
+        return None
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None and _shared_cache_error is None:
+                try:
+                    _shared_cache = SharedValidationCache(
+                        SHARED_CACHE_PATH, SHARED_CACHE_MAX_ENTRIES, SHARED_CACHE_TTL
+                    )
+                except sqlite3.Error as e:
+                    _shared_cache_error = str(e)
+                    print(f"Shared validation cache disabled, cannot open {SHARED_CACHE_PATH}: {e}", flush=True)
+    return _shared_cache
+
+class Histogram:
+    """Fixed-bucket histogram rendered in Prometheus text format"""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def render(self, name: str, labels: str = ""):
+        with self._lock:
+            counts = list(self.counts)
+            total, count = self.sum, self.count
+        prefix = f"{labels}," if labels else ""
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            lines.append(f'{name}_bucket{{{prefix}le="{bound:g}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {count}')
+        suffix = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{suffix} {total!r}")
+        lines.append(f"{name}_count{suffix} {count}")
+        return lines
+
+
+STAGE_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.1)
+PARSE_ATTEMPT_BUCKETS = (1, 2, 3, 5, 10, 20, 33)
+
+
+class ValidationMetrics:
+    """Per-stage latency histograms and parse strategy counters for /metrics"""
+
+    def __init__(self):
+        self.stages = {}
+        self.strategy_wins = {}
+        self.rejections = {}
+        self.parse_attempts = Histogram(PARSE_ATTEMPT_BUCKETS)
+        self._lock = threading.Lock()
+
+    def observe_stage(self, stage: str, seconds: float):
+        histogram = self.stages.get(stage)
+        if histogram is None:
+            with self._lock:
+                histogram = self.stages.setdefault(stage, Histogram(STAGE_BUCKETS))
+        histogram.observe(seconds)
+
+    def observe_parse(self, strategy, attempts: int):
+        strategy = strategy or "none"
+        with self._lock:
+            self.strategy_wins[strategy] = self.strategy_wins.get(strategy, 0) + 1
+        self.parse_attempts.observe(attempts)
+
+    def observe_rejection(self, code: str):
+        with self._lock:
+            self.rejections[code] = self.rejections.get(code, 0) + 1
+
+    def render(self):
+        lines = [
+            "# HELP phone_validator_stage_seconds Time spent in each validation stage.",
+            "# TYPE phone_validator_stage_seconds histogram",
+        ]
+        for stage, histogram in sorted(self.stages.items()):
+            lines.extend(histogram.render("phone_validator_stage_seconds", f'stage="{stage}"'))
+        lines.extend([
+            "# HELP phone_validator_parse_strategy_total Winning parse strategy per parsed number.",
+            "# TYPE phone_validator_parse_strategy_total counter",
+        ])
+        with self._lock:
+            wins = sorted(self.strategy_wins.items())
+        for strategy, count in wins:
+            lines.append(f'phone_validator_parse_strategy_total{{strategy="{strategy}"}} {count}')
+        lines.extend([
+            "# HELP phone_validator_parse_attempts Parse strategies attempted per number.",
+            "# TYPE phone_validator_parse_attempts histogram",
+        ])
+        lines.extend(self.parse_attempts.render("phone_validator_parse_attempts"))
+        lines.extend([
+            "# HELP phone_validator_prefilter_rejections_total Inputs rejected before parsing, by reason.",
+            "# TYPE phone_validator_prefilter_rejections_total counter",
+        ])
+        with self._lock:
+            rejections = sorted(self.rejections.items())
+        for code, count in rejections:
+            lines.append(f'phone_validator_prefilter_rejections_total{{reason="{code}"}} {count}')
+        return lines
+
+
+class StageTimer:
+    """Times consecutive stages of one validation into ValidationMetrics"""
+    __slots__ = ("metrics", "last")
+
+    def __init__(self, metrics: ValidationMetrics):
+        self.metrics = metrics
+        self.last = time.perf_counter()
+
+    def restart(self):
+        self.last = time.perf_counter()
+
+    def mark(self, stage: str):
+        now = time.perf_counter()
+        self.metrics.observe_stage(stage, now - self.last)
+        self.last = now
+
+
+# Stage timing costs a few perf_counter calls per number; set METRICS_ENABLED=0
+# to skip it entirely. Counters are per process (batch pool workers not included).
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "1") == "1"
+
+validation_metrics = ValidationMetrics()
+
+
+PHONE_TYPE_MAP = {
+    PhoneNumberType.MOBILE: "mobile",
+    PhoneNumberType.FIXED_LINE: "fixed_line",
+    PhoneNumberType.FIXED_LINE_OR_MOBILE: "fixed_or_mobile",
+    PhoneNumberType.TOLL_FREE: "toll_free",
+    PhoneNumberType.PREMIUM_RATE: "premium_rate",
+    PhoneNumberType.SHARED_COST: "shared_cost",
+    PhoneNumberType.VOIP: "voip",
+    PhoneNumberType.PERSONAL_NUMBER: "personal_number",
+    PhoneNumberType.PAGER: "pager",
+    PhoneNumberType.UAN: "uan",
+    PhoneNumberType.VOICEMAIL: "voicemail",
+    PhoneNumberType.UNKNOWN: "unknown"
+}
+
+
+# Optional enrichment stages. Parsing, E.164 formatting, country code, region
+# and domestic/international flags always run; everything else can be skipped.
+ENRICHMENT_STAGES = frozenset({"format", "type", "location", "carrier", "time"})
+
+TIME_FIELDS = (
+    "timezone", "all_timezones", "local_time", "local_time_12h", "local_date", "day_of_week",
+    "is_business_hours", "is_weekend", "is_weekday", "is_holiday", "utc_offset",
+    "business_hours_start", "business_hours_end", "weekdays_config"
+)
+
+# Every key of a validation result, in response order, mapped to the stage that
+# fills it (None for the always-on core)
+RESULT_FIELD_STAGES = {
+    "input": None,
+    "cleaned_input": None,
+    "valid": None,
+    "is_possible": None,
+    "is_domestic": None,
+    "is_international": None,
+    "is_toll_free": "type",
+    "is_mobile": "type",
+    "formatted_e164": None,
+    "formatted_international": "format",
+    "formatted_national": "format",
+    "country_code": None,
+    "region": None,
+    "location": "location",
+    "carrier": "carrier",
+    "type": "type",
+    "reason": None,
+    "parse_strategy": None,
+    "rejection": None,
+    **{field: "time" for field in TIME_FIELDS}
+}
+
+
+def stages_for_fields(fields) -> frozenset:
+    """Enrichment stages needed to fill fields; raises ValueError on unknown names"""
+    unknown = [field for field in fields if field not in RESULT_FIELD_STAGES]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return frozenset(RESULT_FIELD_STAGES[field] for field in fields) - {None}
+
+
+# Directory of compiled geocoder/carrier tries (see prefix_trie.py). Empty uses
+# phonenumbers' own lookups. Build them at deploy time with
+# "python prefix_trie.py DIR"; missing or outdated tries are otherwise built in
+# the background at startup, with the stock lookups answering meanwhile and
+# for good if the build fails.
+PREFIX_TRIE_DIR = os.environ.get("PREFIX_TRIE_DIR", "")
+
+_compiled_lookups = None
+_compiled_lookups_error = None
+_compiled_lookups_lock = threading.Lock()
+
+
+def get_compiled_lookups():
+    """
+    The compiled English lookups, or None if disabled, failed or still being
+    built. Never waits for another thread's build.
+    """
+    global _compiled_lookups, _compiled_lookups_error
+    if not PREFIX_TRIE_DIR or _compiled_lookups_error is not None:
+        return None
+    if _compiled_lookups is None:
+        if not _compiled_lookups_lock.acquire(blocking=False):
+            return None
+        try:
+            if _compiled_lookups is None and _compiled_lookups_error is None:
+                if not prefix_trie.is_current(PREFIX_TRIE_DIR, "en"):
+                    # In a child process, so this one never holds the ~100 MB source dicts
+                    subprocess.run([sys.executable, prefix_trie.__file__, PREFIX_TRIE_DIR, "--langs", "en"],
+                                   check=True)
+                _compiled_lookups = prefix_trie.CompiledLookups(PREFIX_TRIE_DIR, "en")
+        except (OSError, ValueError, subprocess.SubprocessError) as e:
+            # Remembered, so requests don't retry the build; fixing it takes a restart
+            _compiled_lookups_error = str(e)
+            print(f"Compiled prefix tries unavailable, using phonenumbers' lookups: {e}", flush=True)
+        finally:
+            _compiled_lookups_lock.release()
+    return _compiled_lookups
+
+
+def lookup_location(parsed, num_type=None) -> str:
+    """English geocoder description for a parsed number"""
+    compiled = get_compiled_lookups()
+    if compiled is not None:
+        return compiled.description_for_number(parsed, num_type)
+    # Imported on first use: loading phonenumbers.geodata takes ~0.5 s
+    from phonenumbers import geocoder
+    return geocoder.description_for_number(parsed, "en")
+
+
+def lookup_carrier(parsed, num_type=None) -> str:
+    """English carrier name for a parsed number ("" when unknown)"""
+    compiled = get_compiled_lookups()
+    if compiled is not None:
+        return compiled.name_for_number(parsed, num_type)
+    from phonenumbers import carrier
+    return carrier.name_for_number(parsed, "en")
+
+
+def new_static_result(raw: str) -> dict:
+    """Static result fields with their defaults, as for a number that fails validation"""
+    return {
+        "cleaned_input": raw,
+        "valid": False,
+        "is_possible": False,
+        "is_domestic": False,
+        "is_international": False,
+        "is_toll_free": False,
+        "is_mobile": False,
+        "formatted_e164": None,
+        "formatted_international": None,
+        "formatted_national": None,
+        "country_code": None,
+        "region": None,
+        "location": None,
+        "carrier": None,
+        "type": None,
+        "reason": None,
+        "parse_strategy": None,
+        "rejection": None,
+        # Time-related fields
+        "timezone": None,
+        "all_timezones": [],
+        "local_time": None,
+        "local_time_12h": None,
+        "local_date": None,
+        "day_of_week": None,
+        "is_business_hours": None,
+        "is_weekend": None,
+        "is_weekday": None,
+        "is_holiday": None,
+        "utc_offset": None,
+        "business_hours_start": None,
+        "business_hours_end": None,
+        "weekdays_config": None
+    }
+
+
+def validate_static(raw: str, region_hint: str, home_country: str,
+                    stages: frozenset = ENRICHMENT_STAGES):
+    """
+    Parse, format and look up everything about a cleaned number that does not
+    depend on the current time, running only the enrichment stages given.
+    Returns (result, parsed) where parsed is None unless the number is valid.
+    """
+    result = new_static_result(raw)
+
+    timer = StageTimer(validation_metrics) if METRICS_ENABLED else None
+
+    rejection = prefilter_number(raw)
+    if rejection is not None:
+        result["rejection"] = rejection
+        result["reason"] = PREFILTER_REASONS[rejection]
+        if timer:
+            timer.mark("prefilter")
+            validation_metrics.observe_rejection(rejection)
+        return result, None
+
+    attempts = [] if timer else None
+    if timer:
+        timer.mark("prefilter")
+
+    parse_result = smart_parse_number(raw, region_hint, attempts)
     
-    day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-    weekday_names = [day_names[i] for i in sorted(config['weekdays'])]
-    weekend_names = [day_names[i] for i in sorted(config['weekend_days'])]
+    if timer:
+        timer.mark("parse")
+        validation_metrics.observe_parse(parse_result["strategy"] if parse_result else None, len(attempts))
     
+    if not parse_result:
+        result["reason"] = "Could not parse number with any strategy"
+        return result, None
+    
+    parsed = parse_result["parsed"]
+    result["parse_strategy"] = parse_result["strategy"]
+    result["is_possible"] = parse_result["possible"]
+    result["valid"] = parse_result["valid"]
+    
+    if not result["valid"]:
+        result["reason"] = f"Invalid number (tried: {parse_result['strategy']})"
+        return result, None
+
+    result["formatted_e164"] = phonenumbers.format_number(
+        parsed, phonenumbers.PhoneNumberFormat.E164
+    )
+    if "format" in stages:
+        result["formatted_international"] = phonenumbers.format_number(
+            parsed, phonenumbers.PhoneNumberFormat.INTERNATIONAL
+        )
+        result["formatted_national"] = phonenumbers.format_number(
+            parsed, phonenumbers.PhoneNumberFormat.NATIONAL
+        )
+
+    result["country_code"] = f"+{parsed.country_code}"
+    # smart_parse_number already ran region_code_for_number on this parse
+    result["region"] = parse_result["region"]
+    if timer:
+        timer.mark("format")
+
+    result["is_domestic"] = result["region"] == home_country
+    result["is_international"] = result["region"] != home_country
+
+    # The geocoder and carrier lookups reuse this type rather than recomputing it
+    num_type = None
+    if "type" in stages:
+        num_type = number_type(parsed)
+        
+        result["type"] = PHONE_TYPE_MAP.get(num_type, "unknown")
+        result["is_toll_free"] = num_type == PhoneNumberType.TOLL_FREE
+        result["is_mobile"] = num_type in [
+            PhoneNumberType.MOBILE, 
+            PhoneNumberType.FIXED_LINE_OR_MOBILE
+        ]
+        if timer:
+            timer.mark("number_type")
+
+    if "location" in stages:
+        result["location"] = lookup_location(parsed, num_type)
+        if timer:
+            timer.mark("geocode")
+
+    if "carrier" in stages:
+        try:
+            carrier_name = lookup_carrier(parsed, num_type)
+            result["carrier"] = carrier_name if carrier_name else None
+        except:
+            result["carrier"] = None
+        if timer:
+            timer.mark("carrier")
+
+    if "time" in stages:
+        # Timezones depend only on the number, so they are cached with it; the
+        # local time fields are filled in per snapshot by validate_record
+        try:
+            result["all_timezones"] = list(pn_timezone.time_zones_for_number(parsed))
+        except Exception:
+            pass
+        if timer:
+            timer.mark("timezones")
+
+    if result["is_domestic"]:
+        result["reason"] = "Valid domestic number"
+    else:
+        result["reason"] = f"Valid international number ({result['region']})"
+
+    return result, parsed
+
+
+class ValidationLane:
+    """
+    Dedicated executor for one class of validation work, with admission
+    control: once max_pending calls or streams are queued or running, new ones
+    get a 503.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_pending: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"validate-{name}")
+        # Only touched from the event loop thread
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def admit(self):
+        """Raise a 503 if the lane is saturated"""
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=503,
+                detail=f"Server busy: {self.name} validation queue is full",
+                headers={"Retry-After": "1"}
+            )
+
+    def acquire(self):
+        """
+        Admit work that spans several run() calls, such as a stream, and hold
+        one pending slot for it until release()
+        """
+        self.admit()
+        self.pending += 1
+
+    def release(self):
+        self.pending -= 1
+
+    async def run(self, func, *args, admit: bool = True):
+        """
+        Run func(*args) on this lane's executor without blocking the event loop.
+        With admit=False the caller already holds a slot from acquire().
+        """
+        if admit:
+            self.acquire()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, functools.partial(func, *args))
+        finally:
+            if admit:
+                self.release()
+            self.completed += 1
+
+    def stats(self):
+        return {
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected
+        }
+
+
+# Single-number requests and batch/stream work run on separate executors so a
+# few large batches cannot queue ahead of interactive /validate calls.
+INTERACTIVE_WORKERS = int(os.environ.get("INTERACTIVE_WORKERS", "4"))
+INTERACTIVE_MAX_PENDING = int(os.environ.get("INTERACTIVE_MAX_PENDING", "256"))
+BULK_WORKERS = int(os.environ.get("BULK_WORKERS", "2"))
+BULK_MAX_PENDING = int(os.environ.get("BULK_MAX_PENDING", "8"))
+
+interactive_lane = ValidationLane("interactive", INTERACTIVE_WORKERS, INTERACTIVE_MAX_PENDING)
+bulk_lane = ValidationLane("bulk", BULK_WORKERS, BULK_MAX_PENDING)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key onto one in-flight task, so
+    a burst of identical requests does the work once. Event loop only.
+    """
+
+    def __init__(self):
+        self._tasks = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def run(self, key, make_coroutine):
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(make_coroutine())
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+            self.started += 1
+        else:
+            self.coalesced += 1
+        # One caller going away must not cancel the others' result
+        return await asyncio.shield(task)
+
+    def stats(self):
+        return {"in_flight": len(self._tasks), "started": self.started, "coalesced": self.coalesced}
+
+
+validate_single_flight = SingleFlight()
+
+
+# Time fields of results without any: leaves the static defaults, but never
+# timezones cached by a fuller-stage lookup of the same number
+NO_TIME_FIELDS = {"all_timezones": []}
+
+
+class ValidationRecord:
+    """
+    One validation result, held as references to its cached static fields and
+    its snapshot's shared time fields rather than a ~30-key dict of its own.
+    record[field] reads a field; to_dict() builds the response object.
+    """
+    __slots__ = ("input", "static", "time")
+
+    def __init__(self, number: str, static: dict, time_fields: dict):
+        self.input = number
+        self.static = static
+        self.time = time_fields
+
+    def __getitem__(self, field: str):
+        if field == "input":
+            return self.input
+        if field in self.time:
+            return self.time[field]
+        return self.static[field]
+
+    def with_input(self, number: str) -> "ValidationRecord":
+        return ValidationRecord(number, self.static, self.time)
+
+    def to_dict(self) -> dict:
+        # Time keys are already in static, so they keep their response position
+        return {"input": self.input, **self.static, **self.time}
+
+    def project(self, fields) -> dict:
+        """Only the given keys, in the given order (all when fields is None)"""
+        if fields is None:
+            return self.to_dict()
+        return {field: self[field] for field in fields}
+
+
+def validate_record(number: str, default_region: str = "IN", home_country: str = "IN",
+                    snapshot: TimeSnapshot = None, stages: frozenset = ENRICHMENT_STAGES) -> ValidationRecord:
+    """
+    Validate a single raw number; shared by the single and batch endpoints.
+    Enrichment stages not in stages are skipped and leave their defaults.
+    """
+    timer = StageTimer(validation_metrics) if METRICS_ENABLED else None
+    raw = clean_phone_number(number)
+    if timer:
+        timer.mark("clean")
+    
+    # A cached full result also serves requests for fewer stages; missing it
+    # then is not a miss of its own, so each call counts one hit or miss
+    partial = stages != ENRICHMENT_STAGES
+    cached = validation_cache.get((raw, default_region, home_country, ENRICHMENT_STAGES), count_miss=not partial)
+    if cached is None and partial:
+        cached = validation_cache.get((raw, default_region, home_country, stages))
+    if cached is None:
+        key = (raw, default_region, home_country, stages)
+        shared_cache = get_shared_cache()
+        if shared_cache is not None:
+            cached = shared_cache.get(key)
+        if cached is None:
+            cached = validate_static(raw, default_region, home_country, stages)
+            if shared_cache is not None:
+                shared_cache.put(key, cached)
+        validation_cache.put(key, cached)
+    static_result, parsed = cached
+
+    if parsed is None or "time" not in stages:
+        return ValidationRecord(number, static_result, NO_TIME_FIELDS)
+
+    # Time fields depend on the clock; only the static part is cached
+    if timer:
+        timer.restart()
+    if snapshot is None:
+        snapshot = TimeSnapshot()
+    time_fields = snapshot.time_fields(tuple(static_result["all_timezones"]), static_result["region"])
+    if timer:
+        timer.mark("time_info")
+
+    return ValidationRecord(number, static_result, time_fields)
+
+
+def validate_number(number: str, default_region: str = "IN", home_country: str = "IN",
+                    snapshot: TimeSnapshot = None, stages: frozenset = ENRICHMENT_STAGES) -> dict:
+    """validate_record's result as a response dict"""
+    return validate_record(number, default_region, home_country, snapshot, stages).to_dict()
+
+
+def requested_stages(fields) -> frozenset:
+    """Enrichment stages for a request's fields (all when None), or a 400"""
+    if fields is None:
+        return ENRICHMENT_STAGES
+    try:
+        return stages_for_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def project_result(result: dict, fields) -> dict:
+    """Keep only the requested keys of a result (all when fields is None)"""
+    if fields is None:
+        return result
+    return {field: result[field] for field in fields}
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson when it is installed (same bytes otherwise)"""
+
+    def render(self, content) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content)
+
+
+class MsgPackResponse(Response):
+    media_type = "application/msgpack"
+
+    def render(self, content) -> bytes:
+        return msgpack.packb(content, use_bin_type=True)
+
+
+MSGPACK_MEDIA_TYPES = {"application/msgpack", "application/x-msgpack", "application/vnd.msgpack"}
+
+
+def negotiate_response_class(accept: str):
+    """
+    Response class for an Accept header: MessagePack when it is the most
+    preferred type offered, JSON otherwise (including for unknown types).
+    """
+    preferences = []
+    for position, media_range in enumerate(accept.split(",")):
+        media_type, *params = [part.strip().lower() for part in media_range.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    pass
+        if quality > 0:
+            preferences.append((-quality, position, media_type))
+    msgpack_unavailable = False
+    for _, _, media_type in sorted(preferences):
+        if media_type in MSGPACK_MEDIA_TYPES:
+            if msgpack is not None:
+                return MsgPackResponse
+            msgpack_unavailable = True
+        elif media_type in ("application/json", "application/*", "*/*"):
+            return FastJSONResponse
+    if msgpack_unavailable:
+        raise HTTPException(status_code=406, detail="MessagePack responses are not available")
+    return FastJSONResponse
+
+
+# Result values that repeat across a batch, replaced by indexes into
+# per-field tables when dictionary encoding is requested
+DICTIONARY_FIELDS = (
+    "country_code", "region", "location", "carrier", "type", "reason", "parse_strategy",
+    "timezone", "day_of_week", "utc_offset", "business_hours_start", "business_hours_end",
+    "weekdays_config"
+)
+
+
+def dictionary_encode(results: list):
+    """
+    Replace non-null values of DICTIONARY_FIELDS with indexes into a lookup
+    table per field; all_timezones entries index the timezone table.
+    Returns (tables, encoded results), leaving out empty tables.
+    """
+    fields = [field for field in DICTIONARY_FIELDS if results and field in results[0]]
+    encode_timezones = bool(results) and "all_timezones" in results[0]
+    if encode_timezones and "timezone" not in fields:
+        fields.append("timezone")
+    tables = {field: [] for field in fields}
+    # field -> value -> index; a new value gets the table's current length
+    indexes = {field: {} for field in fields}
+    columns = [(field, indexes[field], tables[field]) for field in fields]
+    timezone_index, timezone_table = indexes.get("timezone"), tables.get("timezone")
+
+    encoded = []
+    for result in results:
+        row = result.copy()
+        for field, index, table in columns:
+            value = row.get(field)
+            if value is not None:
+                position = index.get(value)
+                if position is None:
+                    position = index[value] = len(table)
+                    table.append(value)
+                row[field] = position
+        if encode_timezones and row["all_timezones"]:
+            positions = []
+            for name in row["all_timezones"]:
+                position = timezone_index.get(name)
+                if position is None:
+                    position = timezone_index[name] = len(timezone_table)
+                    timezone_table.append(name)
+                positions.append(position)
+            row["all_timezones"] = positions
+        encoded.append(row)
+    return {field: values for field, values in tables.items() if values}, encoded
+
+
+def validate_request(data: PhoneRequest, stages: frozenset = ENRICHMENT_STAGES):
+    snapshot = TimeSnapshot(data.at) if data.at is not None else None
+    result = validate_number(data.number, data.default_region, data.home_country, snapshot, stages)
+    return project_result(result, data.fields)
+
+
+@app.post("/validate")
+async def validate_phone(data: PhoneRequest, request: Request):
+    """Validate one number; send Accept: application/msgpack for MessagePack"""
+    stages = requested_stages(data.fields)
+    response_class = negotiate_response_class(request.headers.get("accept", ""))
+    # Concurrent requests for the same cleaned number and options share one validation
+    key = (
+        clean_phone_number(data.number), data.default_region, data.home_country, data.at,
+        tuple(data.fields) if data.fields is not None else None
+    )
+    result = await validate_single_flight.run(
+        key, lambda: interactive_lane.run(validate_request, data, stages)
+    )
+    if result.get("input", data.number) != data.number:
+        result = {**result, "input": data.number}
+    return response_class(result)
+
+
+class BatchPhoneRequest(BaseModel):
+    numbers: list[str]
+    default_region: str = "IN"
+    home_country: str = "IN"
+    # Reference instant shared by every result's time fields (default: now)
+    at: Optional[datetime] = None
+    # Result keys to return for each number (default: all)
+    fields: Optional[list[str]] = None
+    # Emit repeated values once in a "dictionary" and reference them by index
+    dictionary: bool = False
+
+
+# Process pool for large batches (phonenumbers is pure Python and GIL-bound).
+# BATCH_MAX_WORKERS <= 1 keeps batches serial in the request thread.
+BATCH_MAX_WORKERS = int(os.environ.get("BATCH_MAX_WORKERS", "0"))
+BATCH_CHUNK_SIZE = int(os.environ.get("BATCH_CHUNK_SIZE", "500"))
+
+_batch_executor = None
+_batch_executor_lock = threading.Lock()
+
+
+def get_batch_executor():
+    """Lazily start the shared batch process pool, or return None if disabled"""
+    global _batch_executor
+    if BATCH_MAX_WORKERS <= 1:
+        return None
+    with _batch_executor_lock:
+        if _batch_executor is None:
+            # spawn rather than fork: the parent runs server threads holding locks
+            _batch_executor = ProcessPoolExecutor(
+                max_workers=BATCH_MAX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+    return _batch_executor
+
+
+def validate_chunk(numbers: list, default_region: str, home_country: str, at: datetime = None,
+                   stages: frozenset = ENRICHMENT_STAGES):
+    """
+    Validate a chunk of numbers against one time snapshot, so local time fields
+    are computed once per distinct timezone. Runs in batch worker processes.
+    Returns ValidationRecords.
+    """
+    snapshot = TimeSnapshot(at)
+    return [validate_record(number, default_region, home_country, snapshot, stages) for number in numbers]
+
+
+def run_batch(numbers: list, default_region: str, home_country: str,
+              executor=None, chunk_size: int = BATCH_CHUNK_SIZE, at: datetime = None,
+              stages: frozenset = ENRICHMENT_STAGES):
+    """
+    Validate each distinct cleaned input once, fanning chunks out to executor
+    when one is given and the batch is larger than a chunk. Returns
+    ValidationRecords in input order with each one's original "input", and
+    every chunk uses the same reference instant (at, default now).
+    """
+    at = reference_instant(at)
+    # Spellings that differ only in formatting ("+91 98...", "+91-98...")
+    # share a cleaned key and are validated once
+    keys = [clean_phone_number(number) for number in numbers]
+    unique_numbers = list(dict.fromkeys(keys))
+
+    if executor is not None and len(unique_numbers) > chunk_size:
+        futures = [
+            executor.submit(
+                validate_chunk, unique_numbers[i:i + chunk_size], default_region, home_country, at, stages
+            )
+            for i in range(0, len(unique_numbers), chunk_size)
+        ]
+        unique_results = []
+        for future in futures:
+            unique_results.extend(future.result())
+    else:
+        unique_results = validate_chunk(unique_numbers, default_region, home_country, at, stages)
+
+    if len(unique_results) == len(numbers) and keys == numbers:
+        return unique_results
+
+    results_by_key = dict(zip(unique_numbers, unique_results))
+    results = []
+    for number, key in zip(numbers, keys):
+        result = results_by_key[key]
+        if number != key:
+            result = result.with_input(number)
+        results.append(result)
+    return results
+
+
+def new_batch_summary():
+    """Empty aggregate counts reported alongside batch results"""
     return {
-        "country_code": country_code.upper(),
-        "weekdays": weekday_names,
-        "weekend_days": weekend_names,
-        "business_hours": f"{config['business_hours_start']:02d}:00 - {config['business_hours_end']:02d}:00",
-        "business_hours_start": config['business_hours_start'],
-        "business_hours_end": config['business_hours_end'],
-        "is_configured": country_code.upper() in COUNTRY_BUSINESS_CONFIG
+        "total": 0,
+        "valid_count": 0,
+        "invalid_count": 0,
+        "domestic_count": 0,
+        "international_count": 0,
+        "toll_free_count": 0,
+        "mobile_count": 0,
+        "prefilter_rejected_count": 0,
     }
 
 
-@app.get("/supported-countries")
-def get_supported_countries():
-    """Get list of all countries with configured business hours"""
-    countries = []
+def add_to_batch_summary(summary: dict, result: dict):
+    """Fold one validation result into a batch summary"""
+    summary["total"] += 1
+    if not result["valid"]:
+        summary["invalid_count"] += 1
+        if result["rejection"] is not None:
+            summary["prefilter_rejected_count"] += 1
+        return
+    summary["valid_count"] += 1
+    if result["is_domestic"]:
+        summary["domestic_count"] += 1
+    if result["is_international"]:
+        summary["international_count"] += 1
+    if result["is_toll_free"]:
+        summary["toll_free_count"] += 1
+    if result["is_mobile"]:
+        summary["mobile_count"] += 1
+
+
+def summarize_batch(results: list, stages: frozenset = ENRICHMENT_STAGES, duplicates: bool = False):
+    """
+    Aggregate counts reported alongside batch results (ValidationRecords), in
+    one pass. With duplicates, also "duplicates": the positions of results
+    sharing a formatted_e164, for numbers seen more than once.
+    """
+    summary = new_batch_summary()
+    positions = {}
+    for position, result in enumerate(results):
+        # Every counted field is static, so skip the record's field lookup
+        static = result.static
+        add_to_batch_summary(summary, static)
+        if duplicates and static["formatted_e164"] is not None:
+            positions.setdefault(static["formatted_e164"], []).append(position)
+    if "type" not in stages:
+        # Number types were not looked up, so these can't be counted
+        summary["toll_free_count"] = None
+        summary["mobile_count"] = None
+    if duplicates:
+        summary["duplicates"] = {e164: group for e164, group in positions.items() if len(group) > 1}
+    return summary
+
+
+def validate_batch_request(data: BatchPhoneRequest, stages: frozenset = ENRICHMENT_STAGES,
+                           response_class=FastJSONResponse):
+    results = run_batch(
+        data.numbers,
+        data.default_region,
+        data.home_country,
+        executor=get_batch_executor(),
+        at=data.at,
+        stages=stages
+    )
     
-    for country_code, config in sorted(COUNTRY_BUSINESS_CONFIG.items()):
-        day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-        weekday_names = [day_names[i] for i in sorted(config['weekdays'])]
-        
-        countries.append({
-            "country_code": country_code,
-            "weekdays": ", ".join(weekday_names),
-            "business_hours": f"{config['business_hours_start']:02d}:00-{config['business_hours_end']:02d}:00"
-        })
+    response = summarize_batch(results, stages, duplicates=True)
+    # The only place a batch's results become response dicts
+    results = [result.project(data.fields) for result in results]
+    if data.dictionary:
+        # Tables first, so streaming decoders have them before the rows
+        response["dictionary"], results = dictionary_encode(results)
+    response["results"] = results
+    # Serialize on the bulk executor too, keeping large bodies off the event loop
+    return response_class(response)
+
+
+@app.post("/validate-batch")
+async def validate_batch(data: BatchPhoneRequest, request: Request):
+    """Validate many numbers; send Accept: application/msgpack for MessagePack"""
+    stages = requested_stages(data.fields)
+    response_class = negotiate_response_class(request.headers.get("accept", ""))
+    return await bulk_lane.run(validate_batch_request, data, stages, response_class)
+
+
+class CompactBatchRequest(BaseModel):
+    numbers: list[str]
+    default_region: str = "IN"
+    home_country: str = "IN"
+    # Result fields to return as columns; only the stages they need are run
+    fields: list[str] = ["formatted_e164", "valid", "region", "type"]
+    at: Optional[datetime] = None
+
+
+def validate_compact_batch_request(data: CompactBatchRequest, stages: frozenset):
+    results = run_batch(
+        data.numbers,
+        data.default_region,
+        data.home_country,
+        executor=get_batch_executor(),
+        at=data.at,
+        stages=stages
+    )
+
+    response = summarize_batch(results, stages)
+    response["fields"] = data.fields
+    response["columns"] = {field: [result[field] for result in results] for field in data.fields}
+    return JSONResponse(response)
+
+
+@app.post("/validate-batch/compact")
+async def validate_batch_compact(data: CompactBatchRequest):
+    """
+    Column-oriented batch validation: one array per requested field instead of
+    a ~30-key object per number, skipping enrichment stages nobody asked for.
+    """
+    stages = requested_stages(data.fields)
+    return await bulk_lane.run(validate_compact_batch_request, data, stages)
+
+
+class CallWindowRequest(BaseModel):
+    numbers: list[str]
+    default_region: str = "IN"
+    home_country: str = "IN"
+    # Reference instant to schedule from (default: now)
+    at: Optional[datetime] = None
+    # Bucket numbers by when they become callable instead of listing them in order
+    group: bool = False
+
+
+# Call windows only need the number's region and timezones
+CALL_WINDOW_STAGES = frozenset({"time"})
+
+
+def format_timestamp(timestamp):
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, pytz.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def find_call_window(timezone_names: tuple, config: CompiledBusinessConfig, week_start: datetime, now: float):
+    """
+    (start, end, callable_now, formatted start, formatted end, basis) of a
+    number's next window, or None. The window is business hours in all of its
+    timezones ("all_zones") where they overlap; numbers spanning many zones
+    (Russian mobiles, NANP toll-free) often have no such overlap, and then
+    fall back to the primary zone /validate reports ("primary_zone").
+    """
+    for basis, zones in (("all_zones", timezone_names), ("primary_zone", timezone_names[:1])):
+        schedule = call_schedule(zones, config, week_start)
+        window = next_call_window(schedule, now) if schedule else None
+        if window is not None:
+            return (*window, window[0] <= now, format_timestamp(window[0]), format_timestamp(window[1]), basis)
+        if len(timezone_names) == 1:
+            break
+    return None
+
+
+def schedule_call_windows(data: CallWindowRequest, response_class=FastJSONResponse):
+    at = reference_instant(data.at)
+    results = run_batch(
+        data.numbers,
+        data.default_region,
+        data.home_country,
+        executor=get_batch_executor(),
+        at=at,
+        stages=CALL_WINDOW_STAGES
+    )
+
+    now = at.timestamp()
+    week_start = schedule_week_start(at)
+    business_configs = get_business_configs()
+    # Numbers sharing timezones and a business config share a window, so each
+    # distinct one is looked up and formatted once
+    windows = {}
+
+    summary = {"total": len(results), "callable_now_count": 0, "scheduled_count": 0, "unschedulable_count": 0}
+    entries = []
+    for number, result in zip(data.numbers, results):
+        entry = {
+            "input": number,
+            "formatted_e164": result["formatted_e164"],
+            "region": result["region"],
+            "timezones": result["all_timezones"],
+            "callable_now": None,
+            "window_start": None,
+            "window_end": None,
+            "window_basis": None,
+            "reason": None
+        }
+        window = None
+        if result["valid"]:
+            key = (tuple(result["all_timezones"]), result["region"])
+            window = windows.get(key)
+            if window is None and key not in windows:
+                window = windows[key] = find_call_window(
+                    key[0], business_configs.get(result["region"]), week_start, now
+                )
+
+        if window is None:
+            summary["unschedulable_count"] += 1
+            if result["valid"]:
+                entry["reason"] = "No business hours in the number's timezones within a week"
+            else:
+                entry["reason"] = result["reason"]
+        else:
+            _, _, entry["callable_now"], entry["window_start"], entry["window_end"], entry["window_basis"] = window
+            summary["callable_now_count" if entry["callable_now"] else "scheduled_count"] += 1
+        entries.append((entry, window))
+
+    response = {"at": format_timestamp(now), **summary}
+    if not data.group:
+        response["results"] = [entry for entry, _ in entries]
+        return response_class(response)
+
+    groups = {}
+    unschedulable = []
+    for entry, window in entries:
+        if window is None:
+            unschedulable.append(entry)
+        else:
+            groups.setdefault(max(window[0], now), []).append(entry)
+    response["groups"] = [
+        {"callable_from": format_timestamp(callable_from), "count": len(group), "results": group}
+        for callable_from, group in sorted(groups.items())
+    ]
+    response["unschedulable"] = unschedulable
+    return response_class(response)
+
+
+@app.post("/call-windows")
+async def get_call_windows(data: CallWindowRequest, request: Request):
+    """
+    Next business-hours window (UTC) for each number, when it is business
+    hours in all of the number's timezones, or else in its primary timezone
+    (see "window_basis"). With "group": true, numbers are bucketed by the
+    instant they become callable.
+    """
+    response_class = negotiate_response_class(request.headers.get("accept", ""))
+    return await bulk_lane.run(schedule_call_windows, data, response_class)
+
+
+# Lines validated per threadpool hop on the streaming endpoint
+STREAM_CHUNK_SIZE = int(os.environ.get("STREAM_CHUNK_SIZE", "200"))
+# Longest line buffered on the streaming endpoint; a longer one is rejected
+# without being read into memory
+STREAM_MAX_LINE_BYTES = int(os.environ.get("STREAM_MAX_LINE_BYTES", "4096"))
+
+
+def number_from_stream_line(line: str):
+    """
+    Extract the number from one line of a streamed batch: either a plain
+    number, a JSON string, or a JSON object with a "number" key.
+    Returns None for blank lines.
+    """
+    line = line.strip()
+    if not line:
+        return None
+    if line[0] in '{"':
+        try:
+            value = json.loads(line)
+        except ValueError:
+            return line
+        if isinstance(value, dict):
+            value = value.get("number")
+        return "" if value is None else str(value)
+    return line
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse that does not listen for disconnects itself, so the body
+    iterator can keep reading the request stream while the response is sent.
+    on_close is called once the response ends, however it ends.
+    """
+
+    def __init__(self, content, *args, on_close=None, **kwargs):
+        super().__init__(content, *args, **kwargs)
+        self.on_close = on_close
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await self.stream_response(send)
+        finally:
+            if self.on_close is not None:
+                self.on_close()
+
+
+def line_too_long_record(line: bytes) -> ValidationRecord:
+    """The result for a stream line longer than STREAM_MAX_LINE_BYTES, echoing its start"""
+    static_result = new_static_result(None)
+    static_result["rejection"] = "line_too_long"
+    static_result["reason"] = f"Rejected: line longer than {STREAM_MAX_LINE_BYTES} bytes"
+    number = line[:STREAM_MAX_LINE_BYTES].decode("utf-8", errors="replace")
+    return ValidationRecord(number, static_result, NO_TIME_FIELDS)
+
+
+async def iter_stream_numbers(request: Request):
+    """
+    Yield lists of numbers from a newline-delimited request body as it arrives.
+    A line longer than STREAM_MAX_LINE_BYTES is not buffered; its place in the
+    list holds its ValidationRecord (see line_too_long_record) instead.
+    """
+    buffer = b""
+    # Set while dropping the rest of a line already rejected as too long
+    skipping = False
+    pending = []
+    async for body_chunk in request.stream():
+        buffer += body_chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if skipping:
+                skipping = False
+            elif len(line) > STREAM_MAX_LINE_BYTES:
+                pending.append(line_too_long_record(line))
+            else:
+                number = number_from_stream_line(line.decode("utf-8", errors="replace"))
+                if number is not None:
+                    pending.append(number)
+        if len(buffer) > STREAM_MAX_LINE_BYTES:
+            if not skipping:
+                pending.append(line_too_long_record(buffer))
+                skipping = True
+            buffer = b""
+        if len(pending) >= STREAM_CHUNK_SIZE:
+            yield pending
+            pending = []
+    if not skipping:
+        number = number_from_stream_line(buffer.decode("utf-8", errors="replace"))
+        if number is not None:
+            pending.append(number)
+    if pending:
+        yield pending
+
+
+@app.post("/validate-stream")
+async def validate_stream(request: Request, default_region: str = "IN", home_country: str = "IN",
+                          at: datetime = None):
+    """
+    Validate a newline-delimited (plain or NDJSON) body of numbers, emitting one
+    NDJSON result per number as it is produced and a final summary line.
+    Time fields use at, or the instant the stream started. A line longer than
+    STREAM_MAX_LINE_BYTES gets a result with rejection "line_too_long".
+    """
+    # Admission is decided once per stream, which then holds a bulk slot until
+    # it ends; its chunks run in that slot and are never rejected midway
+    bulk_lane.acquire()
+
+    async def generate():
+        summary = new_batch_summary()
+        reference = reference_instant(at)
+        async for items in iter_stream_numbers(request):
+            numbers = [item for item in items if isinstance(item, str)]
+            results = iter(await bulk_lane.run(
+                validate_chunk, numbers, default_region, home_country, reference, admit=False
+            ))
+            lines = []
+            for item in items:
+                result = next(results) if isinstance(item, str) else item
+                add_to_batch_summary(summary, result)
+                lines.append(json.dumps(result.to_dict(), ensure_ascii=False))
+            yield "\n".join(lines) + "\n"
+        yield json.dumps({"summary": summary}) + "\n"
+
+    return DuplexStreamingResponse(generate(), media_type="application/x-ndjson", on_close=bulk_lane.release)
+
+
+# Characters, besides digits, that can appear inside a number PhoneNumberMatcher
+# finds: its punctuation, plus signs, brackets, and what extensions are written
+# with ("ext", "x", "#", ";ext=", ...), matched case-insensitively as it does.
+# Any other character ends every candidate, so each stretch of these around a
+# digit can be matched on its own and still give what the whole text would.
+NUMBER_PUNCTUATION = (r"+\uff0b(\[\uff08\uff3b)\]\uff09\uff3d\-x\u2010-\u2015\u2212\u30fc\uff0d-\uff0f"
+                      r" \xa0\xad\u200b\u2060\u3000./~\u2053\u223c\uff5e\t,;=:#\uff03"
+                      r"aeinostx\u0301\xf3\uff45\uff49\uff4e\uff54\uff58\u0431\u0434\u043e")
+# One such stretch holding a digit, or the stretch the text ends with, which
+# may still grow into a number in the next chunk
+PHONE_SEGMENT = re.compile(rf"(?<![\d{NUMBER_PUNCTUATION}])[{NUMBER_PUNCTUATION}]*(?:\d[\d{NUMBER_PUNCTUATION}]*|\Z)",
+                           re.IGNORECASE)
+# A stretch still open at the end of a chunk is held back whole up to this many
+# characters; in a longer one, numbers ending in its last EXTRACT_CONTEXT
+# characters wait for the next chunk
+EXTRACT_MAX_CARRY = 256
+EXTRACT_CONTEXT = 24
+
+
+def min_national_digits(region: str) -> int:
+    """Fewest digits a valid number written without + can have for a region"""
+    index = get_region_parse_index(region)
+    if index is None or not index[2]:
+        return PREFILTER_MIN_DIGITS
+    return max(index[2][0][0], PREFILTER_MIN_DIGITS)
+
+
+class NumberExtractor:
+    """
+    Incremental phone number finder for text that arrives in chunks. Text is
+    split at characters no number can contain and only stretches with enough
+    digits go through phonenumbers' matcher; a stretch reaching the end of a
+    chunk is held back until the next chunk (or finish) shows where it ends.
+    """
+
+    def __init__(self, region: str):
+        self.region = region
+        self.min_digits = min_national_digits(region)
+        self._buffer = ""
+        # Stream offset of _buffer[0]
+        self._offset = 0
+        # The character before _buffer[0] as the matcher should see it
+        self._lead = ""
+        self.candidates = 0
+
+    def _match(self, buffer: str, start: int, stop: int, lead: str):
+        """[(buffer index, match)] for the numbers in lead + buffer[start:stop]"""
+        segment = buffer[start:stop]
+        digits = sum(map(str.isdigit, segment))
+        if digits < (PREFILTER_MIN_DIGITS if "+" in segment or "\uff0b" in segment else self.min_digits):
+            return []
+        self.candidates += 1
+        matcher = phonenumbers.PhoneNumberMatcher(lead + segment, self.region, leniency=phonenumbers.Leniency.VALID)
+        return [(start - len(lead) + match.start, match) for match in matcher]
+
+    def feed(self, text: str, final: bool = False):
+        """Scan newly arrived text; returns [(offset, raw_number)] found so far"""
+        buffer = self._buffer + text
+        end = len(buffer)
+        resume, lead = end, buffer[-1:] or self._lead
+
+        found = []
+        for segment in PHONE_SEGMENT.finditer(buffer):
+            start, stop = segment.span()
+            before = buffer[start - 1] if start else self._lead
+            if final or stop < end:
+                # The character after the stretch is context for the matcher
+                found += self._match(buffer, start, stop + 1, before)
+                continue
+            if stop - start <= EXTRACT_MAX_CARRY:
+                resume, lead = start, before
+                break
+            # Too long to hold back whole: take numbers ending before the last
+            # EXTRACT_CONTEXT characters now and resume right after the last
+            # of them, as the matcher itself does, unless that would hold back
+            # more than half of EXTRACT_MAX_CARRY again
+            resume = end - EXTRACT_MAX_CARRY // 2
+            for index, match in self._match(buffer, start, stop, before):
+                if index + len(match.raw_string) <= end - EXTRACT_CONTEXT:
+                    found.append((index, match))
+                    resume = max(resume, index + len(match.raw_string))
+            # The matcher sees a blank where it resumes, so the end of the
+            # last number can't start another
+            lead = " "
+
+        found = [(self._offset + index, match.raw_string) for index, match in found]
+        self._buffer = buffer[resume:]
+        self._offset += resume
+        self._lead = lead
+        return found
+
+    def finish(self):
+        return self.feed("", final=True)
+
+
+def extract_chunk(extractor: NumberExtractor, text: str, final: bool, home_country: str,
+                  snapshot: TimeSnapshot):
+    """Find numbers in one chunk of text and validate them like /validate"""
+    results = []
+    for offset, raw in extractor.feed(text, final):
+        result = validate_number(raw, extractor.region, home_country, snapshot)
+        results.append({"offset": offset, **result})
+    return results
+
+
+def extract_numbers(chunks, default_region: str = "IN", home_country: str = "IN", at: datetime = None):
+    """
+    Yield a validation result, with its character "offset" in the stream, for
+    each phone number found in an iterable of text chunks.
+    """
+    extractor = NumberExtractor(default_region)
+    snapshot = TimeSnapshot(at)
+    for chunk in chunks:
+        yield from extract_chunk(extractor, chunk, False, home_country, snapshot)
+    yield from extract_chunk(extractor, "", True, home_country, snapshot)
+
+
+@app.post("/extract")
+async def extract_stream(request: Request, default_region: str = "IN", home_country: str = "IN",
+                         at: datetime = None):
+    """
+    Find phone numbers in a streamed UTF-8 text body, emitting one NDJSON
+    result per number (with its character offset) as the text is scanned and
+    a final summary line. Numbers are those phonenumbers' matcher finds in the
+    whole text, except within a stretch of more than EXTRACT_MAX_CARRY digits
+    and number punctuation (no letters other than those in "ext", "x", etc.)
+    that runs to the end of a body chunk, which is matched in pieces.
+    """
+    # Held for the whole stream, as for /validate-stream
+    bulk_lane.acquire()
+
+    async def generate():
+        extractor = NumberExtractor(default_region)
+        snapshot = TimeSnapshot(at)
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        summary = new_batch_summary()
+        received = 0
+
+        async def scan(text, final):
+            results = await bulk_lane.run(
+                extract_chunk, extractor, text, final, home_country, snapshot, admit=False
+            )
+            lines = []
+            for result in results:
+                add_to_batch_summary(summary, result)
+                lines.append(json.dumps(result, ensure_ascii=False))
+            return "\n".join(lines) + "\n" if lines else ""
+
+        async for body_chunk in request.stream():
+            received += len(body_chunk)
+            output = await scan(decoder.decode(body_chunk), False)
+            if output:
+                yield output
+        output = await scan(decoder.decode(b"", final=True), True)
+        if output:
+            yield output
+        summary["bytes"] = received
+        summary["candidates"] = extractor.candidates
+        yield json.dumps({"summary": summary}) + "\n"
+
+    return DuplexStreamingResponse(generate(), media_type="application/x-ndjson", on_close=bulk_lane.release)
+
+
+# Bulk validation jobs: uploads and results live under JOBS_DIR and job state in
+# SQLite, so queued and running jobs resume from their last checkpoint on restart.
+# Every server process on the host shares the store: a job is run by whichever
+# process claims it, and a process holds its jobs under a lease renewed at each
+# checkpoint. Jobs whose owner has died or whose lease ran out are claimed again.
+JOBS_DIR = os.environ.get("JOBS_DIR", "jobs_data")
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", "1"))
+JOB_CHUNK_SIZE = int(os.environ.get("JOB_CHUNK_SIZE", "1000"))
+JOB_LEASE_SECONDS = float(os.environ.get("JOB_LEASE_SECONDS", "60"))
+# Idle workers look for jobs uploaded to other processes or left by dead ones this often
+JOB_POLL_INTERVAL = float(os.environ.get("JOB_POLL_INTERVAL", "2"))
+
+# Columns added after the jobs table was first released, migrated in place
+JOB_OWNER_COLUMNS = (("owner_pid", "INTEGER"), ("owner_token", "TEXT"), ("lease_until", "REAL"))
+
+
+def process_alive(pid: int) -> bool:
+    """Whether a process exists on this host (the job store is never shared across hosts)"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobStore:
+    """
+    SQLite-backed job state shared by the API and background workers of every
+    server process. Each store is one owner: jobs are claimed and checkpointed
+    under its pid and a token unique to this process's run.
+    """
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self.pid = os.getpid()
+        self.owner_token = uuid.uuid4().hex
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    format TEXT NOT NULL,
+                    column_name TEXT,
+                    has_header INTEGER NOT NULL,
+                    default_region TEXT NOT NULL,
+                    home_country TEXT NOT NULL,
+                    total_rows INTEGER,
+                    rows_done INTEGER NOT NULL DEFAULT 0,
+                    output_bytes INTEGER NOT NULL DEFAULT 0,
+                    rate REAL,
+                    summary TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    updated_at REAL,
+                    finished_at REAL,
+                    owner_pid INTEGER,
+                    owner_token TEXT,
+                    lease_until REAL
+                )
+            """)
+            existing = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+            for name, column_type in JOB_OWNER_COLUMNS:
+                if name in existing:
+                    continue
+                try:
+                    self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {column_type}")
+                except sqlite3.OperationalError as e:
+                    # Another process starting at the same time added it first
+                    if "duplicate column" not in str(e):
+                        raise
+
+    def create(self, job: dict):
+        columns = ", ".join(job)
+        placeholders = ", ".join("?" for _ in job)
+        with self._lock:
+            self._conn.execute(f"INSERT INTO jobs ({columns}) VALUES ({placeholders})", list(job.values()))
+
+    def get(self, job_id: str):
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def claimable(self, job: dict, now: float) -> bool:
+        """Whether an unfinished job is free for this store to take over"""
+        if job["owner_token"] is None:
+            return True
+        if job["owner_token"] == self.owner_token:
+            # Already ours, and being run by one of our threads
+            return False
+        if job["lease_until"] is None or job["lease_until"] < now:
+            return True
+        # Same pid with another token is an earlier run of this process (as
+        # after a container restart); otherwise the owner must have exited
+        return job["owner_pid"] == self.pid or not process_alive(job["owner_pid"])
+
+    def claim_next(self):
+        """Take ownership of the oldest claimable unfinished job; returns its id or None"""
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, owner_pid, owner_token, lease_until FROM jobs "
+                "WHERE status IN ('queued', 'running') ORDER BY created_at"
+            ).fetchall()
+            for row in rows:
+                if not self.claimable(row, now):
+                    continue
+                # Only succeeds if no other process claimed it since the read
+                cursor = self._conn.execute(
+                    "UPDATE jobs SET owner_pid = ?, owner_token = ?, lease_until = ? "
+                    "WHERE id = ? AND status IN ('queued', 'running') AND owner_token IS ?",
+                    (self.pid, self.owner_token, now + JOB_LEASE_SECONDS, row["id"], row["owner_token"])
+                )
+                if cursor.rowcount == 1:
+                    return row["id"]
+        return None
+
+    def checkpoint(self, job_id: str, **fields) -> bool:
+        """
+        update() a job this store owns and renew its lease. Returns False, and
+        changes nothing, if another process has taken the job over.
+        """
+        fields["updated_at"] = time.time()
+        fields["lease_until"] = fields["updated_at"] + JOB_LEASE_SECONDS
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            cursor = self._conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE id = ? AND owner_token = ?",
+                [*fields.values(), job_id, self.owner_token]
+            )
+        return cursor.rowcount == 1
+
+    def release(self, job_id: str):
+        """Give up ownership of an unfinished job so any process can resume it now"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET owner_pid = NULL, owner_token = NULL, lease_until = NULL "
+                "WHERE id = ? AND owner_token = ?",
+                (job_id, self.owner_token)
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+job_store = None
+# Wakes this process's idle workers when a job is uploaded to it; the jobs
+# themselves are claimed from the store
+job_queue = queue.Queue()
+_job_threads = []
+_job_shutdown = threading.Event()
+
+
+def job_input_path(job_id: str) -> str:
+    return os.path.join(JOBS_DIR, f"{job_id}.input")
+
+
+def job_output_path(job_id: str) -> str:
+    return os.path.join(JOBS_DIR, f"{job_id}.ndjson")
+
+
+def start_job_workers():
+    """Open the job store and start background workers, which resume unfinished jobs"""
+    global job_store
+    if job_store is not None:
+        return
+    os.makedirs(JOBS_DIR, exist_ok=True)
+    _job_shutdown.clear()
+    job_store = JobStore(os.path.join(JOBS_DIR, "jobs.sqlite3"))
+    for _ in range(max(JOB_WORKERS, 1)):
+        thread = threading.Thread(target=job_worker, daemon=True)
+        thread.start()
+        _job_threads.append(thread)
+
+
+def stop_job_workers():
+    """Stop background workers after their current chunk; jobs resume on next start"""
+    global job_store
+    if job_store is None:
+        return
+    _job_shutdown.set()
+    for _ in _job_threads:
+        job_queue.put(None)
+    for thread in _job_threads:
+        thread.join(timeout=30)
+    _job_threads.clear()
+    job_store.close()
+    job_store = None
+
+
+def job_worker():
+    while not _job_shutdown.is_set():
+        job_id = job_store.claim_next()
+        if job_id is None:
+            try:
+                job_queue.get(timeout=JOB_POLL_INTERVAL)
+            except queue.Empty:
+                pass
+            continue
+        try:
+            run_job(job_id)
+        except Exception as e:
+            job_store.checkpoint(job_id, status="failed", error=str(e), finished_at=time.time())
+
+
+def iter_job_numbers(job: dict, input_file):
+    """Yield the number from each data row of a job's CSV or NDJSON input"""
+    if job["format"] == "ndjson":
+        for line in input_file:
+            number = number_from_stream_line(line)
+            if number is not None:
+                yield number
+        return
+
+    reader = csv.reader(input_file)
+    column = job["column_name"] or "0"
+    index = int(column) if column.isdigit() else None
+    if job["has_header"]:
+        header = next(reader, None)
+        if header is not None and index is None:
+            names = [name.strip().lower() for name in header]
+            if column.strip().lower() not in names:
+                raise ValueError(f"Column '{column}' not found in CSV header")
+            index = names.index(column.strip().lower())
+    if index is None:
+        raise ValueError(f"Column '{column}' needs a CSV header or a numeric index")
+    for row in reader:
+        if row:
+            yield row[index].strip() if index < len(row) else ""
+
+
+def run_job(job_id: str):
+    """
+    Validate a claimed job's input in chunks, checkpointing progress after
+    each chunk. Stops if another process has taken the job over.
+    """
+    job = job_store.get(job_id)
+    if job is None or job["status"] not in ("queued", "running"):
+        return
+
+    input_path = job_input_path(job_id)
+    if job["total_rows"] is None:
+        with open(input_path, newline="", encoding="utf-8", errors="replace") as input_file:
+            job["total_rows"] = sum(1 for _ in iter_job_numbers(job, input_file))
+
+    run_started_at = time.time()
+    if not job_store.checkpoint(
+        job_id,
+        status="running",
+        total_rows=job["total_rows"],
+        started_at=job["started_at"] or run_started_at
+    ):
+        return
+
+    rows_done = job["rows_done"]
+    # Checkpoints written by older versions may lack newer summary keys
+    summary = {**new_batch_summary(), **json.loads(job["summary"])} if job["summary"] else new_batch_summary()
+    run_rows = 0
+
+    with open(input_path, newline="", encoding="utf-8", errors="replace") as input_file, \
+            open(job_output_path(job_id), "a+b") as output_file:
+        # Drop anything written after the last checkpoint
+        output_file.truncate(job["output_bytes"])
+        output_file.seek(job["output_bytes"])
+
+        numbers = itertools.islice(iter_job_numbers(job, input_file), rows_done, None)
+        while True:
+            chunk = list(itertools.islice(numbers, JOB_CHUNK_SIZE))
+            if not chunk:
+                break
+
+            results = run_batch(chunk, job["default_region"], job["home_country"],
+                                executor=get_batch_executor())
+            lines = []
+            for offset, result in enumerate(results):
+                add_to_batch_summary(summary, result)
+                lines.append(json.dumps({"row": rows_done + offset + 1, **result.to_dict()}, ensure_ascii=False))
+            # Renew the lease before appending, so no other process can have
+            # resumed the job and be writing the same file
+            if not job_store.checkpoint(job_id):
+                return
+            output_file.write(("\n".join(lines) + "\n").encode("utf-8"))
+            output_file.flush()
+            os.fsync(output_file.fileno())
+
+            rows_done += len(results)
+            run_rows += len(results)
+            elapsed = time.time() - run_started_at
+            if not job_store.checkpoint(
+                job_id,
+                rows_done=rows_done,
+                output_bytes=output_file.tell(),
+                summary=json.dumps(summary),
+                rate=run_rows / elapsed if elapsed > 0 else None
+            ):
+                return
+
+            if _job_shutdown.is_set():
+                # Leave the job marked running, free for any process to resume
+                job_store.release(job_id)
+                return
+
+    job_store.checkpoint(job_id, status="completed", summary=json.dumps(summary), finished_at=time.time())
+
+
+def get_job_or_404(job_id: str):
+    job = job_store.get(job_id) if job_store is not None else None
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@app.post("/jobs", status_code=202)
+async def create_job(request: Request, format: str = None, column: str = "number",
+                     has_header: bool = True, default_region: str = "IN", home_country: str = "IN"):
+    """
+    Upload a CSV or NDJSON file as the request body and validate it in the
+    background. Format defaults from the Content-Type (text/csv or NDJSON).
+    """
+    if job_store is None:
+        raise HTTPException(status_code=503, detail="Job workers are not running")
     
+    if format is None:
+        format = "csv" if "csv" in request.headers.get("content-type", "") else "ndjson"
+    if format not in ("csv", "ndjson"):
+        raise HTTPException(status_code=400, detail="format must be 'csv' or 'ndjson'")
+
+    job_id = uuid.uuid4().hex
+    # File and SQLite calls run on the threadpool so a large upload never
+    # blocks the event loop
+    input_path = job_input_path(job_id)
+    input_file = await run_in_threadpool(open, input_path, "wb")
+    try:
+        async for body_chunk in request.stream():
+            await run_in_threadpool(input_file.write, body_chunk)
+    except BaseException:
+        await run_in_threadpool(input_file.close)
+        await run_in_threadpool(os.remove, input_path)
+        raise
+    await run_in_threadpool(input_file.close)
+
+    await run_in_threadpool(job_store.create, {
+        "id": job_id,
+        "status": "queued",
+        "format": format,
+        "column_name": column,
+        "has_header": int(has_header),
+        "default_region": default_region,
+        "home_country": home_country,
+        "created_at": time.time()
+    })
+    job_queue.put(job_id)
+
+    return await run_in_threadpool(get_job_status, job_id)
+
+
+@app.get("/jobs/{job_id}")
+def get_job_status(job_id: str):
+    """Get progress (rows done, rate, ETA) for a bulk validation job"""
+    job = get_job_or_404(job_id)
+
+    total_rows = job["total_rows"]
+    rows_done = job["rows_done"]
+    eta_seconds = None
+    if job["status"] == "running" and total_rows is not None and job["rate"]:
+        eta_seconds = round((total_rows - rows_done) / job["rate"], 1)
+
+    return {
+        "job_id": job_id,
+        "status": job["status"],
+        "format": job["format"],
+        "total_rows": total_rows,
+        "rows_done": rows_done,
+        "percent_done": round(100 * rows_done / total_rows, 2) if total_rows else None,
+        "rows_per_second": round(job["rate"], 1) if job["rate"] else None,
+        "eta_seconds": eta_seconds,
+        "summary": json.loads(job["summary"]) if job["summary"] else None,
+        "error": job["error"],
+        "created_at": format_timestamp(job["created_at"]),
+        "started_at": format_timestamp(job["started_at"]),
+        "finished_at": format_timestamp(job["finished_at"]),
+        "results_url": f"/jobs/{job_id}/results" if job["status"] == "completed" else None
+    }
+
+
+@app.get("/jobs/{job_id}/results")
+def download_job_results(job_id: str):
+    """Download NDJSON results (one line per input row) of a completed job"""
+    job = get_job_or_404(job_id)
+    if job["status"] != "completed":
+        raise HTTPException(status_code=409, detail=f"Job {job_id} is {job['status']}")
+    return FileResponse(
+        job_output_path(job_id),
+        media_type="application/x-ndjson",
+        filename=f"{job_id}.ndjson"
+    )
+
+
+# Startup warm-up. "eager" preloads phonenumbers metadata, parse indexes,
+# geocoder/carrier prefix data and pytz zones for WARMUP_REGIONS in a background
+# thread at startup, and / reports 503 until it finishes. "lazy" skips it and
+# loads everything on first use, keeping import and boot time minimal.
+WARMUP_MODE = os.environ.get("WARMUP_MODE", "eager")
+WARMUP_REGIONS = [
+    region.strip().upper()
+    for region in os.environ.get("WARMUP_REGIONS", ",".join(["IN"] + COMMON_COUNTRIES)).split(",")
+    if region.strip()
+]
+
+warmup_state = {
+    "mode": WARMUP_MODE,
+    "status": "pending" if WARMUP_MODE == "eager" else "skipped",
+    "regions": 0,
+    "timezones": 0,
+    "seconds": None
+}
+
+
+def warm_up(regions: list):
+    """Preload everything the first validation of a number from regions would load"""
+    started = time.perf_counter()
+    warmup_state["status"] = "running"
+    try:
+        preload_regions(regions)
+    except Exception as e:
+        warmup_state["status"] = "failed"
+        print(f"Warm-up failed: {e}", flush=True)
+        return
+    warmup_state["seconds"] = round(time.perf_counter() - started, 3)
+    warmup_state["status"] = "done"
+    print(f"Warm-up finished: {warmup_state['regions']} regions, "
+          f"{warmup_state['timezones']} timezones in {warmup_state['seconds']}s", flush=True)
+
+
+def preload_regions(regions: list):
+    timezone_names = set()
+    snapshot = TimeSnapshot()
+    # First, so the lookups below use the tries rather than loading the stock data
+    get_compiled_lookups()
+
+    for region in regions:
+        if get_region_parse_index(region) is None:
+            continue
+        for type_ in (PhoneNumberType.MOBILE, PhoneNumberType.FIXED_LINE):
+            example = phonenumbers.example_number_for_type(region, type_)
+            if example is None:
+                continue
+            e164 = phonenumbers.format_number(example, phonenumbers.PhoneNumberFormat.E164)
+            parsed = phonenumbers.parse(e164)
+            phonenumbers.is_valid_number(parsed)
+            phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.INTERNATIONAL)
+            phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.NATIONAL)
+            number_type(parsed)
+            lookup_location(parsed)
+            lookup_carrier(parsed)
+            timezone_names.update(pn_timezone.time_zones_for_number(parsed))
+        warmup_state["regions"] += 1
+
+    for name in timezone_names:
+        try:
+            snapshot.local_time(name)
+        except pytz.UnknownTimeZoneError:
+            continue
+        warmup_state["timezones"] += 1
+
+
+def start_warm_up():
+    if WARMUP_MODE == "eager" and warmup_state["status"] == "pending":
+        warmup_state["status"] = "running"
+        threading.Thread(target=warm_up, args=(WARMUP_REGIONS,), daemon=True).start()
+    elif PREFIX_TRIE_DIR:
+        # Open or build the tries off the request path
+        threading.Thread(target=get_compiled_lookups, daemon=True).start()
+
+
+@app.get("/")
+def health_check():
+    # Also picks up a changed business config file, so state below is current
+    get_business_configs()
+    if warmup_state["status"] == "running":
+        return JSONResponse(
+            {"status": "warming_up", "service": "Phone Validator API", "warmup": warmup_state},
+            status_code=503
+        )
+    return {"status": "ok", "service": "Phone Validator API", "warmup": warmup_state,
+            "business_config": business_config_state}
+
+
+@app.get("/cache-stats")
+def get_cache_stats():
+    """Get hit/miss/eviction counters for the validation result caches"""
+    shared_cache = get_shared_cache()
     return {
-        "total_countries": len(countries),
-        "countries": countries
+        **validation_cache.stats(),
+        "shared": shared_cache.stats() if shared_cache is not None else {
+            "enabled": False, "error": _shared_cache_error
+        }
     }
+
+
+@app.get("/executor-stats")
+async def get_executor_stats():
+    """Get queue depth and rejection counters for the validation executors"""
+    return {
+        "interactive": interactive_lane.stats(),
+        "bulk": bulk_lane.stats(),
+        "single_flight": validate_single_flight.stats()
+    }
+
+
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus text-format metrics: stage latencies, parse strategies, cache and executors"""
+    lines = validation_metrics.render() if METRICS_ENABLED else []
+
+    cache_stats = validation_cache.stats()
+    for name in ("hits", "misses", "evictions", "expirations"):
+        lines.append(f"# TYPE phone_validator_cache_{name}_total counter")
+        lines.append(f"phone_validator_cache_{name}_total {cache_stats[name]}")
+    lines.append("# TYPE phone_validator_cache_size gauge")
+    lines.append(f"phone_validator_cache_size {cache_stats['size']}")
+
+    shared_cache = get_shared_cache()
+    if shared_cache is not None:
+        shared_stats = shared_cache.stats()
+        for name in ("hits", "misses", "writes", "evictions", "errors"):
+            lines.append(f"# TYPE phone_validator_shared_cache_{name}_total counter")
+            lines.append(f"phone_validator_shared_cache_{name}_total {shared_stats[name]}")
+        if shared_stats["size"] is not None:
+            lines.append("# TYPE phone_validator_shared_cache_size gauge")
+            lines.append(f"phone_validator_shared_cache_size {shared_stats['size']}")
+
+    lines.append("# TYPE phone_validator_executor_pending gauge")
+    for lane in (interactive_lane, bulk_lane):
+        lines.append(f'phone_validator_executor_pending{{lane="{lane.name}"}} {lane.pending}')
+    lines.append("# TYPE phone_validator_executor_rejected_total counter")
+    for lane in (interactive_lane, bulk_lane):
+        lines.append(f'phone_validator_executor_rejected_total{{lane="{lane.name}"}} {lane.rejected}')
+    lines.append("# TYPE phone_validator_single_flight_coalesced_total counter")
+    lines.append(f"phone_validator_single_flight_coalesced_total {validate_single_flight.coalesced}")
+
+    return PlainTextResponse("\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
+
+
+@app.get("/business-config/{country_code}")
+def get_country_business_config(country_code: str):
+    """Get business hours configuration for a specific country, and the config version in use"""
+    country_code = country_code.upper()
+    configs = get_business_configs()
+    response = configs.responses.get(country_code)
+    if response is None:
+        response = business_config_response(country_code, configs.default, False, configs.version)
+    return response
+
+
+@app.get("/supported-countries")
+def get_supported_countries():
+    """Get list of all countries with configured business hours"""
+    return get_business_configs().supported_countries
@@ -0,0 +1,282 @@
+"""
+Compiled prefix tries for phonenumbers' geocoding and carrier data.
+
+phonenumbers keeps this data as ~300k-entry Python dicts (about 100 MB once
+imported) and resolves a number by slicing its E164 digits at every prefix
+length. Here each dataset is compiled, per language, into one read-only file
+of flat arrays that is memory-mapped, so forked workers share the same pages
+and nothing is unpickled or imported at lookup time.
+
+File layout (little-endian, arrays 4-byte aligned):
+    magic        8 bytes, MAGIC
+    header_len   uint32, then a JSON header of header_len bytes
+    first_child  uint32[nodes]  index of the node's first child
+    value        uint32[nodes]  string index, NO_VALUE if no entry ends here
+    child_mask   uint16[nodes]  bit d set when the node has a child for digit d
+    offsets      uint32[strings + 1]  byte offsets into the string blob
+    blob         UTF-8 strings
+
+Nodes are stored breadth-first so a node's children are contiguous, and the
+child for digit d is first_child + popcount(child_mask & ((1 << d) - 1)).
+
+Usage: python prefix_trie.py DIRECTORY [--langs en,fr]
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from collections import deque
+
+import phonenumbers
+from phonenumbers import NumberParseException, PhoneNumberType
+from phonenumbers import (
+    country_mobile_token, format_number, is_number_type_geographical, is_valid_number_for_region,
+    national_significant_number, number_type, region_code_for_country_code, region_codes_for_country_code
+)
+
+MAGIC = b"PXTRIE1\0"
+NO_VALUE = 0xFFFFFFFF
+DATASETS = ("geocode", "carrier")
+CARRIER_TYPES = (PhoneNumberType.MOBILE, PhoneNumberType.FIXED_LINE_OR_MOBILE, PhoneNumberType.PAGER)
+
+
+def trie_path(directory: str, dataset: str, lang: str) -> str:
+    return os.path.join(directory, f"{dataset}_{lang}.trie")
+
+
+def load_source(dataset: str):
+    """phonenumbers' prefix -> {locale: name} dict for a dataset (slow, large)"""
+    if dataset == "geocode":
+        from phonenumbers.geodata import GEOCODE_DATA
+        return GEOCODE_DATA
+    from phonenumbers.carrierdata import CARRIER_DATA
+    return CARRIER_DATA
+
+
+def region_names(lang: str) -> dict:
+    """Region display names in lang, as geocoder's country fallback returns them"""
+    from phonenumbers.geocoder import _region_display_name
+    from phonenumbers.geodata.locale import LOCALE_DATA
+    return {region: _region_display_name(region, lang) for region in LOCALE_DATA}
+
+
+def build(source: dict, lang: str, path: str, regions: dict = None):
+    """
+    Compile one dataset for one language into path. Every prefix present in
+    source gets a value, "" when it has no name for lang, because phonenumbers
+    stops at the longest matching prefix either way.
+    """
+    from phonenumbers.prefix import _find_lang
+
+    root = {}
+    names = {}
+    for prefix, localized in source.items():
+        node = root
+        for digit in prefix:
+            node = node.setdefault(int(digit), {})
+        name = _find_lang(localized, lang, None, None) or ""
+        node[None] = names.setdefault(name, len(names))
+
+    first_child, values, masks = [], [], []
+    queue = deque([root])
+    next_index = 1
+    while queue:
+        node = queue.popleft()
+        digits = sorted(key for key in node if key is not None)
+        first_child.append(next_index if digits else 0)
+        values.append(node.get(None, NO_VALUE))
+        masks.append(sum(1 << digit for digit in digits))
+        for digit in digits:
+            queue.append(node[digit])
+        next_index += len(digits)
+
+    blob = bytearray()
+    offsets = [0]
+    for name in names:
+        blob += name.encode("utf-8")
+        offsets.append(len(blob))
+
+    header = json.dumps({
+        "phonenumbers": phonenumbers.__version__,
+        "lang": lang,
+        "nodes": len(values),
+        "strings": len(names),
+        "regions": regions or {},
+    }, ensure_ascii=False).encode("utf-8")
+    header += b" " * (-len(header) % 4)
+
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        f.write(struct.pack(f"<{len(values)}I", *first_child))
+        f.write(struct.pack(f"<{len(values)}I", *values))
+        f.write(struct.pack(f"<{len(values)}H", *masks))
+        f.write(b"\0" * (-(2 * len(values)) % 4))
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        f.write(blob)
+    # Readers never see a partly written file
+    os.replace(tmp_path, path)
+
+
+class PrefixTrie:
+    """Longest-prefix lookup over one memory-mapped compiled trie file"""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a compiled prefix trie")
+        (header_len,) = struct.unpack_from("<I", self._map, len(MAGIC))
+        offset = len(MAGIC) + 4
+        self.header = json.loads(bytes(self._map[offset:offset + header_len]))
+        offset += header_len
+        nodes, strings = self.header["nodes"], self.header["strings"]
+
+        view = memoryview(self._map)
+        self._first_child = view[offset:offset + 4 * nodes].cast("I")
+        offset += 4 * nodes
+        self._values = view[offset:offset + 4 * nodes].cast("I")
+        offset += 4 * nodes
+        self._masks = view[offset:offset + 2 * nodes].cast("H")
+        offset += 2 * nodes + (-(2 * nodes) % 4)
+        self._offsets = view[offset:offset + 4 * (strings + 1)].cast("I")
+        self._blob = view[offset + 4 * (strings + 1):]
+        # Decoded names, filled on first use
+        self._names = {}
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._map)
+
+    def lookup(self, digits: str) -> str:
+        """Name stored for the longest prefix of digits, or "" when none matches"""
+        first_child, values, masks = self._first_child, self._values, self._masks
+        node = 0
+        found = NO_VALUE
+        for char in digits:
+            bit = 1 << (ord(char) - 48)
+            mask = masks[node]
+            if not mask & bit:
+                break
+            node = first_child[node] + (mask & (bit - 1)).bit_count()
+            value = values[node]
+            if value != NO_VALUE:
+                found = value
+        if found == NO_VALUE:
+            return ""
+        name = self._names.get(found)
+        if name is None:
+            name = bytes(self._blob[self._offsets[found]:self._offsets[found + 1]]).decode("utf-8")
+            self._names[found] = name
+        return name
+
+
+class CompiledLookups:
+    """
+    geocoder.description_for_number and carrier.name_for_number for one
+    language, answered from compiled tries without importing phonenumbers'
+    geocoding or carrier data.
+    """
+
+    def __init__(self, directory: str, lang: str = "en"):
+        self.lang = lang
+        self.geocode = PrefixTrie(trie_path(directory, "geocode", lang))
+        self.carrier = PrefixTrie(trie_path(directory, "carrier", lang))
+        self.region_names = self.geocode.header["regions"]
+
+    def _region_display_name(self, region_code: str) -> str:
+        return self.region_names.get(region_code, "")
+
+    def _country_name_for_number(self, numobj) -> str:
+        region_codes = region_codes_for_country_code(numobj.country_code)
+        if len(region_codes) == 1:
+            return self._region_display_name(region_codes[0])
+        region_where_number_is_valid = "ZZ"
+        for region_code in region_codes:
+            if is_valid_number_for_region(numobj, region_code):
+                # Valid in more than one region: no single country to name
+                if region_where_number_is_valid != "ZZ":
+                    return ""
+                region_where_number_is_valid = region_code
+        return self._region_display_name(region_where_number_is_valid)
+
+    def description_for_number(self, numobj, ntype=None) -> str:
+        """Same result as geocoder.description_for_number(numobj, lang)"""
+        if ntype is None:
+            ntype = number_type(numobj)
+        if ntype == PhoneNumberType.UNKNOWN:
+            return ""
+        if not is_number_type_geographical(ntype, numobj.country_code):
+            return self._country_name_for_number(numobj)
+
+        lookup_numobj = numobj
+        mobile_token = country_mobile_token(numobj.country_code)
+        national_number = national_significant_number(numobj)
+        if mobile_token and national_number.startswith(mobile_token):
+            # e.g. Argentina: geocode without the mobile token
+            try:
+                lookup_numobj = phonenumbers.parse(
+                    national_number[len(mobile_token):], region_code_for_country_code(numobj.country_code)
+                )
+            except NumberParseException:
+                pass
+        e164 = format_number(lookup_numobj, phonenumbers.PhoneNumberFormat.E164)
+        area_description = self.geocode.lookup(e164[1:])
+        if area_description:
+            return area_description
+        return self._country_name_for_number(numobj)
+
+    def name_for_number(self, numobj, ntype=None) -> str:
+        """Same result as carrier.name_for_number(numobj, lang)"""
+        if ntype is None:
+            ntype = number_type(numobj)
+        if ntype not in CARRIER_TYPES:
+            return ""
+        e164 = format_number(numobj, phonenumbers.PhoneNumberFormat.E164)
+        return self.carrier.lookup(e164[1:])
+
+
+def is_current(directory: str, lang: str) -> bool:
+    """Whether both tries for lang exist and match the installed phonenumbers"""
+    for dataset in DATASETS:
+        try:
+            with open(trie_path(directory, dataset, lang), "rb") as f:
+                if f.read(len(MAGIC)) != MAGIC:
+                    return False
+                (header_len,) = struct.unpack("<I", f.read(4))
+                if json.loads(f.read(header_len))["phonenumbers"] != phonenumbers.__version__:
+                    return False
+        except (OSError, ValueError, KeyError, struct.error):
+            return False
+    return True
+
+
+def build_all(directory: str, langs):
+    """Compile both datasets for every language into directory"""
+    os.makedirs(directory, exist_ok=True)
+    for dataset in DATASETS:
+        source = load_source(dataset)
+        for lang in langs:
+            regions = region_names(lang) if dataset == "geocode" else None
+            build(source, lang, trie_path(directory, dataset, lang), regions)
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Compile phonenumbers geocoding and carrier data into prefix tries")
+    parser.add_argument("directory")
+    parser.add_argument("--langs", default="en", help="comma-separated language codes")
+    args = parser.parse_args()
+    langs = args.langs.split(",")
+    build_all(args.directory, langs)
+    for lang in langs:
+        for dataset in DATASETS:
+            path = trie_path(args.directory, dataset, lang)
+            print(f"{path}: {os.path.getsize(path) / 1024:.0f} KB", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,204 @@
+"""
+Multi-process server for main:app with preloaded, copy-on-write shared data.
+
+The master process imports the app, loads phonenumbers metadata for every
+region, the geocoder and carrier data (or the compiled prefix tries), the
+timezones and the business config, freezes the garbage collector, binds the
+listening socket and then forks the workers. Workers inherit all of that as
+shared pages instead of each loading its own copy, and accept connections
+on the shared socket. A worker that dies is replaced.
+
+With --no-preload each worker imports and warms up the app itself after the
+fork, which is what running N independent uvicorn processes costs.
+
+Send the master SIGUSR1 to print RSS, PSS and USS (memory unique to the
+process) for the master and each worker; memory_report() gives the same
+from Python. Counters in /metrics, /cache-stats and /executor-stats are per
+worker. Bulk jobs are shared: any worker may run an uploaded job, and the
+jobs of a worker that dies are resumed by the others or its replacement.
+
+Usage: python serve.py [--host 0.0.0.0] [--port 8000] [--workers N] [--no-preload]
+Workers default to $WEB_CONCURRENCY, else the CPUs this process may use.
+"""
+import argparse
+import gc
+import os
+import signal
+import socket
+import time
+
+import uvicorn
+
+# Seconds a worker must stay up before a crash counts as a fresh failure
+RESTART_BACKOFF = 1.0
+
+
+def default_workers() -> int:
+    if os.environ.get("WEB_CONCURRENCY"):
+        return int(os.environ["WEB_CONCURRENCY"])
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def preload():
+    """Load everything workers would otherwise each load on their own"""
+    import phonenumbers
+    import main
+    if main.WARMUP_MODE == "eager":
+        main.warm_up(sorted(phonenumbers.SUPPORTED_REGIONS))
+    main.get_business_configs()
+    # Keep collections in the workers from writing to the preloaded objects'
+    # pages, which would un-share them
+    gc.collect()
+    gc.freeze()
+
+
+def process_memory(pid: int) -> dict:
+    """RSS, PSS and USS of a process in bytes (Linux /proc; None where unavailable)"""
+    memory = {"pid": pid, "rss": None, "pss": None, "uss": None}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            fields = {}
+            for line in f:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == "kB":
+                    fields[parts[0].rstrip(":")] = int(parts[1]) * 1024
+    except OSError:
+        return memory
+    memory["rss"] = fields.get("Rss")
+    memory["pss"] = fields.get("Pss")
+    if "Private_Clean" in fields:
+        memory["uss"] = fields["Private_Clean"] + fields.get("Private_Dirty", 0)
+    return memory
+
+
+def memory_report(master_pid: int, worker_pids) -> list:
+    """process_memory of the master and each worker, with a "role" key"""
+    report = [{"role": "master", **process_memory(master_pid)}]
+    report.extend({"role": "worker", **process_memory(pid)} for pid in worker_pids)
+    return report
+
+
+def format_memory_report(report: list) -> str:
+    def mb(value):
+        return f"{value / 1024 ** 2:8.1f}" if value is not None else f"{'-':>8}"
+
+    lines = [f"{'role':<8} {'pid':>7} {'RSS MB':>8} {'PSS MB':>8} {'USS MB':>8}"]
+    for row in report:
+        lines.append(f"{row['role']:<8} {row['pid']:>7} {mb(row['rss'])} {mb(row['pss'])} {mb(row['uss'])}")
+    total_pss = sum(row["pss"] or 0 for row in report)
+    lines.append(f"total PSS (actual footprint) {total_pss / 1024 ** 2:.1f} MB")
+    return "\n".join(lines)
+
+
+def run_worker(sock: socket.socket, args):
+    """Body of a forked worker: serve main:app on the shared socket until told to stop"""
+    # uvicorn installs its own handlers for a graceful shutdown
+    for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGUSR1, signal.SIGCHLD):
+        signal.signal(signum, signal.SIG_DFL)
+    import main
+    if args.no_preload and main.WARMUP_MODE == "eager":
+        # Warm before accepting, as a preloaded worker is
+        main.warm_up(main.WARMUP_REGIONS)
+    config = uvicorn.Config(
+        main.app, log_level=args.log_level, access_log=args.access_log,
+        timeout_keep_alive=args.timeout_keep_alive
+    )
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+class Supervisor:
+    """Forks the workers, replaces ones that exit and stops them on SIGINT/SIGTERM"""
+
+    def __init__(self, sock: socket.socket, args):
+        self.sock = sock
+        self.args = args
+        self.workers = {}  # pid -> (slot, started_at)
+        self.stopping = False
+
+    def spawn(self, slot: int):
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                run_worker(self.sock, self.args)
+            except BaseException:
+                import traceback
+                traceback.print_exc()
+                code = 1
+            finally:
+                # Never fall back into the master's code
+                os._exit(code)
+        self.workers[pid] = (slot, time.monotonic())
+
+    def stop(self, signum, frame):
+        self.stopping = True
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def print_memory(self, signum, frame):
+        print(format_memory_report(memory_report(os.getpid(), self.workers)), flush=True)
+
+    def run(self):
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGUSR1, self.print_memory)
+        for slot in range(self.args.workers):
+            self.spawn(slot)
+        print(f"Serving on {self.args.host}:{self.args.port} with {self.args.workers} workers "
+              f"({'no preload' if self.args.no_preload else 'preloaded'}), master pid {os.getpid()}", flush=True)
+
+        while self.workers:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            except InterruptedError:
+                continue
+            slot, started_at = self.workers.pop(pid, (None, None))
+            if slot is None or self.stopping:
+                continue
+            print(f"Worker {pid} exited with status {status}; restarting", flush=True)
+            if time.monotonic() - started_at < RESTART_BACKOFF:
+                time.sleep(RESTART_BACKOFF)
+            self.spawn(slot)
+        self.sock.close()
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Serve main:app from several preloaded worker processes")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=default_workers())
+    parser.add_argument("--no-preload", action="store_true", help="each worker loads the app itself after fork")
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument("--no-access-log", dest="access_log", action="store_false")
+    parser.add_argument("--timeout-keep-alive", type=int, default=5)
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    sock = bind_socket(args.host, args.port)
+    if not args.no_preload:
+        started = time.perf_counter()
+        preload()
+        print(f"Preloaded in {time.perf_counter() - started:.2f}s", flush=True)
+    Supervisor(sock, args).run()
+
+
+if __name__ == "__main__":
+    main_cli()
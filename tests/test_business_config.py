@@ -0,0 +1,127 @@
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+import main
+
+WEEKDAYS = {"weekdays": [0, 1, 2, 3, 4], "weekend_days": [5, 6],
+            "business_hours_start": 9, "business_hours_end": 18}
+
+
+def document(version, **countries):
+    return {"version": version, "default": WEEKDAYS, "countries": countries}
+
+
+def write(path, content):
+    path.write_text(json.dumps(content) if not isinstance(content, str) else content)
+    # Make sure the change check sees a new signature even within one mtime tick
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    path = tmp_path / "business_config.json"
+    write(path, document("v1", IN={**WEEKDAYS, "holidays": ["01-26", "2026-03-04"]}))
+    monkeypatch.setattr(main, "BUSINESS_CONFIG_PATH", str(path))
+    monkeypatch.setattr(main, "_business_configs", main.load_business_configs(str(path)))
+    monkeypatch.setattr(main, "_business_config_signature", main.file_signature(str(path)))
+    monkeypatch.setattr(main, "business_config_state", dict(main.business_config_state, version="v1",
+                                                             reloads=0, last_error=None))
+    return path
+
+
+def test_holidays_compile_to_day_lookups():
+    config = main.compile_business_config({**WEEKDAYS, "holidays": [
+        "01-26", "02-29", "12-31", "2026-03-04", "2028-02-29", "2030-12-25"]})
+    holidays = set()
+    for year in range(2024, 2032):
+        for day_of_year in range(1, 367):
+            if config.is_holiday(year, day_of_year):
+                holidays.add(datetime.strptime(f"{year} {day_of_year}", "%Y %j").date().isoformat())
+    expected = {f"{year}-01-26" for year in range(2024, 2032)} | {f"{year}-12-31" for year in range(2024, 2032)}
+    expected |= {"2024-02-29", "2028-02-29", "2026-03-04", "2030-12-25"}
+    assert holidays == expected
+    assert config.holidays == ("01-26", "02-29", "12-31", "2026-03-04", "2028-02-29", "2030-12-25")
+
+
+@pytest.mark.parametrize("holidays", [["2026-02-30"], ["13-01"], ["2026/01/01"], [20260101], "01-26"])
+def test_bad_holidays_are_rejected(holidays):
+    with pytest.raises(ValueError):
+        main.compile_business_config({**WEEKDAYS, "holidays": holidays})
+
+
+def test_holiday_closes_business_hours(config_file):
+    configs = main.get_business_configs()
+    assert configs.responses["IN"]["holidays"] == ["01-26", "2026-03-04"]
+    # 11:00 in Kolkata on a Wednesday holiday, then the Thursday after
+    for at, holiday in [(datetime(2026, 3, 4, 5, 30), True), (datetime(2026, 3, 5, 5, 30), False),
+                        (datetime(2027, 1, 26, 5, 30), True), (datetime(2027, 3, 4, 5, 30), False)]:
+        result = main.validate_number("+919876543210", snapshot=main.TimeSnapshot(at))
+        assert result["is_holiday"] is holiday
+        assert result["is_weekday"] is True
+        assert result["is_business_hours"] is not holiday
+
+
+def test_holidays_have_no_call_window(config_file):
+    config = main.get_business_configs().get("IN")
+    week_start = main.schedule_week_start(main.reference_instant(datetime(2026, 3, 4)))
+    starts, _ = main.weekly_schedule("Asia/Kolkata", config, week_start)
+    days = {datetime.fromtimestamp(start, main.get_timezone("Asia/Kolkata")).date().isoformat()
+            for start in starts}
+    assert "2026-03-04" not in days
+    assert {"2026-03-02", "2026-03-03", "2026-03-05", "2026-03-06"} <= days
+
+
+def test_reload_swaps_in_a_changed_file(config_file):
+    old = main.get_business_configs()
+    write(config_file, document("v2", IN={**WEEKDAYS, "business_hours_start": 10}))
+    main.reload_business_configs()
+    new = main.get_business_configs()
+    assert new is not old and new.version == "v2"
+    assert new.get("IN").start_hour == 10 and new.get("IN").holidays == ()
+    assert main.business_config_state["version"] == "v2"
+    assert main.business_config_state["reloads"] == 1
+    # An unchanged file is not loaded again
+    main.reload_business_configs()
+    assert main.get_business_configs() is new
+
+
+@pytest.mark.parametrize("content", [
+    "{not json",
+    {"version": "v2"},
+    document("v2", IN={**WEEKDAYS, "holidays": ["2026-02-30"]}),
+    document("v2", IN={**WEEKDAYS, "weekdays": [7]}),
+    document("v2", IN={**WEEKDAYS, "business_hours_end": "18"}),
+])
+def test_bad_reload_keeps_the_active_config(config_file, content):
+    old = main.get_business_configs()
+    write(config_file, content)
+    main.reload_business_configs()
+    assert main.get_business_configs() is old
+    assert main.business_config_state["version"] == "v1"
+    assert main.business_config_state["last_error"]
+    assert main.business_config_state["reloads"] == 0
+
+    # Fixing the file recovers
+    write(config_file, document("v3", IN=WEEKDAYS))
+    main.reload_business_configs()
+    assert main.get_business_configs().version == "v3"
+    assert main.business_config_state["last_error"] is None
+
+
+def test_missing_file_keeps_the_active_config(config_file):
+    old = main.get_business_configs()
+    config_file.unlink()
+    main.reload_business_configs()
+    assert main.get_business_configs() is old
+    assert main.business_config_state["last_error"]
+
+
+def test_version_defaults_to_content_hash(tmp_path):
+    path = tmp_path / "config.json"
+    write(path, {"default": WEEKDAYS, "countries": {}})
+    version = main.load_business_configs(str(path)).version
+    assert version.startswith("sha256:")
+    assert main.load_business_configs(str(path)).version == version
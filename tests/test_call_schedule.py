@@ -0,0 +1,138 @@
+import bisect
+import functools
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+from fastapi.testclient import TestClient
+
+import main
+
+# Instants inside weeks with a DST change in the zones below, and one without
+DST_WEEKS = [
+    datetime(2026, 3, 9, tzinfo=pytz.utc),   # US spring forward (Sunday March 8th)
+    datetime(2026, 11, 2, tzinfo=pytz.utc),  # US fall back (Sunday November 1st)
+    datetime(2026, 3, 30, tzinfo=pytz.utc),  # EU spring forward (Sunday March 29th)
+    datetime(2026, 10, 26, tzinfo=pytz.utc), # EU fall back (Sunday October 25th)
+    datetime(2026, 4, 6, tzinfo=pytz.utc),   # Australia fall back (Sunday April 5th)
+    datetime(2026, 10, 5, tzinfo=pytz.utc),  # Australia spring forward (Sunday October 4th)
+    datetime(2026, 6, 17, tzinfo=pytz.utc),
+]
+
+ZONES = ["America/New_York", "America/Los_Angeles", "Europe/London", "Europe/Berlin",
+         "Australia/Sydney", "Australia/Lord_Howe", "Asia/Kolkata", "Asia/Kathmandu"]
+
+# Hours at, either side of and spanning the 01:00-03:00 changes, plus whole days
+CONFIGS = [
+    main.compile_business_config({"weekdays": [0, 1, 2, 3, 4, 5, 6], "weekend_days": [],
+                                  "business_hours_start": start, "business_hours_end": end})
+    for start, end in [(0, 1), (1, 2), (2, 3), (1, 3), (0, 24), (9, 17), (3, 2)]
+] + [
+    # Holidays on the DST Sundays themselves
+    main.compile_business_config({"weekdays": [0, 1, 2, 3, 4, 6], "weekend_days": [5],
+                                  "business_hours_start": 1, "business_hours_end": 3,
+                                  "holidays": ["2026-03-08", "2026-10-25", "11-01", "04-05"]}),
+]
+
+
+@functools.lru_cache(maxsize=None)
+def local_clock(tz_name, timestamp):
+    """(weekday, year, day of year, hour) the zone's clock shows at an instant"""
+    local = datetime.fromtimestamp(timestamp, pytz.utc).astimezone(pytz.timezone(tz_name))
+    return local.weekday(), local.year, local.timetuple().tm_yday, local.hour
+
+
+def is_open(config, tz_name, timestamp):
+    """Business hours at one instant, straight from the local clock"""
+    weekday, year, day_of_year, hour = local_clock(tz_name, timestamp)
+    return (bool(config.weekday_mask & (1 << weekday))
+            and not config.is_holiday(year, day_of_year)
+            and config.start_hour <= hour < config.end_hour)
+
+
+def in_schedule(schedule, timestamp):
+    starts, ends = schedule
+    index = bisect.bisect_right(ends, timestamp)
+    return index < len(ends) and starts[index] <= timestamp
+
+
+def minutes_of_week(week_start):
+    # The schedule must be complete for the UTC week it is built for
+    first = int(week_start.timestamp())
+    return range(first, first + 7 * 86400, 60)
+
+
+@pytest.mark.parametrize("at", DST_WEEKS, ids=lambda at: at.date().isoformat())
+@pytest.mark.parametrize("zone", ZONES)
+def test_weekly_schedule_matches_minute_scan(zone, at):
+    week_start = main.schedule_week_start(at)
+    for config in CONFIGS:
+        schedule = main.weekly_schedule(zone, config, week_start)
+        assert list(schedule[0]) == sorted(schedule[0])
+        for timestamp in minutes_of_week(week_start):
+            assert in_schedule(schedule, timestamp) == is_open(config, zone, timestamp), (
+                zone, config.start_hour, config.end_hour, datetime.fromtimestamp(timestamp, pytz.utc))
+
+
+@pytest.mark.parametrize("at", DST_WEEKS, ids=lambda at: at.date().isoformat())
+@pytest.mark.parametrize("zones", [
+    ("America/New_York", "America/Los_Angeles"),
+    ("Europe/London", "America/New_York"),
+    ("Australia/Sydney", "Australia/Lord_Howe", "Asia/Kathmandu"),
+    ("America/New_York", "Not/A_Zone"),
+])
+def test_call_schedule_matches_minute_scan(zones, at):
+    week_start = main.schedule_week_start(at)
+    known = [zone for zone in zones if zone in pytz.all_timezones_set]
+    for config in CONFIGS:
+        schedule = main.call_schedule(zones, config, week_start)
+        for timestamp in minutes_of_week(week_start):
+            expected = all(is_open(config, zone, timestamp) for zone in known)
+            assert in_schedule(schedule, timestamp) == expected, (
+                zones, config.start_hour, config.end_hour, datetime.fromtimestamp(timestamp, pytz.utc))
+
+
+def test_call_schedule_without_known_zones():
+    week_start = main.schedule_week_start(DST_WEEKS[0])
+    assert main.call_schedule(("Not/A_Zone",), CONFIGS[0], week_start) is None
+
+
+def test_next_call_window():
+    week_start = main.schedule_week_start(DST_WEEKS[-1])
+    schedule = main.call_schedule(("Asia/Kolkata",), CONFIGS[5], week_start)
+    start, end = schedule[0][0], schedule[1][0]
+    assert main.next_call_window(schedule, start - 1) == (start, end)
+    assert main.next_call_window(schedule, start) == (start, end)
+    assert main.next_call_window(schedule, end)[0] == start + 86400
+    assert main.next_call_window(schedule, schedule[1][-1]) is None
+
+
+# Numbers whose zones never share business hours fall back to the primary zone
+@pytest.mark.parametrize("number, basis", [
+    ("+79123456789", "primary_zone"),
+    ("+77012345678", "primary_zone"),
+    ("+18005551234", "primary_zone"),
+    ("+919876543210", "all_zones"),
+    ("+14155552671", "all_zones"),
+])
+def test_call_windows_agree_with_validate(number, basis):
+    client = TestClient(main.app)
+    for hour in range(0, 24 * 7, 5):
+        at = datetime(2026, 10, 12, tzinfo=pytz.utc) + timedelta(hours=hour)
+        response = client.post("/call-windows", json={"numbers": [number], "at": at.isoformat()})
+        entry = response.json()["results"][0]
+        assert entry["window_basis"] == basis and entry["reason"] is None
+        validated = main.validate_number(number, snapshot=main.TimeSnapshot(at))
+        assert entry["callable_now"] is validated["is_business_hours"], (number, at)
+        assert entry["window_start"] is not None
+
+
+def test_primary_zone_window_matches_its_schedule():
+    at = datetime(2026, 10, 14, 15, tzinfo=pytz.utc)
+    week_start = main.schedule_week_start(at)
+    zones = tuple(main.validate_number("+79123456789")["all_timezones"])
+    config = main.get_business_configs().get("RU")
+    assert main.call_schedule(zones, config, week_start) == ((), ())
+    window = main.find_call_window(zones, config, week_start, at.timestamp())
+    assert window[:2] == main.next_call_window(main.weekly_schedule(zones[0], config, week_start), at.timestamp())
+    assert window[-1] == "primary_zone"
@@ -0,0 +1,61 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import main
+
+AT = datetime(2026, 6, 1, 9, 0)
+
+NUMBERS = ["+919876543210", "+91 98765 43210", "+91-98765-43210", "9876543210", "+14155552671",
+           "+1 (415) 555-2671", "", "abc", "+919876543210", "+442071838750", "+44 20 7183 8750"] * 3
+
+
+def test_run_batch_matches_validating_each_input():
+    snapshot = main.TimeSnapshot(AT)
+    expected = [main.validate_number(number, "IN", "IN", snapshot) for number in NUMBERS]
+    with ThreadPoolExecutor(2) as executor:
+        for kwargs in [{}, {"executor": executor, "chunk_size": 2}]:
+            results = main.run_batch(NUMBERS, "IN", "IN", at=AT, **kwargs)
+            assert [result.to_dict() for result in results] == expected
+            assert [result["input"] for result in results] == NUMBERS
+
+
+def test_single_flight_runs_concurrent_calls_once():
+    calls = []
+
+    async def work(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return {"value": value}
+
+    async def scenario():
+        flight = main.SingleFlight()
+        results = await asyncio.gather(*(flight.run("key", lambda: work(1)) for _ in range(5)))
+        assert results == [{"value": 1}] * 5
+        assert flight.stats() == {"in_flight": 0, "started": 1, "coalesced": 4}
+        # A finished key starts afresh
+        assert await flight.run("key", lambda: work(2)) == {"value": 2}
+        assert await flight.run("other", lambda: work(3)) == {"value": 3}
+
+    asyncio.run(scenario())
+    assert calls == [1, 2, 3]
+
+
+def test_single_flight_survives_a_cancelled_caller():
+    async def scenario():
+        flight = main.SingleFlight()
+        started = asyncio.Event()
+
+        async def work():
+            started.set()
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first = asyncio.ensure_future(flight.run("key", work))
+        await started.wait()
+        second = asyncio.ensure_future(flight.run("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == "done"
+
+    asyncio.run(scenario())
@@ -0,0 +1,26 @@
+import subprocess
+
+import phonenumbers
+from phonenumbers import carrier, geocoder
+
+import main
+
+
+def test_failed_build_falls_back_to_stock_lookups_once(monkeypatch, tmp_path):
+    calls = []
+
+    def failing_build(*args, **kwargs):
+        calls.append(args)
+        raise subprocess.CalledProcessError(1, args[0])
+
+    monkeypatch.setattr(main, "PREFIX_TRIE_DIR", str(tmp_path / "tries"))
+    monkeypatch.setattr(main, "_compiled_lookups", None)
+    monkeypatch.setattr(main, "_compiled_lookups_error", None)
+    monkeypatch.setattr(main.subprocess, "run", failing_build)
+
+    parsed = phonenumbers.parse("+919876543210")
+    for _ in range(3):
+        assert main.lookup_location(parsed) == geocoder.description_for_number(parsed, "en")
+        assert main.lookup_carrier(parsed) == carrier.name_for_number(parsed, "en")
+    assert len(calls) == 1
+    assert main._compiled_lookups_error is not None
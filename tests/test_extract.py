@@ -0,0 +1,107 @@
+import os
+import random
+import sys
+
+import phonenumbers
+import pytest
+
+import main
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from bench_extract import CORPORA, build_text
+
+
+def whole_text_matches(text, region):
+    return [(match.start, match.raw_string)
+            for match in phonenumbers.PhoneNumberMatcher(text, region, leniency=phonenumbers.Leniency.VALID)]
+
+
+def scan(text, region, cuts):
+    extractor = main.NumberExtractor(region)
+    found = []
+    previous = 0
+    for cut in cuts + [len(text)]:
+        found.extend(extractor.feed(text[previous:cut]))
+        previous = cut
+    return found + extractor.finish()
+
+
+@pytest.mark.parametrize("corpus", sorted(CORPORA))
+def test_scan_matches_whole_text_under_any_chunking(corpus):
+    text = build_text(60_000, *CORPORA[corpus], seed=21)
+    expected = whole_text_matches(text, "IN")
+    assert expected
+    rng = random.Random(21)
+    for chunking in range(20):
+        # From single characters up to a few kilobytes, so numbers, extensions
+        # and their context are split at every kind of position
+        size = rng.choice([1, 7, 64, 1000, 4096])
+        cuts = sorted(rng.sample(range(1, len(text)), len(text) // size // 2 or 1))
+        assert scan(text, "IN", cuts) == expected, (chunking, size)
+
+
+@pytest.mark.parametrize("text", [
+    "call +91 98765 43210 ext 12 now",
+    "9876543210, 09876543210 and +1 (415) 555-2671",
+    "order #123456 on 12/3/2024 for Rs.4500.00",
+    "+44 20 7183 8750" + " " * 300 + "+91-98765-43210",
+    "x" * 1000 + "+919876543210",
+    " ".join(f"98765{n:05d}" for n in range(100)),
+])
+def test_scan_edge_cases(text):
+    expected = whole_text_matches(text, "IN")
+    for cuts in ([], list(range(1, len(text))), [len(text) // 2]):
+        assert scan(text, "IN", cuts) == expected
+
+
+GLUED = ["+919876543210", "9876543210", "09876543210", "+91-98765-43210", "98765 43210", "(415) 555-2671",
+         "+14155552671", "18005551234", "+442071838750", "+79123456789", "+8613800138000"]
+
+
+def glued_text(rng):
+    """Numbers and stray digits run together, now and then with a separator or extension"""
+    parts = []
+    for _ in range(rng.randint(2, 12)):
+        if rng.random() < 0.7:
+            parts.append(rng.choice(GLUED))
+        else:
+            parts.append("".join(rng.choice("0123456789") for _ in range(rng.randint(1, 12))))
+        parts.append(rng.choice([""] * 12 + [" ", "-", "+", "(", ") ", "x", " ext ", ";ext=", "#", "q", "\n", "%"]))
+    return "".join(parts)
+
+
+def test_scan_matches_whole_text_for_glued_numbers():
+    rng = random.Random(17)
+    for _ in range(300):
+        text = glued_text(rng)
+        expected = whole_text_matches(text, "IN")
+        for cuts in ([], list(range(1, len(text))), sorted(rng.sample(range(1, len(text)), 3))):
+            assert scan(text, "IN", cuts) == expected, (text, cuts)
+
+
+# Longer than EXTRACT_MAX_CARRY with nothing that ends a number, so it is
+# matched in pieces: the matcher resumes where the whole-text one was still
+# inside a failed candidate and finds one more number
+LONG_GLUED = ("267109876543210+861380013800098765 43210+4420718387507624+91-98765-43210+8613800138000"
+              "+44207183875009876543210+86138001380006046009876543210) +44207183875009876543210x1800555"
+              "12348794498765 432106377(98765 4321018005551234+4420718387504155552671) 18005551234")
+
+
+def test_scan_of_stretch_past_carry_limit():
+    assert len(LONG_GLUED) > main.EXTRACT_MAX_CARRY
+    expected = whole_text_matches(LONG_GLUED, "IN")
+    assert scan(LONG_GLUED, "IN", []) == sorted(expected + [(129, "09876543210")])
+    # Held back whole, it matches like the whole text
+    assert scan(LONG_GLUED[:200], "IN", []) == whole_text_matches(LONG_GLUED[:200], "IN")
+
+
+def test_extract_numbers_validates_like_validate_number():
+    snapshot_at = main.reference_instant(None)
+    text = "Reach me on +91 98765 43210 or 415-555-2671 (US office)."
+    results = list(main.extract_numbers([text[:20], text[20:]], "IN", "IN", snapshot_at))
+    assert [result["offset"] for result in results] == [match[0] for match in whole_text_matches(text, "IN")]
+    snapshot = main.TimeSnapshot(snapshot_at)
+    for result in results:
+        expected = main.validate_number(result["input"], "IN", "IN", snapshot)
+        assert {key: value for key, value in result.items() if key != "offset"} == expected
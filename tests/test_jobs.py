@@ -0,0 +1,218 @@
+import json
+import multiprocessing
+import os
+import signal
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+@pytest.fixture
+def jobs(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "JOBS_DIR", str(tmp_path))
+    main.start_job_workers()
+    yield TestClient(main.app)
+    main.stop_job_workers()
+
+
+def wait_for(client, job_id, status="completed"):
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        job = client.get(f"/jobs/{job_id}").json()
+        if job["status"] == status:
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"job {job_id} is {job['status']}")
+
+
+def test_csv_upload_is_validated(jobs):
+    body = "name,number\nA,+919876543210\nB,not a number\nC,+14155552671\n"
+    response = jobs.post("/jobs", content=body, headers={"content-type": "text/csv"})
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+    with open(main.job_input_path(job_id)) as f:
+        assert f.read() == body
+
+    job = wait_for(jobs, job_id)
+    assert job["total_rows"] == 3
+    assert job["summary"]["valid_count"] == 2
+    rows = [line for line in jobs.get(f"/jobs/{job_id}/results").text.splitlines()]
+    assert len(rows) == 3
+
+
+def test_upload_is_written_off_the_event_loop(jobs, monkeypatch):
+    loop_threads = set()
+    write_threads = set()
+    real_open = open
+
+    class RecordingFile:
+        def __init__(self, f):
+            self._f = f
+
+        def write(self, data):
+            write_threads.add(threading.get_ident())
+            return self._f.write(data)
+
+        def close(self):
+            self._f.close()
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            self.close()
+
+    def recording_open(path, *args, **kwargs):
+        f = real_open(path, *args, **kwargs)
+        mode = args[0] if args else kwargs.get("mode", "r")
+        return RecordingFile(f) if "w" in mode else f
+
+    original_stream = main.Request.stream
+
+    async def stream(self):
+        loop_threads.add(threading.get_ident())
+        async for chunk in original_stream(self):
+            yield chunk
+
+    monkeypatch.setattr(main, "open", recording_open, raising=False)
+    monkeypatch.setattr(main.Request, "stream", stream)
+    response = jobs.post("/jobs?format=ndjson", content=b"+919876543210\n" * 1000)
+    assert response.status_code == 202
+    assert write_threads and loop_threads and not write_threads & loop_threads
+    wait_for(jobs, response.json()["job_id"])
+
+
+def dead_pid():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def add_job(store, job_id, **fields):
+    store.create({"id": job_id, "status": "queued", "format": "ndjson", "column_name": "number",
+                  "has_header": 0, "default_region": "IN", "home_country": "IN",
+                  "created_at": time.time(), **fields})
+
+
+def hold_claim(path, claimed):
+    """Child process: claim a job and keep it until killed"""
+    store = main.JobStore(path)
+    claimed.put((store.claim_next(), os.getpid()))
+    time.sleep(60)
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return str(tmp_path / "jobs.sqlite3")
+
+
+def test_live_owner_keeps_its_job_until_it_dies(store_path):
+    store = main.JobStore(store_path)
+    add_job(store, "a")
+    context = multiprocessing.get_context("fork")
+    claimed = context.Queue()
+    child = context.Process(target=hold_claim, args=(store_path, claimed))
+    child.start()
+    try:
+        job_id, pid = claimed.get(timeout=10)
+        assert job_id == "a" and store.get("a")["owner_pid"] == pid
+        assert store.claim_next() is None
+        os.kill(pid, signal.SIGKILL)
+        child.join()
+        assert store.claim_next() == "a"
+        assert store.get("a")["owner_token"] == store.owner_token
+    finally:
+        child.kill()
+        child.join()
+
+
+def test_expired_lease_and_earlier_run_are_reclaimed(store_path, monkeypatch):
+    store = main.JobStore(store_path)
+    live = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        add_job(store, "expired", status="running", owner_pid=live.pid, owner_token="other",
+                lease_until=time.time() - 1)
+        add_job(store, "live", status="running", owner_pid=live.pid, owner_token="other",
+                lease_until=time.time() + 60)
+        add_job(store, "earlier_run", status="running", owner_pid=os.getpid(), owner_token="previous",
+                lease_until=time.time() + 60)
+        add_job(store, "dead", status="running", owner_pid=dead_pid(), owner_token="crashed",
+                lease_until=time.time() + 60)
+        add_job(store, "done", status="completed")
+        claimed = set(iter(store.claim_next, None))
+        assert claimed == {"expired", "earlier_run", "dead"}
+    finally:
+        live.kill()
+        live.wait()
+
+
+def test_checkpoint_fails_once_taken_over(store_path):
+    store = main.JobStore(store_path)
+    add_job(store, "a")
+    assert store.claim_next() == "a"
+    assert store.checkpoint("a", rows_done=5)
+    # Another run of the job store on this host takes the job over
+    other = main.JobStore(store_path)
+    other.pid = dead_pid()
+    store._conn.execute("UPDATE jobs SET lease_until = 0 WHERE id = 'a'")
+    assert other.claim_next() == "a"
+    assert not store.checkpoint("a", rows_done=10)
+    assert store.get("a")["rows_done"] == 5
+    store.release("a")
+    assert store.get("a")["owner_token"] == other.owner_token
+    other.release("a")
+    assert store.get("a")["owner_token"] is None
+
+
+def test_old_jobs_table_is_migrated(store_path):
+    connection = sqlite3.connect(store_path)
+    connection.execute("""
+        CREATE TABLE jobs (
+            id TEXT PRIMARY KEY, status TEXT NOT NULL, format TEXT NOT NULL, column_name TEXT,
+            has_header INTEGER NOT NULL, default_region TEXT NOT NULL, home_country TEXT NOT NULL,
+            total_rows INTEGER, rows_done INTEGER NOT NULL DEFAULT 0,
+            output_bytes INTEGER NOT NULL DEFAULT 0, rate REAL, summary TEXT, error TEXT,
+            created_at REAL NOT NULL, started_at REAL, updated_at REAL, finished_at REAL
+        )
+    """)
+    connection.execute("INSERT INTO jobs (id, status, format, has_header, default_region, home_country, "
+                       "created_at) VALUES ('old', 'running', 'ndjson', 0, 'IN', 'IN', 0)")
+    connection.commit()
+    connection.close()
+    store = main.JobStore(store_path)
+    main.JobStore(store_path)
+    assert store.claim_next() == "old"
+
+
+def test_jobs_of_a_crashed_process_are_resumed(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "JOBS_DIR", str(tmp_path))
+    monkeypatch.setattr(main, "JOB_CHUNK_SIZE", 2)
+    store = main.JobStore(os.path.join(str(tmp_path), "jobs.sqlite3"))
+    numbers = ["+919876543210", "+14155552671", "bad", "+442071838750", "+919876543211"]
+    with open(main.job_input_path("crashed"), "w") as f:
+        f.write("\n".join(numbers) + "\n")
+    # Two rows were checkpointed, then a partial third line was written before the crash
+    first_rows = "".join(json.dumps({"row": row, "input": n}) + "\n" for row, n in enumerate(numbers[:2], 1))
+    with open(main.job_output_path("crashed"), "w") as f:
+        f.write(first_rows + '{"row": 3, "inp')
+    add_job(store, "crashed", status="running", total_rows=5, rows_done=2, output_bytes=len(first_rows),
+            started_at=time.time(), owner_pid=dead_pid(), owner_token="crashed",
+            lease_until=time.time() + 60)
+
+    main.start_job_workers()
+    try:
+        job = wait_for(TestClient(main.app), "crashed")
+    finally:
+        main.stop_job_workers()
+    assert job["rows_done"] == 5
+    with open(main.job_output_path("crashed")) as f:
+        rows = [json.loads(line) for line in f]
+    assert [row["row"] for row in rows] == [1, 2, 3, 4, 5]
+    assert [row["input"] for row in rows] == numbers
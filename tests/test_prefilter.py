@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+import main
+
+REGIONS = ["IN", "US", "GB", "MX", "DE", "BR"]
+
+
+def corpus():
+    rng = random.Random(14)
+    numbers = ["", "+", "++", "abc", "a1", "+1", "123", "+123", "1" * 33, "+" + "9" * 40, "x9",
+               "٩٨", "12345678901234567890123456789012345"]
+    for _ in range(2000):
+        length = rng.randrange(0, 40)
+        alphabet = rng.choice(["0123456789", "0123456789+", "0123456789ab", "1"])
+        numbers.append("".join(rng.choice(alphabet) for _ in range(length)))
+    return numbers
+
+
+def test_rejections_agree_with_full_validation():
+    rejected = 0
+    for number in corpus():
+        raw = main.clean_phone_number(number)
+        if main.prefilter_number(raw) is None:
+            continue
+        rejected += 1
+        for region in REGIONS:
+            parsed = main.smart_parse_number(raw, region)
+            assert parsed is None or not parsed["valid"], (number, region)
+    assert rejected > 100
+
+
+@pytest.mark.parametrize("region", ["IN", "MX"])
+def test_repeated_digits_keep_phonenumbers_verdict_by_default(region):
+    main.validation_cache.clear()
+    result = main.validate_number("9999999999", region, region)
+    assert result["valid"] is True
+    assert result["rejection"] is None
+
+
+def test_repeated_digits_rejected_when_enabled(monkeypatch):
+    monkeypatch.setattr(main, "PREFILTER_REJECT_REPEATED", True)
+    assert main.prefilter_number("9999999999") == "repeated_digits"
+    assert main.prefilter_number("+9999999999") == "repeated_digits"
+    assert main.prefilter_number("9999999998") is None
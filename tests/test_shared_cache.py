@@ -0,0 +1,44 @@
+import multiprocessing
+
+import main
+
+
+def open_cache(path):
+    return main.SharedValidationCache(path, 1000, 0)
+
+
+def test_unopenable_path_disables_shared_cache(monkeypatch):
+    monkeypatch.setattr(main, "SHARED_CACHE_PATH", "/nonexistent/dir/cache.db")
+    monkeypatch.setattr(main, "_shared_cache", None)
+    monkeypatch.setattr(main, "_shared_cache_error", None)
+    main.validation_cache.clear()
+
+    result = main.validate_number("+919876543210")
+    assert result["valid"] is True
+    assert main.get_shared_cache() is None
+    assert main._shared_cache_error
+
+
+def test_get_and_put_errors_are_counted_not_raised(tmp_path):
+    cache = open_cache(str(tmp_path / "cache.db"))
+    key = ("+919876543210", "IN", "IN", main.ENRICHMENT_STAGES)
+    value = main.validate_static("+919876543210", "IN", "IN")
+    cache.put(key, value)
+    assert cache.get(key)[0] == value[0]
+
+    cache._connection().execute("DROP TABLE results")
+    cache.put(key, value)
+    assert cache.get(key) is None
+    assert cache.errors == 2
+
+
+def test_workers_opening_together_all_succeed(tmp_path):
+    path = str(tmp_path / "cache.db")
+    with multiprocessing.get_context("fork").Pool(8) as pool:
+        caches = pool.map(_open_in_worker, [path] * 16)
+    assert all(caches)
+
+
+def _open_in_worker(path):
+    open_cache(path)
+    return True
@@ -0,0 +1,24 @@
+import os
+import sys
+
+import pytest
+
+import main
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from bench_smart_parse import build_corpus, reference_smart_parse_number, signature
+
+CORPUS = build_corpus(3000, 20240601)
+
+
+@pytest.mark.parametrize("default_region", ["IN", "US", "GB", "BR", "MX"])
+def test_matches_exhaustive_search(default_region):
+    mismatches = []
+    for raw in CORPUS:
+        expected = signature(reference_smart_parse_number(raw, default_region))
+        actual = signature(main.smart_parse_number(raw, default_region))
+        if expected != actual:
+            mismatches.append((raw, expected, actual))
+    assert mismatches == []
+
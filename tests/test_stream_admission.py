@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+import main
+
+
+async def call(path, body_parts):
+    """
+    Drive the app with a request body sent in parts, the next part released by
+    each put on the returned queue. Returns (task, queue, sent messages).
+    """
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+             "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+             "root_path": "", "headers": [(b"content-type", b"text/plain")],
+             "client": ("127.0.0.1", 1), "server": ("127.0.0.1", 80)}
+    gate = asyncio.Queue()
+    parts = list(body_parts)
+    sent = []
+
+    async def receive():
+        await gate.get()
+        part = parts.pop(0)
+        return {"type": "http.request", "body": part, "more_body": bool(parts)}
+
+    async def send(message):
+        sent.append(message)
+
+    return asyncio.ensure_future(main.app(scope, receive, send)), gate, sent
+
+
+async def settle():
+    for _ in range(20):
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def lane(monkeypatch):
+    lane = main.ValidationLane("bulk", 1, 2)
+    monkeypatch.setattr(main, "bulk_lane", lane)
+    yield lane
+    lane.executor.shutdown()
+
+
+@pytest.mark.parametrize("path, first, last", [
+    ("/validate-stream", b"+919876543210\n", b"+14155552671\n"),
+    ("/extract", b"Call +91 98765 43210 or ", b"+1 415 555 2671 today.\n"),
+])
+def test_streams_hold_a_bulk_slot_until_they_end(lane, path, first, last):
+    async def scenario():
+        streams = []
+        for _ in range(2):
+            task, gate, sent = await call(path, [first, last])
+            gate.put_nowait(None)
+            streams.append((task, gate, sent))
+        await settle()
+        assert lane.pending == 2
+
+        # The lane is full while both streams are open, however idle they are
+        rejected, gate, sent = await call(path, [first])
+        gate.put_nowait(None)
+        await rejected
+        assert sent[0]["status"] == 503
+        assert lane.rejected == 1
+
+        for task, gate, sent in streams:
+            gate.put_nowait(None)
+            await task
+            assert sent[0]["status"] == 200
+            assert b"summary" in sent[-2]["body"]
+        assert lane.pending == 0
+
+    asyncio.run(scenario())
+
+
+def test_slot_is_released_when_the_client_goes_away(lane):
+    async def scenario():
+        task, gate, sent = await call("/validate-stream", [b"+919876543210\n", b"+14155552671\n"])
+        gate.put_nowait(None)
+        await settle()
+        assert lane.pending == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert lane.pending == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,35 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+def stream_results(body, part_size):
+    client = TestClient(main.app)
+    parts = (body[index:index + part_size] for index in range(0, len(body), part_size))
+    response = client.post("/validate-stream", content=parts)
+    assert response.status_code == 200
+    *results, summary = [json.loads(line) for line in response.text.splitlines()]
+    return results, summary["summary"]
+
+
+@pytest.mark.parametrize("part_size", [1, 100, 5000, 100_000])
+def test_long_lines_are_rejected_in_place(part_size):
+    long_line = b"+91" + b"9" * 10_000
+    body = b"+919876543210\n" + long_line + b"\n\n+14155552671\n" + b'{"number": "' + b"1" * 5000 + b'"}'
+    results, summary = stream_results(body, part_size)
+    assert [result["valid"] for result in results] == [True, False, True, False]
+    for result in results[1::2]:
+        assert result["rejection"] == "line_too_long"
+        assert result["reason"] == f"Rejected: line longer than {main.STREAM_MAX_LINE_BYTES} bytes"
+        assert len(result["input"]) == main.STREAM_MAX_LINE_BYTES
+    assert results[1]["input"] == long_line[:main.STREAM_MAX_LINE_BYTES].decode()
+    assert summary["total"] == 4 and summary["prefilter_rejected_count"] == 2
+
+
+def test_line_at_the_limit_is_validated():
+    line = b" " * (main.STREAM_MAX_LINE_BYTES - 13) + b"+919876543210"
+    results, summary = stream_results(line + b"\n" + line, 1000)
+    assert [result["formatted_e164"] for result in results] == ["+919876543210"] * 2
@@ -0,0 +1,116 @@
+import random
+from datetime import datetime
+
+import pytest
+
+import main
+
+STAGE_SETS = [
+    main.ENRICHMENT_STAGES,
+    frozenset(),
+    frozenset({"time"}),
+    frozenset({"format", "type"}),
+    frozenset({"location", "carrier", "time"}),
+]
+
+AT = datetime(2026, 3, 9, 14, 30)
+
+
+def corpus():
+    rng = random.Random(22)
+    numbers = ["", "abc", "+919876543210", "+91 98765-43210", "9876543210", "14155552671",
+               "+1 800 555 0199", "+442071838750", "+61 2 9374 4000", "+8613800138000",
+               "+79123456789", "+5511987654321", "+1-800-FLOWERS", "12", "+999999999999"]
+    for _ in range(300):
+        prefix = rng.choice(["+91", "+1", "+44", "+49", "+52", "+55", "", "0"])
+        numbers.append(prefix + "".join(rng.choice("0123456789") for _ in range(rng.randint(6, 12))))
+    return numbers
+
+
+def old_validate_number(number, default_region, home_country, snapshot, stages):
+    """The response dict as validate_number built it before ValidationRecord"""
+    static_result, parsed = main.validate_static(main.clean_phone_number(number), default_region,
+                                                 home_country, stages)
+    result = {"input": number}
+    result.update(static_result)
+    if parsed is None or "time" not in stages:
+        result["all_timezones"] = []
+        return result
+    result.update(main.get_time_info(parsed, result["region"], snapshot))
+    return result
+
+
+def old_duplicate_groups(results):
+    positions = {}
+    for position, result in enumerate(results):
+        if result["formatted_e164"] is not None:
+            positions.setdefault(result["formatted_e164"], []).append(position)
+    return {e164: group for e164, group in positions.items() if len(group) > 1}
+
+
+@pytest.mark.parametrize("stages", STAGE_SETS, ids=lambda stages: ",".join(sorted(stages)) or "none")
+def test_to_dict_matches_old_result_key_for_key(stages):
+    main.validation_cache.clear()
+    snapshot = main.TimeSnapshot(AT)
+    for number in corpus():
+        record = main.validate_record(number, "IN", "IN", snapshot, stages)
+        expected = old_validate_number(number, "IN", "IN", snapshot, stages)
+        assert list(record.to_dict().items()) == list(expected.items()), number
+        for field in expected:
+            assert record[field] == expected[field]
+
+
+def test_project_matches_project_result():
+    snapshot = main.TimeSnapshot(AT)
+    fields = ["valid", "input", "local_time", "formatted_e164", "all_timezones", "is_holiday"]
+    for number in corpus()[:50]:
+        record = main.validate_record(number, "US", "US", snapshot)
+        expected = old_validate_number(number, "US", "US", snapshot, main.ENRICHMENT_STAGES)
+        assert list(record.project(fields).items()) == list(main.project_result(expected, fields).items())
+        assert record.project(None) == expected
+
+
+def test_with_input_keeps_fields():
+    record = main.validate_record("+919876543210", snapshot=main.TimeSnapshot(AT))
+    renamed = record.with_input("+91 98765 43210")
+    assert renamed.to_dict() == {**record.to_dict(), "input": "+91 98765 43210"}
+    assert record["input"] == "+919876543210"
+
+
+@pytest.mark.parametrize("stages", [main.ENRICHMENT_STAGES, frozenset({"format"})],
+                         ids=["all", "format"])
+def test_batch_summary_matches_old_summary(stages):
+    numbers = corpus()
+    numbers += numbers[:40] + ["+91 98765 43210", "+91-9876543210"]
+    # A cached full result would also serve the fewer-stage batch
+    main.validation_cache.clear()
+    records = main.run_batch(numbers, "IN", "IN", at=AT, stages=stages)
+    snapshot = main.TimeSnapshot(AT)
+    expected_results = [old_validate_number(number, "IN", "IN", snapshot, stages) for number in numbers]
+    assert [record.to_dict() for record in records] == expected_results
+
+    expected = main.new_batch_summary()
+    for result in expected_results:
+        main.add_to_batch_summary(expected, result)
+    if "type" not in stages:
+        expected["toll_free_count"] = None
+        expected["mobile_count"] = None
+    expected["duplicates"] = old_duplicate_groups(expected_results)
+    assert main.summarize_batch(records, stages, duplicates=True) == expected
+    assert expected["duplicates"]
+
+
+def test_each_lookup_counts_one_hit_or_miss(monkeypatch):
+    monkeypatch.setattr(main, "validation_cache", main.ValidationCache(100, 0))
+    snapshot = main.TimeSnapshot(AT)
+    format_only = frozenset({"format"})
+    for stages, hits, misses in [
+        (format_only, 0, 1),                # neither cached
+        (format_only, 1, 1),                # its own entry
+        (main.ENRICHMENT_STAGES, 1, 2),
+        (frozenset({"type"}), 2, 2),        # served by the full entry
+        (main.ENRICHMENT_STAGES, 3, 2),
+    ]:
+        main.validate_record("+919876543210", "IN", "IN", snapshot, stages)
+        stats = main.validation_cache.stats()
+        assert (stats["hits"], stats["misses"]) == (hits, misses), stages